@@ -1,5 +1,5 @@
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
@@ -38,6 +38,8 @@ class StepUpMfaRequired(Exception):
 @dataclass(slots=True)
 class TenantContext:
     org_id: str
+    # Request-scoped effective permissions keyed by user id, filled by authz.check_permission.
+    permission_cache: dict[str, frozenset[str]] = field(default_factory=dict, compare=False)
 
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
@@ -81,6 +83,12 @@ def _decode_bearer_payload_cached(request: Request) -> dict | None:
     return payload
 
 
+def token_is_superuser(request: Request) -> bool:
+    """Whether the request's access token carries the superuser claim."""
+    payload = _decode_bearer_payload_cached(request)
+    return bool(payload and payload.get("su"))
+
+
 def _org_from_refresh_cookie(request: Request) -> str | None:
     refresh_token = request.cookies.get(settings.auth_refresh_cookie_name)
     if not refresh_token:
@@ -508,8 +516,7 @@ async def _require_mfa_for_request(
     *,
     action: str | None = None,
 ) -> None:
-    org_settings = await settings_service.get_org_settings(db, ctx)
-    if not settings_service.is_mfa_action_required(org_settings, action):
+    if not await settings_service.is_mfa_action_required_for_org(db, ctx, action):
         return
 
     # For action-level MFA, check for step-up token first
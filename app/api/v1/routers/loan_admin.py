@@ -1,9 +1,15 @@
 from __future__ import annotations
 
+import asyncio
+import stat
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import date, datetime, timezone
 from decimal import Decimal
+from itertools import groupby
+from operator import attrgetter
 from pathlib import Path
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from fastapi import (
     APIRouter,
@@ -17,8 +23,11 @@ from fastapi import (
     Request,
 )
 from fastapi.responses import FileResponse, RedirectResponse, StreamingResponse
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload, aliased
+from pydantic import TypeAdapter
+from pydantic_core import from_json
+from sqlalchemy import CTE, bindparam, func, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import aliased, contains_eager, selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api import deps
@@ -26,6 +35,7 @@ from app.core.permissions import PermissionCode
 from app.core.settings import settings
 from app.db.session import get_db
 from app.models.audit_log import AuditLog
+from app.models.loan_application import LoanApplication
 from app.models.loan_document import LoanDocument
 from app.models.loan_workflow_stage import LoanWorkflowStage
 from app.models.org_membership import OrgMembership
@@ -68,6 +78,7 @@ from app.schemas.loan import (
 from app.schemas.settings import MfaEnforcementAction
 from app.services import (
     authz,
+    loan_admin_cache,
     loan_applications,
     loan_exports,
     loan_payment_status,
@@ -78,37 +89,272 @@ from app.services import (
     loan_workflow,
     stock_summary,
 )
-from app.services.audit import model_snapshot, record_audit_log
+from app.services.audit import (
+    model_snapshot,
+    record_audit_log,
+    record_audit_logs,
+    serialize_for_audit,
+)
 from app.services.local_uploads import (
     ensure_org_scoped_key,
     generate_storage_key,
     loan_documents_subdir,
+    local_upload_base_dir,
     loan_repayments_subdir,
     resolve_local_path,
-    save_upload,
+    save_upload_with_checksum,
+    stream_multipart_upload,
 )
 from app.services.storage.service import get_storage_adapter
 
 
 router = APIRouter(prefix="/org/loans", tags=["loan-admin"])
 
-ALLOWED_REPAYMENT_EVIDENCE_TYPES = {
-    "application/pdf",
-    "image/jpeg",
-    "image/png",
-    "image/webp",
-    "image/gif",
+ALLOWED_REPAYMENT_EVIDENCE_TYPES = frozenset(
+    {
+        "application/pdf",
+        "image/jpeg",
+        "image/png",
+        "image/webp",
+        "image/gif",
+    }
+)
+
+SAFE_EXTENSIONS = frozenset({".pdf", ".png", ".jpg", ".jpeg", ".webp", ".gif"})
+
+# Enum values resolved once at import; Enum.value is a descriptor lookup per access.
+STAGE_STATUS_COMPLETED = LoanWorkflowStageStatus.COMPLETED.value
+STAGE_STATUS_IN_PROGRESS = LoanWorkflowStageStatus.IN_PROGRESS.value
+STAGE_TYPE_LEGAL_POST_ISSUANCE = LoanWorkflowStageType.LEGAL_POST_ISSUANCE.value
+MFA_ACTION_WORKFLOW_COMPLETE = MfaEnforcementAction.WORKFLOW_COMPLETE.value
+MFA_ACTION_LOAN_PAYMENT_RECORD = MfaEnforcementAction.LOAN_PAYMENT_RECORD.value
+
+# Error details that never vary, built once rather than per failing request.
+_ERR_MISSING_STATUS = {
+    "code": "missing_status",
+    "message": "status is required",
+    "details": {"field": "status"},
+}
+_ERR_DECISION_REASON_REQUIRED = {
+    "code": "decision_reason_required",
+    "message": "decision_reason is required when rejecting a loan",
+    "details": {"field": "decision_reason"},
+}
+_ERR_EDIT_NOTE_REQUIRED = {
+    "code": "edit_note_required",
+    "message": "note is required for loan edits",
+    "details": {"field": "note"},
+}
+_ERR_INVALID_DOCUMENT_PATH = {
+    "code": "invalid_document_path",
+    "message": "Document path is invalid",
+    "details": {},
+}
+_ERR_BACKLOG_ACTIVATION_RUNNING = {
+    "code": "backlog_activation_running",
+    "message": "Backlog activation is already running for this org",
+    "details": {},
+}
+
+UPDATABLE_STAGE_STATUSES: frozenset[LoanWorkflowStageStatus] = frozenset(
+    {
+        LoanWorkflowStageStatus.IN_PROGRESS,
+        LoanWorkflowStageStatus.COMPLETED,
+    }
+)
+
+CORE_QUEUE_STAGE_TYPES: frozenset[LoanWorkflowStageType] = frozenset(
+    {
+        LoanWorkflowStageType.HR_REVIEW,
+        LoanWorkflowStageType.FINANCE_PROCESSING,
+        LoanWorkflowStageType.LEGAL_EXECUTION,
+    }
+)
+
+_STAGE_MANAGE_PERMISSIONS: dict[LoanWorkflowStageType, PermissionCode] = {
+    LoanWorkflowStageType.HR_REVIEW: PermissionCode.LOAN_WORKFLOW_HR_MANAGE,
+    LoanWorkflowStageType.FINANCE_PROCESSING: PermissionCode.LOAN_WORKFLOW_FINANCE_MANAGE,
+    LoanWorkflowStageType.LEGAL_EXECUTION: PermissionCode.LOAN_WORKFLOW_LEGAL_MANAGE,
+}
+
+_DOCUMENT_MANAGE_PERMISSIONS: dict[LoanWorkflowStageType, PermissionCode] = {
+    LoanWorkflowStageType.HR_REVIEW: PermissionCode.LOAN_DOCUMENT_MANAGE_HR,
+    LoanWorkflowStageType.FINANCE_PROCESSING: PermissionCode.LOAN_DOCUMENT_MANAGE_FINANCE,
+    LoanWorkflowStageType.LEGAL_EXECUTION: PermissionCode.LOAN_DOCUMENT_MANAGE_LEGAL,
+    LoanWorkflowStageType.LEGAL_POST_ISSUANCE: PermissionCode.LOAN_DOCUMENT_MANAGE_LEGAL,
+}
+
+HR_DOCUMENT_TYPES: frozenset[LoanDocumentType] = frozenset(
+    {
+        LoanDocumentType.NOTICE_OF_STOCK_OPTION_GRANT,
+        LoanDocumentType.SPOUSE_PARTNER_CONSENT,
+    }
+)
+
+FINANCE_DOCUMENT_TYPES: frozenset[LoanDocumentType] = frozenset(
+    {
+        LoanDocumentType.PAYMENT_INSTRUCTIONS,
+        LoanDocumentType.PAYMENT_CONFIRMATION,
+    }
+)
+
+LEGAL_DOCUMENT_TYPES: frozenset[LoanDocumentType] = frozenset(
+    {
+        LoanDocumentType.STOCK_OPTION_EXERCISE_AND_LOAN_AGREEMENT,
+        LoanDocumentType.SECURED_PROMISSORY_NOTE,
+        LoanDocumentType.STOCK_POWER_AND_ASSIGNMENT,
+        LoanDocumentType.INVESTMENT_REPRESENTATION_STATEMENT,
+    }
+)
+
+STAGE_DOCUMENT_TYPES: dict[LoanWorkflowStageType, frozenset[LoanDocumentType]] = {
+    LoanWorkflowStageType.HR_REVIEW: HR_DOCUMENT_TYPES,
+    LoanWorkflowStageType.FINANCE_PROCESSING: FINANCE_DOCUMENT_TYPES,
+    LoanWorkflowStageType.LEGAL_EXECUTION: LEGAL_DOCUMENT_TYPES,
+}
+
+_INVALID_DOCUMENT_TYPE_MESSAGES: dict[LoanWorkflowStageType, str] = {
+    LoanWorkflowStageType.HR_REVIEW: (
+        "HR documents must be Notice of Stock Option Grant or Spouse/Partner Consent"
+    ),
+    LoanWorkflowStageType.FINANCE_PROCESSING: (
+        "Finance documents must be Payment Instructions or Payment Confirmation"
+    ),
+    LoanWorkflowStageType.LEGAL_EXECUTION: (
+        "Legal documents must be execution documents for the loan"
+    ),
 }
 
-SAFE_EXTENSIONS = {".pdf", ".png", ".jpg", ".jpeg", ".webp", ".gif"}
 
-CORE_QUEUE_STAGE_TYPES = {
-    LoanWorkflowStageType.HR_REVIEW,
-    LoanWorkflowStageType.FINANCE_PROCESSING,
-    LoanWorkflowStageType.LEGAL_EXECUTION,
+# Built once at import; per-request values are passed as bound parameters so the
+# statement object (and its compiled-cache key) is reused on every lookup.
+_STAGE_BY_LOAN_STMT = select(LoanWorkflowStage).where(
+    LoanWorkflowStage.org_id == bindparam("org_id"),
+    LoanWorkflowStage.loan_application_id == bindparam("loan_id"),
+    LoanWorkflowStage.stage_type == bindparam("stage_type"),
+)
+
+# Document types already uploaded for a stage; the loan documents index covers it.
+_STAGE_DOCUMENT_TYPES = (
+    select(func.array_agg(LoanDocument.document_type.distinct()))
+    .where(
+        LoanDocument.org_id == LoanWorkflowStage.org_id,
+        LoanDocument.loan_application_id == LoanWorkflowStage.loan_application_id,
+        LoanDocument.stage_type == LoanWorkflowStage.stage_type,
+    )
+    .correlate(LoanWorkflowStage)
+    .scalar_subquery()
+)
+
+# The stage, its parent application and its uploaded document types in one round-trip
+# for the stage PATCH handlers.
+_STAGE_WITH_APPLICATION_STMT = (
+    select(LoanWorkflowStage, _STAGE_DOCUMENT_TYPES.label("document_types"))
+    .join(LoanApplication, LoanWorkflowStage.loan_application_id == LoanApplication.id)
+    .options(contains_eager(LoanWorkflowStage.loan_application))
+    .where(
+        LoanWorkflowStage.org_id == bindparam("org_id"),
+        LoanWorkflowStage.loan_application_id == bindparam("loan_id"),
+        LoanWorkflowStage.stage_type == bindparam("stage_type"),
+        LoanApplication.org_id == bindparam("org_id"),
+    )
+)
+
+_APPLICATION_ID_STMT = select(LoanApplication.id).where(
+    LoanApplication.org_id == bindparam("org_id"),
+    LoanApplication.id == bindparam("loan_id"),
+)
+
+_DOCUMENT_INSERT_COLUMNS = tuple(
+    column for column in LoanDocument.__table__.columns if column.server_default is None
+)
+# INSERT ... SELECT ... WHERE EXISTS: the org-scoped loan check and the insert share one
+# round trip, and no row is written (or returned) when the loan is missing.
+_INSERT_DOCUMENT_FOR_LOAN_STMT = (
+    insert(LoanDocument.__table__)
+    .from_select(
+        [column.name for column in _DOCUMENT_INSERT_COLUMNS],
+        select(
+            *(bindparam(column.name, type_=column.type) for column in _DOCUMENT_INSERT_COLUMNS)
+        ).where(_APPLICATION_ID_STMT.exists()),
+    )
+    .returning(LoanDocument.uploaded_at, LoanDocument.created_at)
+)
+
+_DOCUMENTS_BY_LOAN_STMT = (
+    select(LoanDocument)
+    .options(selectinload(LoanDocument.uploaded_by_user))
+    .where(
+        LoanDocument.org_id == bindparam("org_id"),
+        LoanDocument.loan_application_id == bindparam("loan_id"),
+    )
+    .order_by(LoanDocument.stage_type, LoanDocument.uploaded_at.desc())
+)
+
+# Validate whole lists in one call into the compiled schema instead of once per row.
+_DOCUMENT_LIST_ADAPTER = TypeAdapter(list[LoanDocumentDTO])
+_REPAYMENT_LIST_ADAPTER = TypeAdapter(list[LoanRepaymentDTO])
+
+
+@dataclass(frozen=True)
+class _StageUpdatePolicy:
+    label: str
+    required_document_types: frozenset[str]
+    missing_documents_message: str
+
+
+_STAGE_UPDATE_POLICIES: dict[LoanWorkflowStageType, _StageUpdatePolicy] = {
+    LoanWorkflowStageType.HR_REVIEW: _StageUpdatePolicy(
+        label="HR",
+        required_document_types=frozenset(doc_type.value for doc_type in HR_DOCUMENT_TYPES),
+        missing_documents_message=(
+            "All required HR documents must be uploaded before completing HR review"
+        ),
+    ),
+    LoanWorkflowStageType.FINANCE_PROCESSING: _StageUpdatePolicy(
+        label="Finance",
+        required_document_types=frozenset({LoanDocumentType.PAYMENT_INSTRUCTIONS.value}),
+        missing_documents_message=(
+            "Payment instructions document is required before completing Finance processing"
+        ),
+    ),
+    LoanWorkflowStageType.LEGAL_EXECUTION: _StageUpdatePolicy(
+        label="Legal",
+        required_document_types=frozenset(doc_type.value for doc_type in LEGAL_DOCUMENT_TYPES),
+        missing_documents_message=(
+            "All required legal documents must be uploaded before completing Legal execution"
+        ),
+    ),
 }
 
 
+def _document_created_audit_entry(document: LoanDocument, actor_id: UUID) -> dict:
+    return {
+        "actor_id": actor_id,
+        "action": "loan_document.created",
+        "resource_type": "loan_document",
+        "resource_id": str(document.id),
+        "old_value": None,
+        "new_value": model_snapshot(document),
+    }
+
+
+def _previous_row_columns(previous: CTE) -> list:
+    """RETURNING expressions reading each column of a single-row pre-image CTE."""
+    return [
+        select(column).scalar_subquery().label(f"previous_{column.name}")
+        for column in previous.c
+    ]
+
+
+def _previous_row_snapshot(previous: CTE, values) -> dict | None:
+    """Audit snapshot of a pre-image row, serialized exactly as model_snapshot does."""
+    row = dict(zip((column.name for column in previous.c), values))
+    if row.get("id") is None:
+        return None
+    return serialize_for_audit(row)
+
+
 async def _save_local_document(
     db: AsyncSession,
     ctx: deps.TenantContext,
@@ -118,9 +364,9 @@ async def _save_local_document(
     file: UploadFile,
     actor_id: UUID,
 ) -> LoanDocument:
-    base_dir = Path(settings.local_upload_dir)
+    base_dir = local_upload_base_dir()
     try:
-        relative_path, original_name = await save_upload(
+        saved = await save_upload_with_checksum(
             file,
             base_dir=base_dir,
             subdir=loan_documents_subdir(ctx.org_id, loan_id),
@@ -131,33 +377,25 @@ async def _save_local_document(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
 
     document = LoanDocument(
+        id=uuid4(),
         org_id=ctx.org_id,
         loan_application_id=loan_id,
         stage_type=stage_type,
         document_type=document_type.value,
-        file_name=original_name,
-        storage_path_or_url=relative_path,
+        file_name=saved.original_name,
+        storage_path_or_url=saved.relative_path,
         storage_provider="local",
         storage_bucket=None,
-        storage_object_key=relative_path,
+        storage_object_key=saved.relative_path,
         content_type=file.content_type,
-        size_bytes=getattr(file, "size", None),
-        checksum=None,
+        size_bytes=saved.size_bytes,
+        checksum=saved.checksum,
         uploaded_by_user_id=actor_id,
     )
     db.add(document)
-    record_audit_log(
-        db,
-        ctx,
-        actor_id=actor_id,
-        action="loan_document.created",
-        resource_type="loan_document",
-        resource_id=str(document.id),
-        old_value=None,
-        new_value=model_snapshot(document),
-    )
+    record_audit_log(db, ctx, **_document_created_audit_entry(document, actor_id))
     await db.commit()
-    await db.refresh(document)
+    await loan_admin_cache.invalidate_loan_admin_cache(ctx.org_id)
     return document
 
 
@@ -176,8 +414,7 @@ def _normalize_storage_key(payload: LoanDocumentCreateRequest) -> str:
     )
 
 
-async def _create_document_from_storage(
-    db: AsyncSession,
+def _build_document_from_storage(
     ctx: deps.TenantContext,
     loan_id: UUID,
     document_type: LoanDocumentType,
@@ -217,7 +454,8 @@ async def _create_document_from_storage(
                 "details": {},
             },
         )
-    document = LoanDocument(
+    return LoanDocument(
+        id=uuid4(),
         org_id=ctx.org_id,
         loan_application_id=loan_id,
         stage_type=stage_type,
@@ -232,50 +470,45 @@ async def _create_document_from_storage(
         checksum=payload.checksum,
         uploaded_by_user_id=actor_id,
     )
-    db.add(document)
-    record_audit_log(
-        db,
-        ctx,
-        actor_id=actor_id,
-        action="loan_document.created",
-        resource_type="loan_document",
-        resource_id=str(document.id),
-        old_value=None,
-        new_value=model_snapshot(document),
+
+
+async def _create_document_from_storage(
+    db: AsyncSession,
+    ctx: deps.TenantContext,
+    loan_id: UUID,
+    document_type: LoanDocumentType,
+    stage_type: str,
+    payload: LoanDocumentCreateRequest,
+    actor_id: UUID,
+) -> LoanDocument:
+    document = _build_document_from_storage(
+        ctx, loan_id, document_type, stage_type, payload, actor_id
     )
+    params = {column.name: getattr(document, column.key) for column in _DOCUMENT_INSERT_COLUMNS}
+    result = await db.execute(_INSERT_DOCUMENT_FOR_LOAN_STMT, {**params, "loan_id": loan_id})
+    inserted = result.first()
+    if inserted is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Loan application not found"
+        )
+    document.uploaded_at, document.created_at = inserted
+    record_audit_log(db, ctx, **_document_created_audit_entry(document, actor_id))
     await db.commit()
-    await db.refresh(document)
+    await loan_admin_cache.invalidate_loan_admin_cache(ctx.org_id)
     return document
 
 
 def _stage_manage_permission(stage_type: LoanWorkflowStageType) -> PermissionCode:
-    if stage_type == LoanWorkflowStageType.HR_REVIEW:
-        return PermissionCode.LOAN_WORKFLOW_HR_MANAGE
-    if stage_type == LoanWorkflowStageType.FINANCE_PROCESSING:
-        return PermissionCode.LOAN_WORKFLOW_FINANCE_MANAGE
-    if stage_type == LoanWorkflowStageType.LEGAL_EXECUTION:
-        return PermissionCode.LOAN_WORKFLOW_LEGAL_MANAGE
-    raise ValueError(f"Unsupported stage type: {stage_type}")
+    try:
+        return _STAGE_MANAGE_PERMISSIONS[stage_type]
+    except KeyError:
+        raise ValueError(f"Unsupported stage type: {stage_type}") from None
 
 
 def _stage_for_document_type(doc_type: LoanDocumentType) -> LoanWorkflowStageType:
-    if doc_type in {
-        LoanDocumentType.NOTICE_OF_STOCK_OPTION_GRANT,
-        LoanDocumentType.SPOUSE_PARTNER_CONSENT,
-    }:
-        return LoanWorkflowStageType.HR_REVIEW
-    if doc_type in {
-        LoanDocumentType.PAYMENT_INSTRUCTIONS,
-        LoanDocumentType.PAYMENT_CONFIRMATION,
-    }:
-        return LoanWorkflowStageType.FINANCE_PROCESSING
-    if doc_type in {
-        LoanDocumentType.STOCK_OPTION_EXERCISE_AND_LOAN_AGREEMENT,
-        LoanDocumentType.SECURED_PROMISSORY_NOTE,
-        LoanDocumentType.STOCK_POWER_AND_ASSIGNMENT,
-        LoanDocumentType.INVESTMENT_REPRESENTATION_STATEMENT,
-    }:
-        return LoanWorkflowStageType.LEGAL_EXECUTION
+    for stage_type, document_types in STAGE_DOCUMENT_TYPES.items():
+        if doc_type in document_types:
+            return stage_type
     if doc_type == LoanDocumentType.SHARE_CERTIFICATE:
         return LoanWorkflowStageType.LEGAL_POST_ISSUANCE
     if doc_type == LoanDocumentType.SECTION_83B_ELECTION:
@@ -283,28 +516,36 @@ def _stage_for_document_type(doc_type: LoanDocumentType) -> LoanWorkflowStageTyp
     raise ValueError(f"Unsupported document type: {doc_type}")
 
 
+def _validate_stage_document_type(
+    stage_type: LoanWorkflowStageType, document_type: LoanDocumentType
+) -> None:
+    if document_type not in STAGE_DOCUMENT_TYPES[stage_type]:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "code": "invalid_document_type",
+                "message": _INVALID_DOCUMENT_TYPE_MESSAGES[stage_type],
+                "details": {"document_type": document_type},
+            },
+        )
+
+
 def _document_manage_permission(stage_type: LoanWorkflowStageType) -> PermissionCode:
-    if stage_type == LoanWorkflowStageType.HR_REVIEW:
-        return PermissionCode.LOAN_DOCUMENT_MANAGE_HR
-    if stage_type == LoanWorkflowStageType.FINANCE_PROCESSING:
-        return PermissionCode.LOAN_DOCUMENT_MANAGE_FINANCE
-    if stage_type in {
-        LoanWorkflowStageType.LEGAL_EXECUTION,
-        LoanWorkflowStageType.LEGAL_POST_ISSUANCE,
-    }:
-        return PermissionCode.LOAN_DOCUMENT_MANAGE_LEGAL
-    raise ValueError(f"Unsupported stage type: {stage_type}")
+    try:
+        return _DOCUMENT_MANAGE_PERMISSIONS[stage_type]
+    except KeyError:
+        raise ValueError(f"Unsupported stage type: {stage_type}") from None
 
 
 def _build_applicant_summary(
     membership, user, department, profile: OrgUserProfile | None
 ) -> LoanApplicantSummaryDTO:
-    full_name = profile.full_name if profile and profile.full_name else user.email
-    return LoanApplicantSummaryDTO(
+    email = user.email
+    return LoanApplicantSummaryDTO.model_construct(
         org_membership_id=membership.id,
         user_id=user.id,
-        full_name=full_name,
-        email=user.email,
+        full_name=profile.full_name if profile and profile.full_name else email,
+        email=email,
         employee_id=membership.employee_id,
         department_id=membership.department_id,
         department_name=department.name if department else None,
@@ -324,23 +565,24 @@ def _build_admin_summary(row) -> LoanApplicationSummaryDTO:
         applicant_profile,
         assigned_profile,
     ) = row
-    applicant = _build_applicant_summary(membership, user, department, applicant_profile)
     assignee = None
     if assigned_user is not None:
-        assignee_name = (
-            assigned_profile.full_name
-            if assigned_profile and assigned_profile.full_name
-            else assigned_user.email
-        )
-        assignee = LoanStageAssigneeSummaryDTO(
+        assignee_email = assigned_user.email
+        assignee = LoanStageAssigneeSummaryDTO.model_construct(
             user_id=assigned_user.id,
-            full_name=assignee_name,
-            email=assigned_user.email,
-        )
-    return LoanApplicationSummaryDTO(
+            full_name=(
+                assigned_profile.full_name
+                if assigned_profile and assigned_profile.full_name
+                else assignee_email
+            ),
+            email=assignee_email,
+        )
+    # Built once per row on list pages of up to 200 loans. The values come straight
+    # from loaded ORM rows, so the summaries are constructed without re-validation.
+    return LoanApplicationSummaryDTO.model_construct(
         id=application.id,
         org_membership_id=membership.id,
-        applicant=applicant,
+        applicant=_build_applicant_summary(membership, user, department, applicant_profile),
         status=application.status,
         version=application.version,
         as_of_date=application.as_of_date,
@@ -363,6 +605,47 @@ def _build_admin_summary(row) -> LoanApplicationSummaryDTO:
     )
 
 
+_BASE_DTO_CACHE_SIZE = 1024
+# Serialized JSON rather than model instances: nothing cached is shared between requests.
+_base_dto_cache: OrderedDict[tuple, str] = OrderedDict()
+
+
+def _base_dto_cache_key(application) -> tuple:
+    # version is the mapper's version_id_col, bumped by every UPDATE of the loan row;
+    # stages and documents change independently, so their state is part of the key.
+    return (
+        application.id,
+        application.version,
+        tuple(
+            (stage.id, stage.updated_at, stage.status, stage.assigned_to_user_id)
+            for stage in application.workflow_stages or ()
+        ),
+        tuple(
+            (document.id, document.uploaded_by_name)
+            for document in application.documents or ()
+        ),
+    )
+
+
+def _loan_application_dto(application, overrides: dict) -> LoanApplicationDTO:
+    """Build the detail DTO from a memoized base plus freshly computed fields.
+
+    The serialized base is reused while the loan row, its stages and its documents
+    are unchanged; each call validates a fresh DTO from it with ``overrides`` applied
+    on top. Keys in ``overrides`` that are not DTO fields are ignored.
+    """
+    key = _base_dto_cache_key(application)
+    base = _base_dto_cache.get(key)
+    if base is None:
+        base = LoanApplicationDTO.model_validate(application).model_dump_json()
+        _base_dto_cache[key] = base
+        if len(_base_dto_cache) > _BASE_DTO_CACHE_SIZE:
+            _base_dto_cache.popitem(last=False)
+    else:
+        _base_dto_cache.move_to_end(key)
+    return LoanApplicationDTO.model_validate({**from_json(base), **overrides})
+
+
 def _current_stage_from_workflow(stages: list[LoanWorkflowStage] | None):
     if not stages:
         return None, None, None, None
@@ -371,7 +654,7 @@ def _current_stage_from_workflow(stages: list[LoanWorkflowStage] | None):
         key=lambda stage: stage.created_at or datetime.min.replace(tzinfo=timezone.utc),
     )
     for stage in ordered:
-        if str(stage.status) != LoanWorkflowStageStatus.COMPLETED.value:
+        if str(stage.status) != STAGE_STATUS_COMPLETED:
             assignee = None
             if getattr(stage, "assigned_to_user", None) is not None:
                 assigned_user = stage.assigned_to_user
@@ -390,16 +673,18 @@ def _current_stage_from_workflow(stages: list[LoanWorkflowStage] | None):
     return None, None, None, None
 
 
-async def _fetch_applicant_summary(
-    db: AsyncSession, ctx: deps.TenantContext, application
-) -> LoanApplicantSummaryDTO | None:
-    membership_bundle = await loan_applications.get_membership_with_user(
-        db, ctx, application.org_membership_id
-    )
+async def _get_application_with_applicant_or_404(
+    db: AsyncSession, ctx: deps.TenantContext, loan_id: UUID
+) -> tuple[LoanApplication, LoanApplicantSummaryDTO | None]:
+    loaded = await loan_applications.get_application_with_applicant(db, ctx, loan_id)
+    if not loaded:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Loan application not found"
+        )
+    application, membership_bundle = loaded
     if not membership_bundle:
-        return None
-    membership, user, department, profile = membership_bundle
-    return _build_applicant_summary(membership, user, department, profile)
+        return application, None
+    return application, _build_applicant_summary(*membership_bundle)
 
 
 async def _fetch_last_edit_note(
@@ -516,6 +801,21 @@ async def list_loans(
             },
         )
 
+    cached, cache_key = await loan_admin_cache.get_cached_response(
+        ctx.org_id,
+        "list",
+        {
+            "status": statuses,
+            "stage_type": stage_type,
+            "created_from": created_from,
+            "created_to": created_to,
+            "limit": limit,
+            "offset": offset,
+        },
+        LoanApplicationListResponse,
+    )
+    if cached is not None:
+        return cached
     applications, total = await loan_applications.list_admin_applications(
         db,
         ctx,
@@ -526,10 +826,12 @@ async def list_loans(
         created_from=created_from,
         created_to=created_to,
     )
-    return LoanApplicationListResponse(
+    response = LoanApplicationListResponse(
         items=[_build_admin_summary(row) for row in applications],
         total=total,
     )
+    await loan_admin_cache.set_cached_response(cache_key, response)
+    return response
 
 
 @router.post(
@@ -545,6 +847,11 @@ async def activate_loan_backlog(
     ctx: deps.TenantContext = Depends(deps.get_tenant_context),
     db: AsyncSession = Depends(get_db),
 ) -> LoanActivationMaintenanceResponse:
+    if not await loan_workflow.try_lock_backlog_run(db, ctx):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=_ERR_BACKLOG_ACTIVATION_RUNNING,
+        )
     (
         checked,
         activated,
@@ -563,13 +870,14 @@ async def activate_loan_backlog(
             status_code=status.HTTP_404_NOT_FOUND, detail="Loan application not found"
         )
     await db.commit()
+    await loan_admin_cache.invalidate_loan_admin_cache(ctx.org_id)
     return LoanActivationMaintenanceResponse(
         checked=checked,
         activated=activated,
         skipped=checked - activated,
-        activated_ids=[UUID(value) for value in activated_ids],
+        activated_ids=activated_ids,
         post_issuance_completed=len(post_issuance_completed_ids),
-        post_issuance_completed_ids=[UUID(value) for value in post_issuance_completed_ids],
+        post_issuance_completed_ids=post_issuance_completed_ids,
     )
 
 
@@ -584,14 +892,11 @@ async def get_loan(
     ctx: deps.TenantContext = Depends(deps.get_tenant_context),
     db: AsyncSession = Depends(get_db),
 ) -> LoanApplicationDTO:
-    application = await loan_applications.get_application_with_related(db, ctx, loan_id)
-    if not application:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Loan application not found"
-        )
+    application, applicant = await _get_application_with_applicant_or_404(db, ctx, loan_id)
     activated = await loan_workflow.try_activate_loan(db, ctx, application)
     if activated:
         await db.commit()
+        await loan_admin_cache.invalidate_loan_admin_cache(ctx.org_id)
         refreshed = await loan_applications.get_application_with_related(db, ctx, loan_id)
         if not refreshed:
             raise HTTPException(
@@ -607,11 +912,11 @@ async def get_loan(
         current_stage_assignee,
         current_stage_assigned_at,
     ) = _current_stage_from_workflow(application.workflow_stages or [])
-    applicant = await _fetch_applicant_summary(db, ctx, application)
     last_edit_note, last_edited_at, last_edited_by = await _fetch_last_edit_note(db, ctx, loan_id)
     payment_fields = await _payment_status_fields(db, ctx, application)
-    return LoanApplicationDTO.model_validate(application).model_copy(
-        update={
+    return _loan_application_dto(
+        application,
+        {
             "has_share_certificate": has_share_certificate,
             "has_83b_election": has_83b_election,
             "days_until_83b_due": days_until,
@@ -624,7 +929,7 @@ async def get_loan(
             "last_edited_at": last_edited_at,
             "last_edited_by": last_edited_by,
             **payment_fields,
-        }
+        },
     )
 
 
@@ -639,31 +944,31 @@ async def list_loan_documents(
     ctx: deps.TenantContext = Depends(deps.get_tenant_context),
     db: AsyncSession = Depends(get_db),
 ) -> LoanDocumentListResponse:
-    await _get_application_or_404(db, ctx, loan_id)
-    stmt = (
-        select(LoanDocument)
-        .options(selectinload(LoanDocument.uploaded_by_user))
-        .where(
-            LoanDocument.org_id == ctx.org_id,
-            LoanDocument.loan_application_id == loan_id,
-        )
-        .order_by(LoanDocument.uploaded_at.desc())
+    cached, cache_key = await loan_admin_cache.get_cached_response(
+        ctx.org_id, "documents", {"loan_id": loan_id}, LoanDocumentListResponse
     )
-    documents = (await db.execute(stmt)).scalars().all()
-
-    grouped: dict[str, list[LoanDocumentDTO]] = {}
-    for document in documents:
-        grouped.setdefault(document.stage_type, []).append(LoanDocumentDTO.model_validate(document))
+    if cached is not None:
+        return cached
+    await _require_application_or_404(db, ctx, loan_id)
+    documents = (
+        await db.execute(_DOCUMENTS_BY_LOAN_STMT, {"org_id": ctx.org_id, "loan_id": loan_id})
+    ).scalars().all()
 
+    # Rows arrive grouped by stage, so each group is one contiguous run.
     groups = [
-        LoanDocumentGroup(stage_type=stage_type, documents=items)
-        for stage_type, items in sorted(grouped.items())
+        LoanDocumentGroup(
+            stage_type=stage_type,
+            documents=_DOCUMENT_LIST_ADAPTER.validate_python(list(items)),
+        )
+        for stage_type, items in groupby(documents, key=attrgetter("stage_type"))
     ]
-    return LoanDocumentListResponse(
+    response = LoanDocumentListResponse(
         loan_id=loan_id,
         total=len(documents),
         groups=groups,
     )
+    await loan_admin_cache.set_cached_response(cache_key, response)
+    return response
 
 
 @router.post(
@@ -764,13 +1069,20 @@ async def list_loan_repayments(
     ctx: deps.TenantContext = Depends(deps.get_tenant_context),
     db: AsyncSession = Depends(get_db),
 ) -> LoanRepaymentListResponse:
+    cached, cache_key = await loan_admin_cache.get_cached_response(
+        ctx.org_id, "repayments", {"loan_id": loan_id}, LoanRepaymentListResponse
+    )
+    if cached is not None:
+        return cached
     await _get_application_or_404(db, ctx, loan_id)
     repayments = await loan_repayments.list_repayments(db, ctx, loan_id)
-    return LoanRepaymentListResponse(
+    response = LoanRepaymentListResponse(
         loan_id=loan_id,
         total=len(repayments),
-        items=[LoanRepaymentDTO.model_validate(item) for item in repayments],
+        items=_REPAYMENT_LIST_ADAPTER.validate_python(repayments),
     )
+    await loan_admin_cache.set_cached_response(cache_key, response)
+    return response
 
 
 @router.post(
@@ -798,7 +1110,7 @@ async def record_loan_repayment_with_evidence(
     current_user=Depends(
         deps.require_permission_with_mfa(
             PermissionCode.LOAN_PAYMENT_RECORD,
-            action=MfaEnforcementAction.LOAN_PAYMENT_RECORD.value,
+            action=MFA_ACTION_LOAN_PAYMENT_RECORD,
         )
     ),
     ctx: deps.TenantContext = Depends(deps.get_tenant_context),
@@ -920,23 +1232,23 @@ async def record_loan_repayment_with_evidence(
                 },
             )
         try:
-            relative_path, original_name = await save_upload(
+            saved = await save_upload_with_checksum(
                 evidence_file,
-                base_dir=Path(settings.local_upload_dir),
+                base_dir=local_upload_base_dir(),
                 subdir=loan_repayments_subdir(ctx.org_id, loan_id),
                 allowed_extensions=SAFE_EXTENSIONS,
                 max_size_bytes=settings.max_upload_size_mb * 1024 * 1024,
             )
         except ValueError as exc:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
-        evidence_name = original_name
-        evidence_storage_path = relative_path
+        evidence_name = saved.original_name
+        evidence_storage_path = saved.relative_path
         evidence_provider = "local"
         evidence_bucket = None
-        evidence_object_key = relative_path
+        evidence_object_key = saved.relative_path
         evidence_content_type_value = evidence_file.content_type
-        evidence_size_value = getattr(evidence_file, "size", None)
-        evidence_checksum_value = None
+        evidence_size_value = saved.size_bytes
+        evidence_checksum_value = saved.checksum
     elif evidence_storage_key:
         if evidence_storage_key.startswith("http"):
             raise HTTPException(
@@ -1016,7 +1328,7 @@ async def record_loan_repayment_with_evidence(
             detail={"code": "invalid_repayment", "message": str(exc), "details": {}},
         ) from exc
     await db.commit()
-    await db.refresh(repayment)
+    await loan_admin_cache.invalidate_loan_admin_cache(ctx.org_id)
 
     updated_repayments = existing_repayments + [repayment]
     updated_status = loan_payment_status.compute_payment_status(
@@ -1047,7 +1359,7 @@ async def create_repayment_evidence_upload_url(
     current_user=Depends(
         deps.require_permission_with_mfa(
             PermissionCode.LOAN_PAYMENT_RECORD,
-            action=MfaEnforcementAction.LOAN_PAYMENT_RECORD.value,
+            action=MFA_ACTION_LOAN_PAYMENT_RECORD,
         )
     ),
     ctx: deps.TenantContext = Depends(deps.get_tenant_context),
@@ -1105,12 +1417,8 @@ async def download_loan_document(
     ctx: deps.TenantContext = Depends(deps.get_tenant_context),
     db: AsyncSession = Depends(get_db),
 ) -> FileResponse:
-    stmt = select(LoanDocument).where(
-        LoanDocument.org_id == ctx.org_id,
-        LoanDocument.id == document_id,
-    )
-    document = (await db.execute(stmt)).scalar_one_or_none()
-    if not document:
+    document = await db.get(LoanDocument, document_id)
+    if not document or document.org_id != ctx.org_id:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Loan document not found")
     if document.storage_provider == "gcs":
         adapter = get_storage_adapter(bucket_override=document.storage_bucket)
@@ -1130,18 +1438,20 @@ async def download_loan_document(
         )
     try:
         file_path = resolve_local_path(
-            Path(settings.local_upload_dir), document.storage_path_or_url
+            local_upload_base_dir(), document.storage_path_or_url
         )
     except ValueError as exc:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail={
-                "code": "invalid_document_path",
-                "message": "Document path is invalid",
-                "details": {},
-            },
+            detail=_ERR_INVALID_DOCUMENT_PATH,
         ) from exc
-    if not file_path.exists():
+    # Stat once here and hand the result to FileResponse so it does not stat again.
+    try:
+        stat_result = file_path.stat()
+    except OSError:
+        # Same outcomes Path.exists() treated as missing: ENOENT, ENOTDIR, ELOOP, ...
+        stat_result = None
+    if stat_result is None or not stat.S_ISREG(stat_result.st_mode):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail={
@@ -1151,33 +1461,38 @@ async def download_loan_document(
             },
         )
     return FileResponse(
-        file_path, filename=document.file_name, media_type="application/octet-stream"
+        file_path,
+        filename=document.file_name,
+        media_type="application/octet-stream",
+        stat_result=stat_result,
     )
 
 
-@router.get(
-    "/{loan_id}/schedule",
-    response_model=LoanScheduleResponse,
-    summary="Get loan amortization schedule",
-)
-async def get_loan_schedule(
+async def _remaining_schedule(
+    db: AsyncSession,
+    ctx: deps.TenantContext,
     loan_id: UUID,
-    as_of: date | None = Query(default=None, description="As-of date for remaining schedule"),
-    include_paid: bool = Query(default=False, description="Include fully paid schedule entries"),
-    _: object = Depends(deps.require_permission(PermissionCode.LOAN_SCHEDULE_VIEW)),
-    ctx: deps.TenantContext = Depends(deps.get_tenant_context),
-    db: AsyncSession = Depends(get_db),
+    *,
+    as_of_date: date,
+    include_paid: bool,
 ) -> LoanScheduleResponse:
+    cached, cache_key = await loan_admin_cache.get_cached_response(
+        ctx.org_id,
+        "schedule",
+        {"loan_id": loan_id, "as_of": as_of_date, "include_paid": include_paid},
+        LoanScheduleResponse,
+    )
+    if cached is not None:
+        return cached
     application = await _get_application_or_404(db, ctx, loan_id)
     try:
-        as_of_date = as_of or date.today()
         repayments = await loan_repayments.list_repayments_up_to(
             db,
             ctx,
             loan_id,
             as_of_date=as_of_date,
         )
-        return loan_schedules.build_schedule_remaining(
+        schedule = loan_schedules.build_schedule_remaining(
             application,
             repayments,
             as_of_date=as_of_date,
@@ -1188,6 +1503,26 @@ async def get_loan_schedule(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail={"code": "invalid_schedule", "message": str(exc), "details": {}},
         ) from exc
+    await loan_admin_cache.set_cached_response(cache_key, schedule)
+    return schedule
+
+
+@router.get(
+    "/{loan_id}/schedule",
+    response_model=LoanScheduleResponse,
+    summary="Get loan amortization schedule",
+)
+async def get_loan_schedule(
+    loan_id: UUID,
+    as_of: date | None = Query(default=None, description="As-of date for remaining schedule"),
+    include_paid: bool = Query(default=False, description="Include fully paid schedule entries"),
+    _: object = Depends(deps.require_permission(PermissionCode.LOAN_SCHEDULE_VIEW)),
+    ctx: deps.TenantContext = Depends(deps.get_tenant_context),
+    db: AsyncSession = Depends(get_db),
+) -> LoanScheduleResponse:
+    return await _remaining_schedule(
+        db, ctx, loan_id, as_of_date=as_of or date.today(), include_paid=include_paid
+    )
 
 
 @router.post(
@@ -1234,30 +1569,15 @@ async def export_loan_schedule(
     ctx: deps.TenantContext = Depends(deps.get_tenant_context),
     db: AsyncSession = Depends(get_db),
 ) -> StreamingResponse:
-    application = await _get_application_or_404(db, ctx, loan_id)
-    try:
-        as_of_date = as_of or date.today()
-        repayments = await loan_repayments.list_repayments_up_to(
-            db,
-            ctx,
-            loan_id,
-            as_of_date=as_of_date,
-        )
-        schedule = loan_schedules.build_schedule_remaining(
-            application,
-            repayments,
-            as_of_date=as_of_date,
-            include_paid=include_paid,
-        )
-    except ValueError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail={"code": "invalid_schedule", "message": str(exc), "details": {}},
-        ) from exc
-    content = loan_exports.schedule_to_csv(schedule)
+    schedule = await _remaining_schedule(
+        db, ctx, loan_id, as_of_date=as_of or date.today(), include_paid=include_paid
+    )
+    # The CSV is streamed after the handler returns; hand the connection back to the
+    # pool now rather than holding it until the response has been sent.
+    await db.close()
     filename = f"loan_schedule_{loan_id}.csv"
     return StreamingResponse(
-        iter([content]),
+        loan_exports.schedule_to_csv_iter(schedule),
         media_type="text/csv",
         headers={"Content-Disposition": f'attachment; filename="{filename}"'},
     )
@@ -1278,11 +1598,7 @@ async def update_loan(
     if payload.status is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail={
-                "code": "missing_status",
-                "message": "status is required",
-                "details": {"field": "status"},
-            },
+            detail=_ERR_MISSING_STATUS,
         )
     if (
         payload.status == LoanApplicationStatus.REJECTED
@@ -1290,11 +1606,7 @@ async def update_loan(
     ):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail={
-                "code": "decision_reason_required",
-                "message": "decision_reason is required when rejecting a loan",
-                "details": {"field": "decision_reason"},
-            },
+            detail=_ERR_DECISION_REASON_REQUIRED,
         )
 
     application = await loan_applications.get_application_with_related(db, ctx, loan_id)
@@ -1318,25 +1630,21 @@ async def update_loan(
             detail={"code": "invalid_status_transition", "message": str(exc), "details": {}},
         ) from exc
 
-    refreshed = await loan_applications.get_application_with_related(db, ctx, updated.id)
-    if refreshed is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Loan application not found"
-        )
+    refreshed, applicant = await _get_application_with_applicant_or_404(db, ctx, updated.id)
 
     has_share_certificate, has_83b_election, days_until = loan_applications._compute_workflow_flags(
         refreshed
     )
-    applicant = await _fetch_applicant_summary(db, ctx, refreshed)
     payment_fields = await _payment_status_fields(db, ctx, refreshed)
-    return LoanApplicationDTO.model_validate(refreshed).model_copy(
-        update={
+    return _loan_application_dto(
+        refreshed,
+        {
             "has_share_certificate": has_share_certificate,
             "has_83b_election": has_83b_election,
             "days_until_83b_due": days_until,
             "applicant": applicant,
             **payment_fields,
-        }
+        },
     )
 
 
@@ -1355,11 +1663,7 @@ async def edit_loan_application(
     if not payload.note or not payload.note.strip():
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail={
-                "code": "edit_note_required",
-                "message": "note is required for loan edits",
-                "details": {"field": "note"},
-            },
+            detail=_ERR_EDIT_NOTE_REQUIRED,
         )
 
     application = await loan_applications.get_application_with_related(db, ctx, loan_id)
@@ -1387,11 +1691,7 @@ async def edit_loan_application(
             detail={"code": "invalid_edit", "message": str(exc), "details": {}},
         ) from exc
 
-    refreshed = await loan_applications.get_application_with_related(db, ctx, updated.id)
-    if refreshed is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Loan application not found"
-        )
+    refreshed, applicant = await _get_application_with_applicant_or_404(db, ctx, updated.id)
     has_share_certificate, has_83b_election, days_until = loan_applications._compute_workflow_flags(
         refreshed
     )
@@ -1401,13 +1701,13 @@ async def edit_loan_application(
         current_stage_assignee,
         current_stage_assigned_at,
     ) = _current_stage_from_workflow(refreshed.workflow_stages or [])
-    applicant = await _fetch_applicant_summary(db, ctx, refreshed)
     last_edit_note, last_edited_at, last_edited_by = await _fetch_last_edit_note(
         db, ctx, refreshed.id
     )
     payment_fields = await _payment_status_fields(db, ctx, refreshed)
-    return LoanApplicationDTO.model_validate(refreshed).model_copy(
-        update={
+    return _loan_application_dto(
+        refreshed,
+        {
             "has_share_certificate": has_share_certificate,
             "has_83b_election": has_83b_election,
             "days_until_83b_due": days_until,
@@ -1420,8 +1720,46 @@ async def edit_loan_application(
             "last_edited_at": last_edited_at,
             "last_edited_by": last_edited_by,
             **payment_fields,
-        }
+        },
+    )
+
+
+async def _queue_response(
+    db: AsyncSession,
+    ctx: deps.TenantContext,
+    stage_type: str,
+    *,
+    limit: int,
+    offset: int,
+    assigned_to_user_id: UUID | None = None,
+) -> LoanApplicationListResponse:
+    cached, cache_key = await loan_admin_cache.get_cached_response(
+        ctx.org_id,
+        "queue",
+        {
+            "stage_type": stage_type,
+            "assigned_to_user_id": assigned_to_user_id,
+            "limit": limit,
+            "offset": offset,
+        },
+        LoanApplicationListResponse,
+    )
+    if cached is not None:
+        return cached
+    applications, total = await loan_queue.list_queue(
+        db,
+        ctx,
+        stage_type=stage_type,
+        limit=limit,
+        offset=offset,
+        assigned_to_user_id=assigned_to_user_id,
+    )
+    response = LoanApplicationListResponse(
+        items=[_build_admin_summary(row) for row in applications],
+        total=total,
     )
+    await loan_admin_cache.set_cached_response(cache_key, response)
+    return response
 
 
 @router.get(
@@ -1436,13 +1774,7 @@ async def list_hr_queue(
     limit: int = Query(default=50, ge=1, le=200),
     offset: int = Query(default=0, ge=0),
 ) -> LoanApplicationListResponse:
-    applications, total = await loan_queue.list_queue(
-        db, ctx, stage_type="HR_REVIEW", limit=limit, offset=offset
-    )
-    return LoanApplicationListResponse(
-        items=[_build_admin_summary(row) for row in applications],
-        total=total,
-    )
+    return await _queue_response(db, ctx, "HR_REVIEW", limit=limit, offset=offset)
 
 
 @router.get(
@@ -1457,13 +1789,7 @@ async def list_finance_queue(
     limit: int = Query(default=50, ge=1, le=200),
     offset: int = Query(default=0, ge=0),
 ) -> LoanApplicationListResponse:
-    applications, total = await loan_queue.list_queue(
-        db, ctx, stage_type="FINANCE_PROCESSING", limit=limit, offset=offset
-    )
-    return LoanApplicationListResponse(
-        items=[_build_admin_summary(row) for row in applications],
-        total=total,
-    )
+    return await _queue_response(db, ctx, "FINANCE_PROCESSING", limit=limit, offset=offset)
 
 
 @router.get(
@@ -1478,13 +1804,7 @@ async def list_legal_queue(
     limit: int = Query(default=50, ge=1, le=200),
     offset: int = Query(default=0, ge=0),
 ) -> LoanApplicationListResponse:
-    applications, total = await loan_queue.list_queue(
-        db, ctx, stage_type="LEGAL_EXECUTION", limit=limit, offset=offset
-    )
-    return LoanApplicationListResponse(
-        items=[_build_admin_summary(row) for row in applications],
-        total=total,
-    )
+    return await _queue_response(db, ctx, "LEGAL_EXECUTION", limit=limit, offset=offset)
 
 
 @router.get(
@@ -1499,18 +1819,14 @@ async def list_my_hr_queue(
     limit: int = Query(default=50, ge=1, le=200),
     offset: int = Query(default=0, ge=0),
 ) -> LoanApplicationListResponse:
-    applications, total = await loan_queue.list_queue(
+    return await _queue_response(
         db,
         ctx,
-        stage_type="HR_REVIEW",
+        "HR_REVIEW",
         limit=limit,
         offset=offset,
         assigned_to_user_id=current_user.id,
     )
-    return LoanApplicationListResponse(
-        items=[_build_admin_summary(row) for row in applications],
-        total=total,
-    )
 
 
 @router.get(
@@ -1525,18 +1841,14 @@ async def list_my_finance_queue(
     limit: int = Query(default=50, ge=1, le=200),
     offset: int = Query(default=0, ge=0),
 ) -> LoanApplicationListResponse:
-    applications, total = await loan_queue.list_queue(
+    return await _queue_response(
         db,
         ctx,
-        stage_type="FINANCE_PROCESSING",
+        "FINANCE_PROCESSING",
         limit=limit,
         offset=offset,
         assigned_to_user_id=current_user.id,
     )
-    return LoanApplicationListResponse(
-        items=[_build_admin_summary(row) for row in applications],
-        total=total,
-    )
 
 
 @router.get(
@@ -1551,18 +1863,14 @@ async def list_my_legal_queue(
     limit: int = Query(default=50, ge=1, le=200),
     offset: int = Query(default=0, ge=0),
 ) -> LoanApplicationListResponse:
-    applications, total = await loan_queue.list_queue(
+    return await _queue_response(
         db,
         ctx,
-        stage_type="LEGAL_EXECUTION",
+        "LEGAL_EXECUTION",
         limit=limit,
         offset=offset,
         assigned_to_user_id=current_user.id,
     )
-    return LoanApplicationListResponse(
-        items=[_build_admin_summary(row) for row in applications],
-        total=total,
-    )
 
 
 @router.post(
@@ -1574,6 +1882,7 @@ async def assign_workflow_stage(
     loan_id: UUID,
     stage_type: LoanWorkflowStageType,
     payload: LoanWorkflowStageAssignRequest,
+    request: Request,
     current_user=Depends(deps.require_authenticated_user),
     ctx: deps.TenantContext = Depends(deps.get_tenant_context),
     db: AsyncSession = Depends(get_db),
@@ -1608,49 +1917,53 @@ async def assign_workflow_stage(
                 detail=f"Missing permission: {required_permission.value}",
             )
 
-    user_stmt = select(User).where(User.id == assignee_id)
-    user_result = await db.execute(user_stmt)
-    assignee = user_result.scalar_one_or_none()
-    if not assignee:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Assignee user not found")
-
-    membership_stmt = select(OrgMembership.id).where(
-        OrgMembership.org_id == ctx.org_id,
-        OrgMembership.user_id == assignee_id,
-    )
-    membership_result = await db.execute(membership_stmt)
-    if membership_result.scalar_one_or_none() is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Assignee membership not found"
+    # Self-assignment by a regular member needs no further checks: the auth dependency
+    # already loaded the user and verified their membership in this org, and the
+    # permission just checked is the one the assignee must hold. It skips that
+    # membership check for superuser tokens, so those still look the assignee up.
+    if assignee_id != current_user.id or deps.token_is_superuser(request):
+        # One round-trip for the assignee and their membership in this org; the outer join
+        # keeps "user not found" and "membership not found" distinguishable.
+        assignee_stmt = (
+            select(User, OrgMembership.id)
+            .outerjoin(
+                OrgMembership,
+                (OrgMembership.user_id == User.id) & (OrgMembership.org_id == ctx.org_id),
+            )
+            .where(User.id == assignee_id)
         )
+        assignee_row = (await db.execute(assignee_stmt)).first()
+        if not assignee_row:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Assignee user not found"
+            )
+        assignee, assignee_membership_id = assignee_row
+        if assignee_membership_id is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Assignee membership not found"
+            )
 
-    assignee_allowed = await authz.check_permission(assignee, ctx, required_permission, db)
-    if not assignee_allowed:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail={
-                "code": "assignee_missing_permission",
-                "message": "Assignee does not have required workflow permission",
-                "details": {"permission": required_permission.value},
-            },
-        )
+        assignee_allowed = await authz.check_permission(assignee, ctx, required_permission, db)
+        if not assignee_allowed:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail={
+                    "code": "assignee_missing_permission",
+                    "message": "Assignee does not have required workflow permission",
+                    "details": {"permission": required_permission.value},
+                },
+            )
 
-    stage_stmt = (
-        select(LoanWorkflowStage)
-        .where(
-            LoanWorkflowStage.org_id == ctx.org_id,
-            LoanWorkflowStage.loan_application_id == loan_id,
-            LoanWorkflowStage.stage_type == stage_type.value,
-        )
-        .with_for_update()
+    stage_result = await db.execute(
+        _STAGE_BY_LOAN_STMT,
+        {"org_id": ctx.org_id, "loan_id": loan_id, "stage_type": stage_type.value},
     )
-    stage_result = await db.execute(stage_stmt)
     stage = stage_result.scalar_one_or_none()
     if not stage:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Workflow stage not found"
         )
-    if stage.status == LoanWorkflowStageStatus.COMPLETED.value:
+    if stage.status == STAGE_STATUS_COMPLETED:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail={
@@ -1660,12 +1973,44 @@ async def assign_workflow_stage(
             },
         )
 
-    old_snapshot = model_snapshot(stage)
-    stage.assigned_to_user_id = assignee_id
-    stage.assigned_by_user_id = current_user.id
-    stage.assigned_at = datetime.now(timezone.utc)
-    stage.status = LoanWorkflowStageStatus.IN_PROGRESS.value
-    db.add(stage)
+    # Conditional UPDATE instead of SELECT ... FOR UPDATE: no row lock is held while the
+    # audit entry is written, and a stage completed concurrently is left untouched.
+    # The audit pre-image is read through a CTE, i.e. as of this statement's snapshot;
+    # under READ COMMITTED a write committed while the UPDATE waited on the row is not
+    # reflected in it.
+    previous_stage = (
+        select(LoanWorkflowStage.__table__)
+        .where(LoanWorkflowStage.id == stage.id)
+        .cte("previous_stage")
+    )
+    assign_stmt = (
+        update(LoanWorkflowStage)
+        .where(
+            LoanWorkflowStage.id == stage.id,
+            LoanWorkflowStage.status != STAGE_STATUS_COMPLETED,
+        )
+        .values(
+            assigned_to_user_id=assignee_id,
+            assigned_by_user_id=current_user.id,
+            assigned_at=datetime.now(timezone.utc),
+            status=STAGE_STATUS_IN_PROGRESS,
+        )
+        .add_cte(previous_stage)
+        .returning(LoanWorkflowStage, *_previous_row_columns(previous_stage))
+    )
+    assign_result = await db.execute(assign_stmt)
+    assigned = assign_result.one_or_none()
+    if assigned is None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail={
+                "code": "stage_completed",
+                "message": "Workflow stage was completed before it could be reassigned",
+                "details": {"stage_type": stage_type.value},
+            },
+        )
+    stage, *previous_values = assigned
+    old_snapshot = _previous_row_snapshot(previous_stage, previous_values)
     record_audit_log(
         db,
         ctx,
@@ -1677,7 +2022,7 @@ async def assign_workflow_stage(
         new_value=model_snapshot(stage),
     )
     await db.commit()
-    await db.refresh(stage)
+    await loan_admin_cache.invalidate_loan_admin_cache(ctx.org_id)
     return LoanWorkflowStageDTO.model_validate(stage)
 
 
@@ -1694,136 +2039,177 @@ async def _get_application_or_404(
     return application
 
 
-async def _get_hr_stage_or_404(
-    db: AsyncSession,
-    ctx: deps.TenantContext,
-    loan_id: UUID,
-):
-    stmt = select(LoanWorkflowStage).where(
-        LoanWorkflowStage.org_id == ctx.org_id,
-        LoanWorkflowStage.loan_application_id == loan_id,
-        LoanWorkflowStage.stage_type == "HR_REVIEW",
-    )
-    result = await db.execute(stmt)
-    stage = result.scalar_one_or_none()
-    if not stage:
+async def _require_application_or_404(
+    db: AsyncSession, ctx: deps.TenantContext, loan_id: UUID
+) -> None:
+    """404 unless the loan exists in this org, without loading the application."""
+    result = await db.execute(_APPLICATION_ID_STMT, {"org_id": ctx.org_id, "loan_id": loan_id})
+    if result.scalar_one_or_none() is None:
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="HR workflow stage not found"
+            status_code=status.HTTP_404_NOT_FOUND, detail="Loan application not found"
         )
-    return stage
 
 
-async def _get_finance_stage_or_404(
+async def _get_stage_with_application_or_404(
     db: AsyncSession,
     ctx: deps.TenantContext,
     loan_id: UUID,
-):
-    stmt = select(LoanWorkflowStage).where(
-        LoanWorkflowStage.org_id == ctx.org_id,
-        LoanWorkflowStage.loan_application_id == loan_id,
-        LoanWorkflowStage.stage_type == "FINANCE_PROCESSING",
+    stage_type: LoanWorkflowStageType,
+) -> tuple[LoanWorkflowStage, frozenset[str]]:
+    result = await db.execute(
+        _STAGE_WITH_APPLICATION_STMT,
+        {"org_id": ctx.org_id, "loan_id": loan_id, "stage_type": stage_type.value},
     )
-    result = await db.execute(stmt)
-    stage = result.scalar_one_or_none()
-    if not stage:
+    row = result.first()
+    if not row:
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Finance workflow stage not found"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"{_STAGE_UPDATE_POLICIES[stage_type].label} workflow stage not found",
         )
-    return stage
+    stage, document_types = row
+    return stage, frozenset(document_types or ())
 
 
-async def _get_legal_stage_or_404(
+async def _complete_post_issuance_stage(
     db: AsyncSession,
     ctx: deps.TenantContext,
     loan_id: UUID,
-):
-    stmt = select(LoanWorkflowStage).where(
-        LoanWorkflowStage.org_id == ctx.org_id,
-        LoanWorkflowStage.loan_application_id == loan_id,
-        LoanWorkflowStage.stage_type == "LEGAL_EXECUTION",
+    actor_id: UUID,
+) -> tuple[LoanWorkflowStage, dict | None]:
+    """Create or complete the post-issuance stage with one INSERT ... ON CONFLICT.
+
+    Also returns the audit snapshot of the stage row as this statement's snapshot saw
+    it (None if it did not exist), serialized like model_snapshot so it diffs cleanly
+    against the new row. completed_at is stamped by the database and comes back
+    through RETURNING.
+    """
+    previous_stage = (
+        select(LoanWorkflowStage.__table__)
+        .where(
+            LoanWorkflowStage.org_id == ctx.org_id,
+            LoanWorkflowStage.loan_application_id == loan_id,
+            LoanWorkflowStage.stage_type == STAGE_TYPE_LEGAL_POST_ISSUANCE,
+        )
+        .cte("previous_stage")
     )
-    result = await db.execute(stmt)
-    stage = result.scalar_one_or_none()
-    if not stage:
+    stmt = (
+        insert(LoanWorkflowStage)
+        .values(
+            id=uuid4(),
+            org_id=ctx.org_id,
+            loan_application_id=loan_id,
+            stage_type=STAGE_TYPE_LEGAL_POST_ISSUANCE,
+            status=STAGE_STATUS_COMPLETED,
+            assigned_role_hint="LEGAL",
+            completed_at=func.now(),
+            completed_by_user_id=actor_id,
+        )
+        .on_conflict_do_update(
+            index_elements=[
+                LoanWorkflowStage.org_id,
+                LoanWorkflowStage.loan_application_id,
+                LoanWorkflowStage.stage_type,
+            ],
+            set_={
+                "status": STAGE_STATUS_COMPLETED,
+                "completed_at": func.now(),
+                "completed_by_user_id": actor_id,
+                "updated_at": func.now(),
+            },
+        )
+        .add_cte(previous_stage)
+        .returning(LoanWorkflowStage, *_previous_row_columns(previous_stage))
+        .execution_options(populate_existing=True)
+    )
+    stage, *previous_values = (await db.execute(stmt)).one()
+    return stage, _previous_row_snapshot(previous_stage, previous_values)
+
+
+def _require_active_for_issuance(application) -> None:
+    if application.status != "ACTIVE":
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "code": "invalid_status",
+                "message": "Loan must be ACTIVE before uploading share certificates",
+                "details": {"status": application.status},
+            },
+        )
+
+
+def _require_share_certificate(document_type) -> None:
+    if document_type != LoanDocumentType.SHARE_CERTIFICATE:
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Legal workflow stage not found"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "code": "invalid_document_type",
+                "message": "Legal post-issuance documents must be SHARE_CERTIFICATE",
+                "details": {"document_type": document_type},
+            },
         )
-    return stage
 
 
-@router.get(
-    "/{loan_id}/hr",
-    response_model=LoanHRReviewResponse,
-    summary="Get HR review details for a loan application",
-)
-async def get_hr_review(
+async def _finish_post_issuance_upload(
+    db: AsyncSession,
+    ctx: deps.TenantContext,
+    request: Request,
+    current_user,
     loan_id: UUID,
-    current_user=Depends(deps.require_permission(PermissionCode.LOAN_QUEUE_HR_VIEW)),
-    ctx: deps.TenantContext = Depends(deps.get_tenant_context),
-    db: AsyncSession = Depends(get_db),
-) -> LoanHRReviewResponse:
-    application = await _get_application_or_404(db, ctx, loan_id)
-    try:
-        summary = await stock_summary.build_stock_summary(
-            db, ctx, application.org_membership_id, application.as_of_date
+    document: LoanDocument,
+    *,
+    mfa_verified: bool = False,
+    audit_entries: list[dict] | None = None,
+) -> LoanDocumentDTO:
+    """Shared tail of both share-certificate uploads: MFA, stage completion, audit."""
+    if not mfa_verified:
+        await deps.require_mfa_for_action(
+            request,
+            current_user,
+            ctx,
+            db,
+            action=MFA_ACTION_WORKFLOW_COMPLETE,
         )
-    except ValueError as exc:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
-    hr_stage = None
-    for stage in application.workflow_stages or []:
-        if stage.stage_type == "HR_REVIEW":
-            hr_stage = stage
-            break
-    has_share_certificate, has_83b_election, days_until = loan_applications._compute_workflow_flags(
-        application
-    )
-    applicant = await _fetch_applicant_summary(db, ctx, application)
-    last_edit_note, last_edited_at, last_edited_by = await _fetch_last_edit_note(db, ctx, loan_id)
-    payment_fields = await _payment_status_fields(db, ctx, application)
-    loan_payload = LoanApplicationDTO.model_validate(application).model_copy(
-        update={
-            "has_share_certificate": has_share_certificate,
-            "has_83b_election": has_83b_election,
-            "days_until_83b_due": days_until,
-            "applicant": applicant,
-            "last_edit_note": last_edit_note,
-            "last_edited_at": last_edited_at,
-            "last_edited_by": last_edited_by,
-            **payment_fields,
-        }
-    )
-    return LoanHRReviewResponse(
-        loan_application=loan_payload,
-        stock_summary=summary,
-        hr_stage=LoanWorkflowStageDTO.model_validate(hr_stage) if hr_stage else None,
+    stage, old_stage = await _complete_post_issuance_stage(db, ctx, loan_id, current_user.id)
+    record_audit_logs(
+        db,
+        ctx,
+        [
+            {
+                "actor_id": current_user.id,
+                "action": "loan_workflow_stage.updated",
+                "resource_type": "loan_workflow_stage",
+                "resource_id": str(stage.id),
+                "old_value": old_stage,
+                "new_value": model_snapshot(stage),
+            },
+            *(audit_entries or []),
+        ],
     )
+    await db.commit()
+    await loan_admin_cache.invalidate_loan_admin_cache(ctx.org_id)
+    return LoanDocumentDTO.model_validate(document)
 
 
-@router.patch(
-    "/{loan_id}/hr",
-    response_model=LoanWorkflowStageDTO,
-    summary="Update HR review stage",
-)
-async def update_hr_stage(
+async def _update_workflow_stage(
+    db: AsyncSession,
+    ctx: deps.TenantContext,
     loan_id: UUID,
+    stage_type: LoanWorkflowStageType,
     payload: LoanWorkflowStageUpdateRequest,
     request: Request,
-    current_user=Depends(deps.require_permission(PermissionCode.LOAN_WORKFLOW_HR_MANAGE)),
-    ctx: deps.TenantContext = Depends(deps.get_tenant_context),
-    db: AsyncSession = Depends(get_db),
+    current_user,
 ) -> LoanWorkflowStageDTO:
-    stage = await _get_hr_stage_or_404(db, ctx, loan_id)
-    stage.loan_application = await _get_application_or_404(db, ctx, loan_id)
+    policy = _STAGE_UPDATE_POLICIES[stage_type]
+    stage, uploaded_document_types = await _get_stage_with_application_or_404(
+        db, ctx, loan_id, stage_type
+    )
     old_snapshot = model_snapshot(stage)
-    if payload.status not in {
-        LoanWorkflowStageStatus.IN_PROGRESS,
-        LoanWorkflowStageStatus.COMPLETED,
-    }:
+    if payload.status not in UPDATABLE_STAGE_STATUSES:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail={
                 "code": "invalid_stage_status",
-                "message": "HR stage status must be IN_PROGRESS or COMPLETED",
+                "message": f"{policy.label} stage status must be IN_PROGRESS or COMPLETED",
                 "details": {"status": payload.status},
             },
         )
@@ -1833,27 +2219,15 @@ async def update_hr_stage(
             current_user,
             ctx,
             db,
-            action=MfaEnforcementAction.WORKFLOW_COMPLETE.value,
+            action=MFA_ACTION_WORKFLOW_COMPLETE,
         )
-        required_types = {
-            LoanDocumentType.NOTICE_OF_STOCK_OPTION_GRANT.value,
-            LoanDocumentType.SPOUSE_PARTNER_CONSENT.value,
-        }
-        doc_stmt = select(LoanDocument.document_type).where(
-            LoanDocument.org_id == ctx.org_id,
-            LoanDocument.loan_application_id == loan_id,
-            LoanDocument.stage_type == "HR_REVIEW",
-            LoanDocument.document_type.in_(required_types),
-        )
-        doc_result = await db.execute(doc_stmt)
-        present = {row[0] for row in doc_result.all()}
-        missing = sorted(required_types - present)
+        missing = sorted(policy.required_document_types - uploaded_document_types)
         if missing:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail={
                     "code": "document_required",
-                    "message": "All required HR documents must be uploaded before completing HR review",
+                    "message": policy.missing_documents_message,
                     "details": {"missing_document_types": missing},
                 },
             )
@@ -1867,7 +2241,6 @@ async def update_hr_stage(
         stage.completed_at = None
         stage.completed_by_user_id = None
 
-    db.add(stage)
     await loan_workflow.try_activate_loan(db, ctx, stage.loan_application, actor_id=current_user.id)
     record_audit_log(
         db,
@@ -1880,10 +2253,95 @@ async def update_hr_stage(
         new_value=model_snapshot(stage),
     )
     await db.commit()
-    await db.refresh(stage)
+    await loan_admin_cache.invalidate_loan_admin_cache(ctx.org_id)
     return LoanWorkflowStageDTO.model_validate(stage)
 
 
+async def _stage_review(
+    db: AsyncSession,
+    ctx: deps.TenantContext,
+    loan_id: UUID,
+    stage_type: LoanWorkflowStageType,
+) -> tuple[LoanApplication, LoanApplicationDTO, LoanWorkflowStageDTO | None]:
+    """Shared body of the HR, finance and legal review GETs."""
+    application, applicant = await _get_application_with_applicant_or_404(db, ctx, loan_id)
+    stage = next(
+        (item for item in application.workflow_stages if item.stage_type == stage_type.value),
+        None,
+    )
+    has_share_certificate, has_83b_election, days_until = loan_applications._compute_workflow_flags(
+        application
+    )
+    last_edit_note, last_edited_at, last_edited_by = await _fetch_last_edit_note(db, ctx, loan_id)
+    payment_fields = await _payment_status_fields(db, ctx, application)
+    loan_payload = _loan_application_dto(
+        application,
+        {
+            "has_share_certificate": has_share_certificate,
+            "has_83b_election": has_83b_election,
+            "days_until_83b_due": days_until,
+            "applicant": applicant,
+            "last_edit_note": last_edit_note,
+            "last_edited_at": last_edited_at,
+            "last_edited_by": last_edited_by,
+            **payment_fields,
+        },
+    )
+    stage_payload = LoanWorkflowStageDTO.model_validate(stage) if stage else None
+    return application, loan_payload, stage_payload
+
+
+@router.get(
+    "/{loan_id}/hr",
+    response_model=LoanHRReviewResponse,
+    summary="Get HR review details for a loan application",
+)
+async def get_hr_review(
+    loan_id: UUID,
+    current_user=Depends(deps.require_permission(PermissionCode.LOAN_QUEUE_HR_VIEW)),
+    ctx: deps.TenantContext = Depends(deps.get_tenant_context),
+    db: AsyncSession = Depends(get_db),
+) -> LoanHRReviewResponse:
+    application, loan_payload, hr_stage = await _stage_review(
+        db, ctx, loan_id, LoanWorkflowStageType.HR_REVIEW
+    )
+    try:
+        summary = await stock_summary.build_stock_summary(
+            db, ctx, application.org_membership_id, application.as_of_date
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+    return LoanHRReviewResponse(
+        loan_application=loan_payload,
+        stock_summary=summary,
+        hr_stage=hr_stage,
+    )
+
+
+@router.patch(
+    "/{loan_id}/hr",
+    response_model=LoanWorkflowStageDTO,
+    summary="Update HR review stage",
+)
+async def update_hr_stage(
+    loan_id: UUID,
+    payload: LoanWorkflowStageUpdateRequest,
+    request: Request,
+    current_user=Depends(deps.require_permission(PermissionCode.LOAN_WORKFLOW_HR_MANAGE)),
+    ctx: deps.TenantContext = Depends(deps.get_tenant_context),
+    db: AsyncSession = Depends(get_db),
+) -> LoanWorkflowStageDTO:
+    return await _update_workflow_stage(
+        db,
+        ctx,
+        loan_id,
+        LoanWorkflowStageType.HR_REVIEW,
+        payload,
+        request,
+        current_user,
+    )
+
+
 @router.post(
     "/{loan_id}/documents/hr",
     response_model=LoanDocumentDTO,
@@ -1897,20 +2355,7 @@ async def upload_hr_document(
     ctx: deps.TenantContext = Depends(deps.get_tenant_context),
     db: AsyncSession = Depends(get_db),
 ) -> LoanDocumentDTO:
-    await _get_application_or_404(db, ctx, loan_id)
-    allowed_types = {
-        LoanDocumentType.NOTICE_OF_STOCK_OPTION_GRANT,
-        LoanDocumentType.SPOUSE_PARTNER_CONSENT,
-    }
-    if payload.document_type not in allowed_types:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail={
-                "code": "invalid_document_type",
-                "message": "HR documents must be Notice of Stock Option Grant or Spouse/Partner Consent",
-                "details": {"document_type": payload.document_type},
-            },
-        )
+    _validate_stage_document_type(LoanWorkflowStageType.HR_REVIEW, payload.document_type)
     document = await _create_document_from_storage(
         db=db,
         ctx=ctx,
@@ -1937,20 +2382,8 @@ async def upload_hr_document_file(
     ctx: deps.TenantContext = Depends(deps.get_tenant_context),
     db: AsyncSession = Depends(get_db),
 ) -> LoanDocumentDTO:
-    await _get_application_or_404(db, ctx, loan_id)
-    allowed_types = {
-        LoanDocumentType.NOTICE_OF_STOCK_OPTION_GRANT,
-        LoanDocumentType.SPOUSE_PARTNER_CONSENT,
-    }
-    if document_type not in allowed_types:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail={
-                "code": "invalid_document_type",
-                "message": "HR documents must be Notice of Stock Option Grant or Spouse/Partner Consent",
-                "details": {"document_type": document_type},
-            },
-        )
+    await _require_application_or_404(db, ctx, loan_id)
+    _validate_stage_document_type(LoanWorkflowStageType.HR_REVIEW, document_type)
     document = await _save_local_document(
         db=db,
         ctx=ctx,
@@ -1974,34 +2407,10 @@ async def get_finance_review(
     ctx: deps.TenantContext = Depends(deps.get_tenant_context),
     db: AsyncSession = Depends(get_db),
 ) -> LoanFinanceReviewResponse:
-    application = await _get_application_or_404(db, ctx, loan_id)
-    finance_stage = None
-    for stage in application.workflow_stages or []:
-        if stage.stage_type == "FINANCE_PROCESSING":
-            finance_stage = stage
-            break
-    has_share_certificate, has_83b_election, days_until = loan_applications._compute_workflow_flags(
-        application
-    )
-    applicant = await _fetch_applicant_summary(db, ctx, application)
-    last_edit_note, last_edited_at, last_edited_by = await _fetch_last_edit_note(db, ctx, loan_id)
-    payment_fields = await _payment_status_fields(db, ctx, application)
-    loan_payload = LoanApplicationDTO.model_validate(application).model_copy(
-        update={
-            "has_share_certificate": has_share_certificate,
-            "has_83b_election": has_83b_election,
-            "days_until_83b_due": days_until,
-            "applicant": applicant,
-            "last_edit_note": last_edit_note,
-            "last_edited_at": last_edited_at,
-            "last_edited_by": last_edited_by,
-            **payment_fields,
-        }
-    )
-    return LoanFinanceReviewResponse(
-        loan_application=loan_payload,
-        finance_stage=LoanWorkflowStageDTO.model_validate(finance_stage) if finance_stage else None,
+    _, loan_payload, finance_stage = await _stage_review(
+        db, ctx, loan_id, LoanWorkflowStageType.FINANCE_PROCESSING
     )
+    return LoanFinanceReviewResponse(loan_application=loan_payload, finance_stage=finance_stage)
 
 
 @router.patch(
@@ -2017,71 +2426,15 @@ async def update_finance_stage(
     ctx: deps.TenantContext = Depends(deps.get_tenant_context),
     db: AsyncSession = Depends(get_db),
 ) -> LoanWorkflowStageDTO:
-    stage = await _get_finance_stage_or_404(db, ctx, loan_id)
-    stage.loan_application = await _get_application_or_404(db, ctx, loan_id)
-    old_snapshot = model_snapshot(stage)
-    if payload.status not in {
-        LoanWorkflowStageStatus.IN_PROGRESS,
-        LoanWorkflowStageStatus.COMPLETED,
-    }:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail={
-                "code": "invalid_stage_status",
-                "message": "Finance stage status must be IN_PROGRESS or COMPLETED",
-                "details": {"status": payload.status},
-            },
-        )
-    if payload.status == LoanWorkflowStageStatus.COMPLETED:
-        await deps.require_mfa_for_action(
-            request,
-            current_user,
-            ctx,
-            db,
-            action=MfaEnforcementAction.WORKFLOW_COMPLETE.value,
-        )
-        doc_stmt = select(LoanDocument).where(
-            LoanDocument.org_id == ctx.org_id,
-            LoanDocument.loan_application_id == loan_id,
-            LoanDocument.stage_type == "FINANCE_PROCESSING",
-            LoanDocument.document_type == LoanDocumentType.PAYMENT_INSTRUCTIONS.value,
-        )
-        doc_result = await db.execute(doc_stmt)
-        required_doc = doc_result.scalar_one_or_none()
-        if not required_doc:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail={
-                    "code": "document_required",
-                    "message": "Payment instructions document is required before completing Finance processing",
-                    "details": {"document_type": LoanDocumentType.PAYMENT_INSTRUCTIONS.value},
-                },
-            )
-
-    stage.status = payload.status.value
-    stage.notes = payload.notes
-    if payload.status == LoanWorkflowStageStatus.COMPLETED:
-        stage.completed_at = datetime.now(timezone.utc)
-        stage.completed_by_user_id = current_user.id
-    else:
-        stage.completed_at = None
-        stage.completed_by_user_id = None
-
-    db.add(stage)
-    await loan_workflow.try_activate_loan(db, ctx, stage.loan_application, actor_id=current_user.id)
-    record_audit_log(
+    return await _update_workflow_stage(
         db,
         ctx,
-        actor_id=current_user.id,
-        action="loan_workflow_stage.updated",
-        resource_type="loan_workflow_stage",
-        resource_id=str(stage.id),
-        old_value=old_snapshot,
-        new_value=model_snapshot(stage),
+        loan_id,
+        LoanWorkflowStageType.FINANCE_PROCESSING,
+        payload,
+        request,
+        current_user,
     )
-    await db.commit()
-    await db.refresh(stage)
-    return LoanWorkflowStageDTO.model_validate(stage)
 
 
 @router.post(
@@ -2097,19 +2450,7 @@ async def upload_finance_document(
     ctx: deps.TenantContext = Depends(deps.get_tenant_context),
     db: AsyncSession = Depends(get_db),
 ) -> LoanDocumentDTO:
-    await _get_application_or_404(db, ctx, loan_id)
-    if payload.document_type not in {
-        LoanDocumentType.PAYMENT_INSTRUCTIONS,
-        LoanDocumentType.PAYMENT_CONFIRMATION,
-    }:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail={
-                "code": "invalid_document_type",
-                "message": "Finance documents must be PAYMENT_INSTRUCTIONS or PAYMENT_CONFIRMATION",
-                "details": {"document_type": payload.document_type},
-            },
-        )
+    _validate_stage_document_type(LoanWorkflowStageType.FINANCE_PROCESSING, payload.document_type)
     document = await _create_document_from_storage(
         db=db,
         ctx=ctx,
@@ -2136,20 +2477,8 @@ async def upload_finance_document_file(
     ctx: deps.TenantContext = Depends(deps.get_tenant_context),
     db: AsyncSession = Depends(get_db),
 ) -> LoanDocumentDTO:
-    await _get_application_or_404(db, ctx, loan_id)
-    allowed_types = {
-        LoanDocumentType.PAYMENT_INSTRUCTIONS,
-        LoanDocumentType.PAYMENT_CONFIRMATION,
-    }
-    if document_type not in allowed_types:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail={
-                "code": "invalid_document_type",
-                "message": "Finance documents must be Payment Instructions or Payment Confirmation",
-                "details": {"document_type": document_type},
-            },
-        )
+    await _require_application_or_404(db, ctx, loan_id)
+    _validate_stage_document_type(LoanWorkflowStageType.FINANCE_PROCESSING, document_type)
     document = await _save_local_document(
         db=db,
         ctx=ctx,
@@ -2173,34 +2502,10 @@ async def get_legal_review(
     ctx: deps.TenantContext = Depends(deps.get_tenant_context),
     db: AsyncSession = Depends(get_db),
 ) -> LoanLegalReviewResponse:
-    application = await _get_application_or_404(db, ctx, loan_id)
-    legal_stage = None
-    for stage in application.workflow_stages or []:
-        if stage.stage_type == "LEGAL_EXECUTION":
-            legal_stage = stage
-            break
-    has_share_certificate, has_83b_election, days_until = loan_applications._compute_workflow_flags(
-        application
-    )
-    applicant = await _fetch_applicant_summary(db, ctx, application)
-    last_edit_note, last_edited_at, last_edited_by = await _fetch_last_edit_note(db, ctx, loan_id)
-    payment_fields = await _payment_status_fields(db, ctx, application)
-    loan_payload = LoanApplicationDTO.model_validate(application).model_copy(
-        update={
-            "has_share_certificate": has_share_certificate,
-            "has_83b_election": has_83b_election,
-            "days_until_83b_due": days_until,
-            "applicant": applicant,
-            "last_edit_note": last_edit_note,
-            "last_edited_at": last_edited_at,
-            "last_edited_by": last_edited_by,
-            **payment_fields,
-        }
-    )
-    return LoanLegalReviewResponse(
-        loan_application=loan_payload,
-        legal_stage=LoanWorkflowStageDTO.model_validate(legal_stage) if legal_stage else None,
+    _, loan_payload, legal_stage = await _stage_review(
+        db, ctx, loan_id, LoanWorkflowStageType.LEGAL_EXECUTION
     )
+    return LoanLegalReviewResponse(loan_application=loan_payload, legal_stage=legal_stage)
 
 
 @router.patch(
@@ -2216,78 +2521,15 @@ async def update_legal_stage(
     ctx: deps.TenantContext = Depends(deps.get_tenant_context),
     db: AsyncSession = Depends(get_db),
 ) -> LoanWorkflowStageDTO:
-    stage = await _get_legal_stage_or_404(db, ctx, loan_id)
-    stage.loan_application = await _get_application_or_404(db, ctx, loan_id)
-    old_snapshot = model_snapshot(stage)
-    if payload.status not in {
-        LoanWorkflowStageStatus.IN_PROGRESS,
-        LoanWorkflowStageStatus.COMPLETED,
-    }:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail={
-                "code": "invalid_stage_status",
-                "message": "Legal stage status must be IN_PROGRESS or COMPLETED",
-                "details": {"status": payload.status},
-            },
-        )
-    if payload.status == LoanWorkflowStageStatus.COMPLETED:
-        await deps.require_mfa_for_action(
-            request,
-            current_user,
-            ctx,
-            db,
-            action=MfaEnforcementAction.WORKFLOW_COMPLETE.value,
-        )
-        required_types = {
-            LoanDocumentType.STOCK_OPTION_EXERCISE_AND_LOAN_AGREEMENT.value,
-            LoanDocumentType.SECURED_PROMISSORY_NOTE.value,
-            LoanDocumentType.STOCK_POWER_AND_ASSIGNMENT.value,
-            LoanDocumentType.INVESTMENT_REPRESENTATION_STATEMENT.value,
-        }
-        doc_stmt = select(LoanDocument.document_type).where(
-            LoanDocument.org_id == ctx.org_id,
-            LoanDocument.loan_application_id == loan_id,
-            LoanDocument.stage_type == "LEGAL_EXECUTION",
-            LoanDocument.document_type.in_(required_types),
-        )
-        doc_result = await db.execute(doc_stmt)
-        present = {row[0] for row in doc_result.all()}
-        missing = sorted(required_types - present)
-        if missing:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail={
-                    "code": "document_required",
-                    "message": "All required legal documents must be uploaded before completing Legal execution",
-                    "details": {"missing_document_types": missing},
-                },
-            )
-
-    stage.status = payload.status.value
-    stage.notes = payload.notes
-    if payload.status == LoanWorkflowStageStatus.COMPLETED:
-        stage.completed_at = datetime.now(timezone.utc)
-        stage.completed_by_user_id = current_user.id
-    else:
-        stage.completed_at = None
-        stage.completed_by_user_id = None
-
-    db.add(stage)
-    await loan_workflow.try_activate_loan(db, ctx, stage.loan_application, actor_id=current_user.id)
-    record_audit_log(
+    return await _update_workflow_stage(
         db,
         ctx,
-        actor_id=current_user.id,
-        action="loan_workflow_stage.updated",
-        resource_type="loan_workflow_stage",
-        resource_id=str(stage.id),
-        old_value=old_snapshot,
-        new_value=model_snapshot(stage),
+        loan_id,
+        LoanWorkflowStageType.LEGAL_EXECUTION,
+        payload,
+        request,
+        current_user,
     )
-    await db.commit()
-    await db.refresh(stage)
-    return LoanWorkflowStageDTO.model_validate(stage)
 
 
 @router.post(
@@ -2303,22 +2545,7 @@ async def upload_legal_document(
     ctx: deps.TenantContext = Depends(deps.get_tenant_context),
     db: AsyncSession = Depends(get_db),
 ) -> LoanDocumentDTO:
-    await _get_application_or_404(db, ctx, loan_id)
-    allowed_types = {
-        LoanDocumentType.STOCK_OPTION_EXERCISE_AND_LOAN_AGREEMENT,
-        LoanDocumentType.SECURED_PROMISSORY_NOTE,
-        LoanDocumentType.STOCK_POWER_AND_ASSIGNMENT,
-        LoanDocumentType.INVESTMENT_REPRESENTATION_STATEMENT,
-    }
-    if payload.document_type not in allowed_types:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail={
-                "code": "invalid_document_type",
-                "message": "Legal documents must be execution documents for the loan",
-                "details": {"document_type": payload.document_type},
-            },
-        )
+    _validate_stage_document_type(LoanWorkflowStageType.LEGAL_EXECUTION, payload.document_type)
     document = await _create_document_from_storage(
         db=db,
         ctx=ctx,
@@ -2345,22 +2572,8 @@ async def upload_legal_document_file(
     ctx: deps.TenantContext = Depends(deps.get_tenant_context),
     db: AsyncSession = Depends(get_db),
 ) -> LoanDocumentDTO:
-    await _get_application_or_404(db, ctx, loan_id)
-    allowed_types = {
-        LoanDocumentType.STOCK_OPTION_EXERCISE_AND_LOAN_AGREEMENT,
-        LoanDocumentType.SECURED_PROMISSORY_NOTE,
-        LoanDocumentType.STOCK_POWER_AND_ASSIGNMENT,
-        LoanDocumentType.INVESTMENT_REPRESENTATION_STATEMENT,
-    }
-    if document_type not in allowed_types:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail={
-                "code": "invalid_document_type",
-                "message": "Legal documents must be execution documents for the loan",
-                "details": {"document_type": document_type},
-            },
-        )
+    await _require_application_or_404(db, ctx, loan_id)
+    _validate_stage_document_type(LoanWorkflowStageType.LEGAL_EXECUTION, document_type)
     document = await _save_local_document(
         db=db,
         ctx=ctx,
@@ -2389,77 +2602,28 @@ async def upload_legal_issuance_document(
     ctx: deps.TenantContext = Depends(deps.get_tenant_context),
     db: AsyncSession = Depends(get_db),
 ) -> LoanDocumentDTO:
-    application = await _get_application_or_404(db, ctx, loan_id)
-    if application.status != "ACTIVE":
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail={
-                "code": "invalid_status",
-                "message": "Loan must be ACTIVE before uploading share certificates",
-                "details": {"status": application.status},
-            },
-        )
-    if payload.document_type != LoanDocumentType.SHARE_CERTIFICATE:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail={
-                "code": "invalid_document_type",
-                "message": "Legal post-issuance documents must be SHARE_CERTIFICATE",
-                "details": {"document_type": payload.document_type},
-            },
-        )
-
-    stage_stmt = select(LoanWorkflowStage).where(
-        LoanWorkflowStage.org_id == ctx.org_id,
-        LoanWorkflowStage.loan_application_id == loan_id,
-        LoanWorkflowStage.stage_type == "LEGAL_POST_ISSUANCE",
-    )
-    stage_result = await db.execute(stage_stmt)
-    stage = stage_result.scalar_one_or_none()
-    if not stage:
-        stage = LoanWorkflowStage(
-            org_id=ctx.org_id,
-            loan_application_id=loan_id,
-            stage_type=LoanWorkflowStageType.LEGAL_POST_ISSUANCE.value,
-            status="PENDING",
-            assigned_role_hint="LEGAL",
-        )
-        db.add(stage)
+    _require_active_for_issuance(await _get_application_or_404(db, ctx, loan_id))
+    _require_share_certificate(payload.document_type)
 
-    old_stage = model_snapshot(stage)
-    document = await _create_document_from_storage(
-        db=db,
-        ctx=ctx,
-        loan_id=loan_id,
-        document_type=payload.document_type,
-        stage_type="LEGAL_POST_ISSUANCE",
-        payload=payload,
-        actor_id=current_user.id,
-    )
-    await deps.require_mfa_for_action(
-        request,
-        current_user,
+    # The document, the stage completion and both audit rows commit together.
+    document = _build_document_from_storage(
         ctx,
-        db,
-        action=MfaEnforcementAction.WORKFLOW_COMPLETE.value,
+        loan_id,
+        payload.document_type,
+        "LEGAL_POST_ISSUANCE",
+        payload,
+        current_user.id,
     )
-    stage.status = "COMPLETED"
-    stage.completed_at = datetime.now(timezone.utc)
-    stage.completed_by_user_id = current_user.id
-
-    record_audit_log(
+    db.add(document)
+    return await _finish_post_issuance_upload(
         db,
         ctx,
-        actor_id=current_user.id,
-        action="loan_workflow_stage.updated",
-        resource_type="loan_workflow_stage",
-        resource_id=str(stage.id),
-        old_value=old_stage,
-        new_value=model_snapshot(stage),
+        request,
+        current_user,
+        loan_id,
+        document,
+        audit_entries=[_document_created_audit_entry(document, current_user.id)],
     )
-    await db.commit()
-    await db.refresh(document)
-    return LoanDocumentDTO.model_validate(document)
 
 
 @router.post(
@@ -2467,106 +2631,92 @@ async def upload_legal_issuance_document(
     response_model=LoanDocumentDTO,
     status_code=status.HTTP_201_CREATED,
     summary="Upload Legal post-issuance document (file)",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "multipart/form-data": {
+                    "schema": {
+                        "type": "object",
+                        "required": ["document_type", "file"],
+                        "properties": {
+                            "document_type": {"type": "string", "enum": ["SHARE_CERTIFICATE"]},
+                            "file": {"type": "string", "format": "binary"},
+                        },
+                    }
+                }
+            },
+        }
+    },
 )
 async def upload_legal_issuance_document_file(
     loan_id: UUID,
     request: Request,
-    document_type: LoanDocumentType = Form(...),
-    file: UploadFile = File(...),
     current_user=Depends(deps.require_permission(PermissionCode.LOAN_WORKFLOW_POST_ISSUANCE_MANAGE)),
     ctx: deps.TenantContext = Depends(deps.get_tenant_context),
     db: AsyncSession = Depends(get_db),
 ) -> LoanDocumentDTO:
-    application = await _get_application_or_404(db, ctx, loan_id)
-    if application.status != "ACTIVE":
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail={
-                "code": "invalid_status",
-                "message": "Loan must be ACTIVE before uploading share certificates",
-                "details": {"status": application.status},
-            },
-        )
-    if document_type != LoanDocumentType.SHARE_CERTIFICATE:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail={
-                "code": "invalid_document_type",
-                "message": "Legal post-issuance documents must be SHARE_CERTIFICATE",
-                "details": {"document_type": document_type},
-            },
-        )
-    stage_stmt = select(LoanWorkflowStage).where(
-        LoanWorkflowStage.org_id == ctx.org_id,
-        LoanWorkflowStage.loan_application_id == loan_id,
-        LoanWorkflowStage.stage_type == "LEGAL_POST_ISSUANCE",
-    )
-    stage_result = await db.execute(stage_stmt)
-    stage = stage_result.scalar_one_or_none()
-    if not stage:
-        stage = LoanWorkflowStage(
-            org_id=ctx.org_id,
-            loan_application_id=loan_id,
-            stage_type=LoanWorkflowStageType.LEGAL_POST_ISSUANCE.value,
-            status="PENDING",
-            assigned_role_hint="LEGAL",
-        )
-        db.add(stage)
-
-    base_dir = Path(settings.local_upload_dir)
-    try:
-        relative_path, original_name = await save_upload(
-            file,
+    _require_active_for_issuance(await _get_application_or_404(db, ctx, loan_id))
+    # Parse the multipart body ourselves so the certificate is written straight to
+    # its destination instead of being spooled to a temp file by the form parser.
+    # The MFA check does not depend on the body, so it runs while the upload streams;
+    # it is the only coroutine using the session until both finish. A failed check
+    # cancels the upload, which removes anything already written.
+    base_dir = local_upload_base_dir()
+    upload = asyncio.ensure_future(
+        stream_multipart_upload(
+            request,
             base_dir=base_dir,
             subdir=loan_documents_subdir(ctx.org_id, loan_id),
             allowed_extensions=SAFE_EXTENSIONS,
             max_size_bytes=settings.max_upload_size_mb * 1024 * 1024,
+            field_validators={"document_type": _require_share_certificate},
         )
+    )
+    try:
+        await deps.require_mfa_for_action(
+            request,
+            current_user,
+            ctx,
+            db,
+            action=MFA_ACTION_WORKFLOW_COMPLETE,
+        )
+    except BaseException:
+        upload.cancel()
+        await asyncio.wait({upload})
+        if not upload.cancelled() and upload.exception() is None:
+            # The upload finished before it could be cancelled.
+            resolve_local_path(base_dir, upload.result()[1].relative_path).unlink(
+                missing_ok=True
+            )
+        raise
+    try:
+        fields, saved = await upload
     except ValueError as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    # document_type was validated before the file part was accepted.
+    document_type = fields["document_type"]
 
-    old_stage = model_snapshot(stage)
     document = LoanDocument(
+        id=uuid4(),
         org_id=ctx.org_id,
         loan_application_id=loan_id,
         stage_type="LEGAL_POST_ISSUANCE",
-        document_type=document_type.value,
-        file_name=original_name,
-        storage_path_or_url=relative_path,
+        document_type=document_type,
+        file_name=saved.original_name,
+        storage_path_or_url=saved.relative_path,
+        size_bytes=saved.size_bytes,
+        checksum=saved.checksum,
         uploaded_by_user_id=current_user.id,
     )
     db.add(document)
-    await deps.require_mfa_for_action(
-        request,
-        current_user,
-        ctx,
-        db,
-        action=MfaEnforcementAction.WORKFLOW_COMPLETE.value,
-    )
-    stage.status = "COMPLETED"
-    stage.completed_at = datetime.now(timezone.utc)
-    stage.completed_by_user_id = current_user.id
-
-    record_audit_log(
+    return await _finish_post_issuance_upload(
         db,
         ctx,
-        actor_id=current_user.id,
-        action="loan_workflow_stage.updated",
-        resource_type="loan_workflow_stage",
-        resource_id=str(stage.id),
-        old_value=old_stage,
-        new_value=model_snapshot(stage),
-    )
-    record_audit_log(
-        db,
-        ctx,
-        actor_id=current_user.id,
-        action="loan_document.created",
-        resource_type="loan_document",
-        resource_id=str(document.id),
-        old_value=None,
-        new_value=model_snapshot(document),
+        request,
+        current_user,
+        loan_id,
+        document,
+        mfa_verified=True,
+        audit_entries=[_document_created_audit_entry(document, current_user.id)],
     )
-    await db.commit()
-    await db.refresh(document)
-    return LoanDocumentDTO.model_validate(document)
@@ -28,7 +28,7 @@ from app.schemas.loan import (
     LoanWorkflowStageStatus,
 )
 from app.schemas.settings import MfaEnforcementAction
-from app.services import loan_applications, loan_quotes, loan_workflow
+from app.services import loan_admin_cache, loan_applications, loan_quotes, loan_workflow
 
 router = APIRouter(prefix="/me/loan-applications", tags=["loan-applications"])
 
@@ -252,6 +252,7 @@ async def get_loan_application(
     activated = await loan_workflow.try_activate_loan(db, ctx, application)
     if activated:
         await db.commit()
+        await loan_admin_cache.invalidate_loan_admin_cache(ctx.org_id)
         refreshed = await loan_applications.get_application_with_related(
             db, ctx, application.id, membership_id=membership.id
         )
@@ -300,6 +301,7 @@ async def create_loan_application(
             detail={"code": exc.code, "message": exc.message, "details": exc.details},
         ) from exc
     await db.commit()
+    await loan_admin_cache.invalidate_loan_admin_cache(ctx.org_id)
     hydrated = await loan_applications.get_application_with_related(
         db, ctx, application.id, membership_id=membership.id
     )
@@ -358,6 +360,7 @@ async def update_loan_application(
             },
         ) from exc
     await db.commit()
+    await loan_admin_cache.invalidate_loan_admin_cache(ctx.org_id)
     hydrated = await loan_applications.get_application_with_related(
         db, ctx, updated.id, membership_id=membership.id
     )
@@ -422,6 +425,7 @@ async def submit_loan_application(
             },
         ) from exc
     await db.commit()
+    await loan_admin_cache.invalidate_loan_admin_cache(ctx.org_id)
     hydrated = await loan_applications.get_application_with_related(
         db, ctx, submitted.id, membership_id=membership.id
     )
@@ -474,6 +478,7 @@ async def cancel_loan_application(
             },
         ) from exc
     await db.commit()
+    await loan_admin_cache.invalidate_loan_admin_cache(ctx.org_id)
     hydrated = await loan_applications.get_application_with_related(
         db, ctx, cancelled.id, membership_id=membership.id
     )
@@ -2,10 +2,11 @@ from __future__ import annotations
 
 from datetime import date, datetime, timezone
 from pathlib import Path
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi.responses import FileResponse, RedirectResponse, StreamingResponse
+from pydantic import TypeAdapter
 from sqlalchemy import select
 from sqlalchemy.orm import selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -31,12 +32,19 @@ from app.schemas.loan import (
     LoanScheduleWhatIfRequest,
     LoanWorkflowStageType,
 )
-from app.services import loan_applications, loan_exports, loan_repayments, loan_schedules
+from app.services import (
+    loan_admin_cache,
+    loan_applications,
+    loan_exports,
+    loan_repayments,
+    loan_schedules,
+)
 from app.services.audit import model_snapshot, record_audit_log
 from app.services.local_uploads import (
     ensure_org_scoped_key,
     generate_storage_key,
     loan_documents_subdir,
+    local_upload_base_dir,
     resolve_local_path,
 )
 from app.services.storage.service import get_storage_adapter
@@ -44,6 +52,8 @@ from app.services.storage.service import get_storage_adapter
 
 router = APIRouter(prefix="/me/loans", tags=["loan-borrower"])
 
+_REPAYMENT_LIST_ADAPTER = TypeAdapter(list[LoanRepaymentDTO])
+
 
 async def _get_application_or_404(
     db: AsyncSession,
@@ -151,7 +161,7 @@ async def download_borrower_document(
         )
     try:
         file_path = resolve_local_path(
-            Path(settings.local_upload_dir), document.storage_path_or_url
+            local_upload_base_dir(), document.storage_path_or_url
         )
     except ValueError as exc:
         raise HTTPException(
@@ -195,7 +205,7 @@ async def list_borrower_repayments(
     return LoanRepaymentListResponse(
         loan_id=loan_id,
         total=len(repayments),
-        items=[LoanRepaymentDTO.model_validate(item) for item in repayments],
+        items=_REPAYMENT_LIST_ADAPTER.validate_python(repayments),
     )
 
 
@@ -307,10 +317,12 @@ async def export_borrower_loan(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail={"code": "invalid_schedule", "message": str(exc), "details": {}},
         ) from exc
-    content = loan_exports.loan_export_to_csv(application, schedule)
+    # The CSV is streamed after the handler returns; hand the connection back to the
+    # pool now rather than holding it until the response has been sent.
+    await db.close()
     filename = f"loan_export_{loan_id}.csv"
     return StreamingResponse(
-        iter([content]),
+        loan_exports.loan_export_to_csv_iter(application, schedule),
         media_type="text/csv",
         headers={"Content-Disposition": f'attachment; filename="{filename}"'},
     )
@@ -412,6 +424,7 @@ async def upload_83b_document(
             },
         )
     document = LoanDocument(
+        id=uuid4(),
         org_id=ctx.org_id,
         loan_application_id=loan_id,
         stage_type="BORROWER_83B_ELECTION",
@@ -453,7 +466,7 @@ async def upload_83b_document(
     )
 
     await db.commit()
-    await db.refresh(document)
+    await loan_admin_cache.invalidate_loan_admin_cache(ctx.org_id)
     return LoanDocumentDTO.model_validate(document)
 
 
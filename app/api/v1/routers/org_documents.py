@@ -1,4 +1,3 @@
-from pathlib import Path
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile, status
@@ -24,6 +23,7 @@ from app.services import org_documents
 from app.services.local_uploads import (
     ensure_org_scoped_key,
     generate_storage_key,
+    local_upload_base_dir,
     org_templates_subdir,
     resolve_local_path,
 )
@@ -167,7 +167,7 @@ async def upload_template(
             description=description,
             file=file,
             actor_id=current_user.id,
-            base_dir=Path(settings.local_upload_dir),
+            base_dir=local_upload_base_dir(),
         )
         await db.commit()
     except ValueError as exc:
@@ -334,7 +334,7 @@ async def download_template(
         )
     try:
         file_path = resolve_local_path(
-            Path(settings.local_upload_dir), template.storage_path_or_url
+            local_upload_base_dir(), template.storage_path_or_url
         )
     except ValueError as exc:
         raise HTTPException(
@@ -49,6 +49,7 @@ async def update_org_settings(
     except ValueError as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
     await db.commit()
+    await settings_service.invalidate_mfa_policy_cache(ctx.org_id)
     latest_rate = await pbgc_rates.get_latest_annual_rate(db)
     response = OrgSettingsResponse.model_validate(settings)
     if latest_rate is not None:
@@ -7,6 +7,7 @@ from typing import Any
 from redis.exceptions import RedisError
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy import text
+from sqlalchemy.pool import QueuePool
 
 from app.core.settings import settings
 from app.db.session import engine
@@ -27,6 +28,18 @@ async def _check_db() -> dict[str, str]:
         return {"status": "error"}
 
 
+def _pool_stats() -> dict[str, int]:
+    pool = engine.pool
+    if not isinstance(pool, QueuePool):
+        return {}
+    return {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+    }
+
+
 async def _check_redis() -> dict[str, str]:
     try:
         redis = get_redis_client()
@@ -68,6 +81,7 @@ async def ready_payload() -> dict[str, Any]:
     if settings.health_include_details:
         payload["environment"] = settings.environment
         payload["checks"] = checks
+        payload["db_pool"] = _pool_stats()
     return payload
 
 
@@ -87,6 +101,7 @@ async def status_summary_payload() -> dict[str, Any]:
     if settings.health_include_details:
         payload["environment"] = settings.environment
         payload["checks"] = checks
+        payload["db_pool"] = _pool_stats()
     return payload
 
 
@@ -36,6 +36,27 @@ def _build_success_envelope(data: Any, status_code: int) -> dict[str, Any]:
     }
 
 
+def _build_success_envelope_body(data_body: bytes, status_code: int) -> bytes:
+    """Splice an already-serialized JSON body into the success envelope.
+
+    Produces the same document as rendering _build_success_envelope() with JSONResponse,
+    without decoding and re-encoding the handler's payload.
+    """
+    code = json.dumps(_success_code(status_code), ensure_ascii=False)
+    message = json.dumps(_success_message(status_code), ensure_ascii=False)
+    return b"".join(
+        (
+            b'{"code":',
+            code.encode("utf-8"),
+            b',"message":',
+            message.encode("utf-8"),
+            b',"data":',
+            data_body.strip() or b"null",
+            b',"details":{}}',
+        )
+    )
+
+
 def _is_enveloped(payload: Any) -> bool:
     if not isinstance(payload, dict):
         return False
@@ -188,8 +209,11 @@ class ResponseEnvelopeMiddleware:
                 return
             response = JSONResponse(status_code=status_code, content=normalized)
         else:
-            wrapped = _build_success_envelope(payload, status_code)
-            response = JSONResponse(status_code=status_code, content=wrapped)
+            response = Response(
+                content=_build_success_envelope_body(body, status_code),
+                status_code=status_code,
+                media_type="application/json",
+            )
 
         for key, values in headers.items():
             lowered = key.lower()
@@ -60,15 +60,30 @@ class Settings(BaseSettings):
     db_max_overflow: int = Field(default=0, alias="DB_MAX_OVERFLOW")
     db_pool_timeout: int = Field(default=10, alias="DB_POOL_TIMEOUT")
     db_pool_recycle: int = Field(default=1800, alias="DB_POOL_RECYCLE")
+    db_pool_pre_ping: bool = Field(default=False, alias="DB_POOL_PRE_PING")
+    # psycopg server-side prepares a query after this many executions on a connection;
+    # set to -1 to disable (e.g. behind PgBouncer in transaction mode).
+    db_prepare_threshold: int = Field(default=2, alias="DB_PREPARE_THRESHOLD")
+    db_prepared_max: int = Field(default=256, alias="DB_PREPARED_MAX")
+    # Entries in SQLAlchemy's per-engine compiled statement cache (its default is 500).
+    db_query_cache_size: int = Field(default=1200, alias="DB_QUERY_CACHE_SIZE")
     db_pool_retry_after_seconds: int = Field(default=3, alias="DB_POOL_RETRY_AFTER_SECONDS")
     db_statement_timeout_ms: int = Field(default=10000, alias="DB_STATEMENT_TIMEOUT_MS")
     db_slow_query_ms: int = Field(default=2000, alias="DB_SLOW_QUERY_MS")
     db_log_query_timings: bool = Field(default=False, alias="DB_LOG_QUERY_TIMINGS")
+    audit_queue_enabled: bool = Field(default=True, alias="AUDIT_QUEUE_ENABLED")
+    audit_queue_batch_size: int = Field(default=512, alias="AUDIT_QUEUE_BATCH_SIZE")
+    audit_queue_flush_interval_ms: int = Field(default=50, alias="AUDIT_QUEUE_FLUSH_INTERVAL_MS")
+    audit_queue_copy_threshold: int = Field(default=64, alias="AUDIT_QUEUE_COPY_THRESHOLD")
+    audit_queue_max_size: int = Field(default=1024, alias="AUDIT_QUEUE_MAX_SIZE")
     redis_key_prefix: str = Field(default="sole", alias="REDIS_KEY_PREFIX")
     request_concurrency_limit: int = Field(default=0, alias="REQUEST_CONCURRENCY_LIMIT")
     request_concurrency_timeout_seconds: int = Field(
         default=0, alias="REQUEST_CONCURRENCY_TIMEOUT_SECONDS"
     )
+    # Responses at least this large are gzip-compressed for clients that accept it (0 = off).
+    gzip_minimum_size: int = Field(default=1024, alias="GZIP_MINIMUM_SIZE")
+    gzip_compress_level: int = Field(default=5, alias="GZIP_COMPRESS_LEVEL")
     redis_url: str = Field(alias="REDIS_URL")
     tenancy_mode: Literal["single", "multi"] = Field(default="single", alias="TENANCY_MODE")
     session_timeout_minutes: int = Field(default=30, alias="SESSION_TIMEOUT_MINUTES")
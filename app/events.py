@@ -6,12 +6,14 @@ import httpx
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from fastapi import FastAPI
+from sqlalchemy import text
 from sqlalchemy.exc import SQLAlchemyError
 
 from app.core.settings import settings
 from app.db.session import engine
 from app.db.session import AsyncSessionLocal
 from app.services import pbgc_rates
+from app.services.audit_queue import audit_log_queue
 
 logger = logging.getLogger(__name__)
 
@@ -52,11 +54,23 @@ async def _run_pbgc_scrape() -> None:
             _running_tasks.discard(task)
 
 
+async def _check_database() -> None:
+    # Pool pre-ping is off, so surface an unreachable database at startup instead.
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+    except (SQLAlchemyError, OSError):
+        logger.exception("Database connectivity check failed at startup")
+
+
 @asynccontextmanager
 async def lifespan(_app: FastAPI):
     logger.info("Application startup")
     _shutdown_event.clear()
     global _scheduler
+    await _check_database()
+    if settings.audit_queue_enabled:
+        await audit_log_queue.start()
     if settings.pbgc_rate_scrape_enabled:
         _scheduler = AsyncIOScheduler(timezone="UTC")
         trigger = CronTrigger(
@@ -78,6 +92,7 @@ async def lifespan(_app: FastAPI):
             for task in list(_running_tasks):
                 task.cancel()
             await asyncio.gather(*_running_tasks, return_exceptions=True)
+        await audit_log_queue.stop()
         await engine.dispose()
 
 
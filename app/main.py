@@ -1,6 +1,7 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from slowapi.middleware import SlowAPIMiddleware
+from starlette.middleware.gzip import DEFAULT_EXCLUDED_CONTENT_TYPES
 
 from app.api.v1 import api_router
 from app.core.errors import register_exception_handlers
@@ -9,6 +10,7 @@ from app.core.limiter import limiter
 from app.core.logging import configure_logging
 from app.core.settings import settings
 from app.events import register_event_handlers
+from app.middlewares.compression import ScopedGZipMiddleware
 from app.middlewares.concurrency_limit import ConcurrencyLimitMiddleware
 from app.middlewares.request_context import RequestContextMiddleware
 from app.middlewares.security_headers import SecurityHeadersMiddleware
@@ -38,6 +40,21 @@ def create_app() -> FastAPI:
     app.add_middleware(TrustedProxiesMiddleware, proxies_count=settings.proxies_count)
     app.add_middleware(RequestContextMiddleware)
     app.add_middleware(SecurityHeadersMiddleware, enable_hsts=settings.enable_hsts)
+    if settings.gzip_minimum_size > 0:
+        # Added after the envelope so the enveloped body is what gets compressed.
+        # Only the loan admin reads are compressed; auth responses carry tokens.
+        app.add_middleware(
+            ScopedGZipMiddleware,
+            path_prefixes=("/api/v1/org/loans",),
+            minimum_size=settings.gzip_minimum_size,
+            compresslevel=settings.gzip_compress_level,
+            # Document downloads are served as application/octet-stream.
+            exclude_content_types=(
+                *DEFAULT_EXCLUDED_CONTENT_TYPES,
+                "application/pdf",
+                "application/octet-stream",
+            ),
+        )
     origins = settings.allowed_origins_list()
     app.add_middleware(
         CORSMiddleware,
@@ -0,0 +1,26 @@
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class ScopedGZipMiddleware:
+    """Gzip GET responses under the given path prefixes and nothing else.
+
+    Auth responses carry refresh and CSRF tokens next to request-influenced data;
+    compressing them would open a BREACH-style length oracle, so compression is
+    opted into per route prefix rather than applied app-wide.
+    """
+
+    def __init__(self, app: ASGIApp, *, path_prefixes: tuple[str, ...], **gzip_options) -> None:
+        self.app = app
+        self.path_prefixes = path_prefixes
+        self.gzip = GZipMiddleware(app, **gzip_options)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] == "http"
+            and scope["method"] == "GET"
+            and scope["path"].startswith(self.path_prefixes)
+        ):
+            await self.gzip(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
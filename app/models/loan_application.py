@@ -8,6 +8,7 @@ from sqlalchemy import (
     DateTime,
     ForeignKey,
     ForeignKeyConstraint,
+    Index,
     Integer,
     Numeric,
     String,
@@ -66,6 +67,13 @@ class LoanApplication(Base):
             ondelete="CASCADE",
             name="fk_loan_app_org_membership",
         ),
+        # Serves the admin list and stage queues: org + status filter, newest first.
+        Index(
+            "ix_loan_applications_org_status_created",
+            "org_id",
+            "status",
+            "created_at",
+        ),
     )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -52,7 +52,15 @@ class LoanDocument(Base):
         ),
         Index("ix_loan_documents_org_id", "org_id"),
         Index("ix_loan_documents_org_stage_type", "org_id", "stage_type"),
+        Index(
+            "ix_loan_documents_org_loan_stage_type",
+            "org_id",
+            "loan_application_id",
+            "stage_type",
+            "document_type",
+        ),
     )
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     org_id = Column(String, ForeignKey("orgs.id", ondelete="CASCADE"), nullable=False)
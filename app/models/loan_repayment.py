@@ -28,6 +28,7 @@ class LoanRepayment(Base):
         Index("ix_loan_repayments_org_id", "org_id"),
         Index("ix_loan_repayments_org_loan", "org_id", "loan_application_id"),
     )
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     org_id = Column(String, ForeignKey("orgs.id", ondelete="CASCADE"), nullable=False)
@@ -45,7 +45,17 @@ class LoanWorkflowStage(Base):
         ),
         Index("ix_loan_workflow_stages_org_id", "org_id"),
         Index("ix_loan_workflow_stages_org_stage_status", "org_id", "stage_type", "status"),
+        Index(
+            "ux_loan_workflow_stages_org_loan_stage",
+            "org_id",
+            "loan_application_id",
+            "stage_type",
+            unique=True,
+            postgresql_include=["status", "assigned_to_user_id"],
+        ),
     )
+    # Server-generated timestamps come back via RETURNING, so no refresh is needed.
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     org_id = Column(String, ForeignKey("orgs.id", ondelete="CASCADE"), nullable=False)
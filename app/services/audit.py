@@ -2,24 +2,47 @@ from __future__ import annotations
 
 from datetime import date, datetime
 from decimal import Decimal
+from enum import Enum
+from functools import lru_cache
 from typing import Any, Iterable
+from uuid import UUID
 
 from fastapi.encoders import jsonable_encoder
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api import deps
 from app.models.audit_log import AuditLog
+from app.services.audit_queue import audit_log_queue
+
+
+_AUDIT_ENCODERS = {
+    Decimal: lambda v: str(v),
+    datetime: lambda v: v.isoformat(),
+    date: lambda v: v.isoformat(),
+}
 
 
 def serialize_for_audit(value: Any) -> Any:
-    return jsonable_encoder(
-        value,
-        custom_encoder={
-            Decimal: lambda v: str(v),
-            datetime: lambda v: v.isoformat(),
-            date: lambda v: v.isoformat(),
-        },
-    )
+    # Column values and snapshot dicts are almost always plain scalars, so handle
+    # those inline and leave jsonable_encoder for models and other rich objects.
+    if isinstance(value, Enum):
+        return serialize_for_audit(value.value)
+    if value is None or isinstance(value, (str, int, float)):
+        return value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (Decimal, UUID)):
+        return str(value)
+    if isinstance(value, dict):
+        return {serialize_for_audit(key): serialize_for_audit(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [serialize_for_audit(item) for item in value]
+    return jsonable_encoder(value, custom_encoder=_AUDIT_ENCODERS)
+
+
+@lru_cache(maxsize=None)
+def _snapshot_column_names(model_type: type) -> tuple[str, ...]:
+    return tuple(column.name for column in model_type.__table__.columns)
 
 
 def model_snapshot(model: Any, *, exclude: Iterable[str] | None = None) -> dict[str, Any]:
@@ -27,8 +50,7 @@ def model_snapshot(model: Any, *, exclude: Iterable[str] | None = None) -> dict[
         return {}
     excluded = set(exclude or [])
     data: dict[str, Any] = {}
-    for column in model.__table__.columns:
-        name = column.name
+    for name in _snapshot_column_names(type(model)):
         if name in excluded:
             continue
         data[name] = getattr(model, name)
@@ -57,8 +79,7 @@ def _build_summary(action: str, changes: dict[str, dict[str, Any]] | None) -> st
     return f"{action}: {snippet}{suffix}"
 
 
-def record_audit_log(
-    db: AsyncSession,
+def _audit_log_values(
     ctx: deps.TenantContext,
     *,
     actor_id,
@@ -68,7 +89,7 @@ def record_audit_log(
     old_value: Any | None = None,
     new_value: Any | None = None,
     impersonator_id: Any | None = None,
-) -> None:
+) -> dict[str, Any]:
     serialized_old = serialize_for_audit(old_value) if old_value is not None else None
     serialized_new = serialize_for_audit(new_value) if new_value is not None else None
     changes = None
@@ -77,19 +98,62 @@ def record_audit_log(
         if not changes:
             changes = None
     summary = _build_summary(action, changes)
-    entry = AuditLog(
-        org_id=ctx.org_id,
-        actor_id=actor_id,
-        impersonator_id=impersonator_id,
-        action=action,
-        resource_type=resource_type,
-        resource_id=resource_id,
-        old_value=serialized_old,
-        new_value=serialized_new,
-        changes=changes,
-        summary=summary,
+    return {
+        "org_id": ctx.org_id,
+        "actor_id": actor_id,
+        "impersonator_id": impersonator_id,
+        "action": action,
+        "resource_type": resource_type,
+        "resource_id": resource_id,
+        "old_value": serialized_old,
+        "new_value": serialized_new,
+        "changes": changes,
+        "summary": summary,
+    }
+
+
+def record_audit_log(
+    db: AsyncSession,
+    ctx: deps.TenantContext,
+    *,
+    actor_id,
+    action: str,
+    resource_type: str,
+    resource_id: str,
+    old_value: Any | None = None,
+    new_value: Any | None = None,
+    impersonator_id: Any | None = None,
+) -> None:
+    record_audit_logs(
+        db,
+        ctx,
+        [
+            {
+                "actor_id": actor_id,
+                "action": action,
+                "resource_type": resource_type,
+                "resource_id": resource_id,
+                "old_value": old_value,
+                "new_value": new_value,
+                "impersonator_id": impersonator_id,
+            }
+        ],
     )
-    db.add(entry)
+
+
+def record_audit_logs(
+    db: AsyncSession,
+    ctx: deps.TenantContext,
+    entries: Iterable[dict[str, Any]],
+) -> None:
+    """Record several audit entries together; each entry takes record_audit_log's kwargs."""
+    for entry in entries:
+        values = _audit_log_values(ctx, **entry)
+        # Once the request commits, the background queue batches the row with others;
+        # without a running queue the row joins the caller's transaction, where the
+        # unit of work flushes all pending audit rows as one multi-row INSERT.
+        if not audit_log_queue.defer(db, values):
+            db.add(AuditLog(**values))
 
 
 def record_audit_log_for_user(
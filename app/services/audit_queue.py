@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import uuid
+from datetime import datetime, timezone
+from typing import Any
+
+import psycopg
+from psycopg.types.json import Json
+from sqlalchemy import JSON, event, insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.settings import settings
+from app.db.session import AsyncSessionLocal
+from app.models.audit_log import AuditLog
+
+
+logger = logging.getLogger(__name__)
+
+_PENDING_KEY = "pending_audit_logs"
+
+
+class AuditLogQueue:
+    """Writes audit rows from a background task in multi-row INSERT batches.
+
+    Rows are parked on the request session and only handed to the queue once that
+    session commits, so rolled-back work never produces an audit entry. When the
+    worker is not running (tests, scripts, migrations) or the queue is full, callers
+    fall back to adding the row to their own transaction.
+    """
+
+    def __init__(
+        self,
+        *,
+        batch_size: int,
+        flush_interval_seconds: float,
+        copy_threshold: int = 0,
+        max_size: int = 0,
+    ) -> None:
+        self.batch_size = max(batch_size, 1)
+        self.flush_interval_seconds = max(flush_interval_seconds, 0.0)
+        # Batches at least this large are written with COPY instead of INSERT (0 = never).
+        self.copy_threshold = max(copy_threshold, 0)
+        # Rows waiting for the worker are capped at this many (0 = unbounded).
+        self.max_size = max(max_size, 0)
+        self._queue: asyncio.Queue[dict[str, Any] | None] | None = None
+        self._task: asyncio.Task | None = None
+        self._overflow_tasks: set[asyncio.Task] = set()
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def defer(self, db: AsyncSession, values: dict[str, Any]) -> bool:
+        sync_session = getattr(db, "sync_session", None)
+        if not self.running or not isinstance(sync_session, Session):
+            return False
+        if self._queue.full():
+            # Backpressure: write this row inline with the request instead of queueing it.
+            return False
+        values.setdefault("created_at", datetime.now(timezone.utc))
+        sync_session.info.setdefault(_PENDING_KEY, []).append(values)
+        return True
+
+    def enqueue(self, rows: list[dict[str, Any]]) -> None:
+        if self._queue is None:
+            logger.error("Audit log queue is not running; dropping %s audit rows", len(rows))
+            return
+        overflow: list[dict[str, Any]] = []
+        for row in rows:
+            try:
+                self._queue.put_nowait(row)
+            except asyncio.QueueFull:
+                overflow.append(row)
+        if overflow:
+            # The request has already committed, so rows that no longer fit are written
+            # directly rather than dropped.
+            task = asyncio.get_running_loop().create_task(self._write_batch(overflow))
+            self._overflow_tasks.add(task)
+            task.add_done_callback(self._overflow_tasks.discard)
+
+    async def start(self) -> None:
+        if self.running:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_size)
+        self._task = asyncio.create_task(self._run(), name="audit-log-queue")
+
+    async def stop(self) -> None:
+        if self._task is None or self._queue is None:
+            return
+        await self._queue.put(None)
+        try:
+            await self._task
+            if self._overflow_tasks:
+                await asyncio.gather(*self._overflow_tasks)
+        finally:
+            leftover = self._drain(self._queue.qsize())
+            if leftover:
+                await self._write_batch(leftover)
+            self._task = None
+            self._queue = None
+
+    def _drain(self, limit: int) -> list[dict[str, Any]]:
+        rows: list[dict[str, Any]] = []
+        while len(rows) < limit:
+            try:
+                row = self._queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            if row is not None:
+                rows.append(row)
+        return rows
+
+    async def _run(self) -> None:
+        queue = self._queue
+        while True:
+            first = await queue.get()
+            if first is None:
+                return
+            if self.flush_interval_seconds:
+                await asyncio.sleep(self.flush_interval_seconds)
+            batch = [first]
+            stop_requested = False
+            while len(batch) < self.batch_size:
+                try:
+                    row = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+                if row is None:
+                    stop_requested = True
+                    break
+                batch.append(row)
+            await self._write_batch(batch)
+            if stop_requested:
+                return
+
+    async def _write_batch(self, rows: list[dict[str, Any]]) -> None:
+        for start in range(0, len(rows), self.batch_size):
+            chunk = rows[start : start + self.batch_size]
+            try:
+                async with AsyncSessionLocal() as db:
+                    if self.copy_threshold and len(chunk) >= self.copy_threshold:
+                        await _copy_rows(db, chunk)
+                    else:
+                        await db.execute(insert(AuditLog), chunk)
+                    await db.commit()  # commit-ok: background audit writer owns its session
+            except (SQLAlchemyError, psycopg.Error):
+                logger.exception("Failed to write %s audit log rows", len(chunk))
+
+
+_COPY_COLUMNS = tuple(column.name for column in AuditLog.__table__.columns)
+_JSON_COLUMNS = frozenset(
+    column.name for column in AuditLog.__table__.columns if isinstance(column.type, JSON)
+)
+_COPY_SQL = f"COPY {AuditLog.__tablename__} ({', '.join(_COPY_COLUMNS)}) FROM STDIN"
+
+
+async def _copy_rows(db: AsyncSession, rows: list[dict[str, Any]]) -> None:
+    """Stream a large batch with COPY ... FROM STDIN on the session's psycopg connection."""
+    connection = await db.connection()
+    raw_connection = await connection.get_raw_connection()
+    async with raw_connection.driver_connection.cursor() as cursor:
+        async with cursor.copy(_COPY_SQL) as copy:
+            for row in rows:
+                await copy.write_row(
+                    tuple(_copy_value(row, name) for name in _COPY_COLUMNS)
+                )
+
+
+def _copy_value(row: dict[str, Any], name: str) -> Any:
+    value = row.get(name)
+    if value is None and name == "id":
+        return uuid.uuid4()
+    if value is None and name == "created_at":
+        return datetime.now(timezone.utc)
+    if name in _JSON_COLUMNS and name in row:
+        # An explicit None is JSON 'null', as the INSERT path binds it.
+        return Json(value)
+    return value
+
+
+audit_log_queue = AuditLogQueue(
+    batch_size=settings.audit_queue_batch_size,
+    flush_interval_seconds=settings.audit_queue_flush_interval_ms / 1000,
+    copy_threshold=settings.audit_queue_copy_threshold,
+    max_size=settings.audit_queue_max_size,
+)
+
+
+@event.listens_for(Session, "after_commit")
+def _enqueue_committed_audit_logs(session: Session) -> None:
+    rows = session.info.pop(_PENDING_KEY, None)
+    if rows:
+        audit_log_queue.enqueue(rows)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back_audit_logs(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
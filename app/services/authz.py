@@ -151,6 +151,29 @@ async def _load_acl_permissions(
     return allow_set, deny_set
 
 
+async def _get_request_permissions(
+    user: User, ctx: "TenantContext", db: AsyncSession
+) -> frozenset[str]:
+    """Resolve role-bucket permissions once per request and reuse them for later checks."""
+    user_key = str(user.id)
+    cached = ctx.permission_cache.get(user_key)
+    if cached is not None:
+        return cached
+
+    # Try Redis cache first
+    redis = get_redis_client()
+    permission_set = await _get_cached_permissions(redis, user_key, ctx.org_id)
+
+    if permission_set is None:
+        # Cache miss, load from DB and cache
+        permission_set = await _load_permissions_from_db(db, user.id, ctx.org_id)
+        await _cache_permissions(redis, user_key, ctx.org_id, permission_set)
+
+    resolved = frozenset(permission_set)
+    ctx.permission_cache[user_key] = resolved
+    return resolved
+
+
 async def check_permission(
     user: User,
     ctx: "TenantContext",
@@ -184,21 +207,13 @@ async def check_permission(
         else str(permission_code)
     )
 
-    # Try Redis cache first
-    redis = get_redis_client()
-    permission_set = await _get_cached_permissions(redis, str(user.id), ctx.org_id)
-
-    if permission_set is None:
-        # Cache miss, load from DB and cache
-        permission_set = await _load_permissions_from_db(db, user.id, ctx.org_id)
-        await _cache_permissions(redis, str(user.id), ctx.org_id, permission_set)
+    permission_set = await _get_request_permissions(user, ctx, db)
 
     if resource_type and resource_id:
         allow_acl, deny_acl = await _load_acl_permissions(
             db, user.id, ctx.org_id, resource_type, resource_id
         )
-        permission_set.update(allow_acl)
-        permission_set.difference_update(deny_acl)
+        return target in (permission_set | allow_acl) - deny_acl
     return target in permission_set
 
 
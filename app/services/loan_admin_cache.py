@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import logging
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, TypeVar
+
+from pydantic import BaseModel
+from redis.exceptions import RedisError
+
+from app.utils.redis_client import get_redis_client, redis_key
+
+
+CACHE_TTL_SECONDS = 30
+logger = logging.getLogger(__name__)
+
+ResponseT = TypeVar("ResponseT", bound=BaseModel)
+
+
+def _generation_key(org_id: str) -> str:
+    return redis_key("loan_admin", org_id, "generation")
+
+
+def _param_value(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, Enum):
+        return str(value.value)
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return ",".join(sorted(_param_value(item) for item in value))
+    return str(value)
+
+
+def _cache_key(org_id: str, generation: str, view: str, params: dict[str, Any]) -> str:
+    parts = [f"{name}={_param_value(params[name])}" for name in sorted(params)]
+    return redis_key("loan_admin", org_id, generation, view, *parts)
+
+
+async def get_cached_response(
+    org_id: str, view: str, params: dict[str, Any], response_type: type[ResponseT]
+) -> tuple[ResponseT | None, str | None]:
+    """Return the cached response (if any) and the key a fresh response should be stored under.
+
+    Keys embed the org's current cache generation, so a write that bumps the generation
+    orphans every cached view for that org, including ones being computed concurrently.
+    The key is None when Redis is unavailable, in which case nothing should be stored.
+    """
+    try:
+        redis = get_redis_client()
+        generation = await redis.get(_generation_key(org_id)) or "0"
+        key = _cache_key(org_id, generation, view, params)
+        cached = await redis.get(key)
+        if cached:
+            return response_type.model_validate_json(cached), key
+        return None, key
+    except (RedisError, ValueError) as exc:
+        logger.warning("Loan admin cache read failed: %s", exc)
+        return None, None
+
+
+async def set_cached_response(key: str | None, response: BaseModel) -> None:
+    if key is None:
+        return None
+    try:
+        redis = get_redis_client()
+        await redis.setex(key, CACHE_TTL_SECONDS, response.model_dump_json())
+    except RedisError as exc:
+        logger.warning("Loan admin cache write failed: %s", exc)
+        return None
+
+
+async def invalidate_loan_admin_cache(org_id: str) -> None:
+    try:
+        redis = get_redis_client()
+        await redis.incr(_generation_key(org_id))
+    except RedisError as exc:
+        logger.warning("Loan admin cache invalidation failed: %s", exc)
+        return None
@@ -37,6 +37,7 @@ from app.services import (
     vesting_engine,
 )
 from app.services.org_scoping import membership_join_condition, profile_join_condition
+from app.services.pagination import fetch_page_with_total
 from app.services.audit import record_audit_log
 from app.services.storage.adapter import GCSStorageAdapter, LocalFileSystemAdapter
 from app.core.settings import settings
@@ -451,6 +452,12 @@ async def get_membership_with_user(
     return membership, user, department, profile
 
 
+_APPLICATION_RELATED_OPTIONS = (
+    selectinload(LoanApplication.workflow_stages),
+    selectinload(LoanApplication.documents).selectinload(LoanDocument.uploaded_by_user),
+)
+
+
 async def get_application_with_related(
     db: AsyncSession,
     ctx: deps.TenantContext,
@@ -460,10 +467,7 @@ async def get_application_with_related(
 ) -> LoanApplication | None:
     stmt = (
         select(LoanApplication)
-        .options(
-            selectinload(LoanApplication.workflow_stages),
-            selectinload(LoanApplication.documents).selectinload(LoanDocument.uploaded_by_user),
-        )
+        .options(*_APPLICATION_RELATED_OPTIONS)
         .where(
             LoanApplication.org_id == ctx.org_id,
             LoanApplication.id == application_id,
@@ -475,6 +479,45 @@ async def get_application_with_related(
     return result.scalar_one_or_none()
 
 
+async def get_application_with_applicant(
+    db: AsyncSession,
+    ctx: deps.TenantContext,
+    application_id,
+) -> tuple[
+    LoanApplication,
+    tuple[OrgMembership, User, Department | None, OrgUserProfile | None] | None,
+] | None:
+    """Like get_application_with_related, with the applicant's membership, user,
+    department and profile joined into the same SELECT instead of a second query."""
+    stmt = (
+        select(LoanApplication, OrgMembership, User, Department, OrgUserProfile)
+        .outerjoin(
+            OrgMembership,
+            membership_join_condition(
+                OrgMembership, LoanApplication.org_id, LoanApplication.org_membership_id
+            ),
+        )
+        .outerjoin(User, User.id == OrgMembership.user_id)
+        .outerjoin(Department, Department.id == OrgMembership.department_id)
+        .outerjoin(
+            OrgUserProfile,
+            profile_join_condition(OrgMembership, OrgUserProfile),
+        )
+        .options(*_APPLICATION_RELATED_OPTIONS)
+        .where(
+            LoanApplication.org_id == ctx.org_id,
+            LoanApplication.id == application_id,
+        )
+    )
+    row = (await db.execute(stmt)).first()
+    if not row:
+        return None
+    application, membership, user, department, profile = row
+    if membership is None or user is None:
+        return application, None
+    return application, (membership, user, department, profile)
+
+
 async def list_admin_applications(
     db: AsyncSession,
     ctx: deps.TenantContext,
@@ -532,8 +575,6 @@ async def list_admin_applications(
             .join(LoanWorkflowStage, LoanWorkflowStage.loan_application_id == LoanApplication.id)
             .where(*conditions)
         )
-        count_result = await db.execute(count_stmt)
-        total = int(count_result.scalar_one() or 0)
 
         stmt = (
             select(
@@ -583,8 +624,6 @@ async def list_admin_applications(
         )
     else:
         count_stmt = select(func.count()).select_from(LoanApplication).where(*conditions)
-        count_result = await db.execute(count_stmt)
-        total = int(count_result.scalar_one() or 0)
 
         stmt = (
             select(
@@ -632,9 +671,7 @@ async def list_admin_applications(
             .offset(offset)
         )
 
-    result = await db.execute(stmt)
-    rows = result.all()
-    return rows, total
+    return await fetch_page_with_total(db, stmt, count_stmt, offset=offset)
 
 
 def _normalize_status_values(statuses: list[LoanApplicationStatus] | list[str]) -> list[str]:
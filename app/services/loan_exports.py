@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import csv
+from collections.abc import Iterable, Iterator
 from io import StringIO
 from decimal import Decimal
 
@@ -8,6 +9,36 @@ from app.models.loan_application import LoanApplication
 from app.schemas.loan import LoanScheduleResponse
 
 
+CSV_CHUNK_ROWS = 100
+
+_SCHEDULE_HEADERS = [
+    "period",
+    "due_date",
+    "payment",
+    "principal",
+    "interest",
+    "remaining_balance",
+]
+
+_LOAN_EXPORT_HEADERS = [
+    "loan_id",
+    "status",
+    "decision_reason",
+    "as_of_date",
+    "principal",
+    "annual_rate_percent",
+    "repayment_method",
+    "term_months",
+    "estimated_monthly_payment",
+    "period",
+    "due_date",
+    "payment",
+    "principal_payment",
+    "interest_payment",
+    "remaining_balance",
+]
+
+
 def _stringify(value) -> str:
     if isinstance(value, Decimal):
         return str(value)
@@ -16,76 +47,68 @@ def _stringify(value) -> str:
     return str(value)
 
 
-def _write_csv(headers: list[str], rows: list[list[str]]) -> str:
+def _iter_csv(headers: list[str], rows: Iterable[list[str]]) -> Iterator[str]:
+    """Encode rows as CSV, yielding one chunk per CSV_CHUNK_ROWS rows."""
     buffer = StringIO()
     writer = csv.writer(buffer)
     writer.writerow(headers)
+    pending = 0
     for row in rows:
         writer.writerow(row)
-    return buffer.getvalue()
+        pending += 1
+        if pending >= CSV_CHUNK_ROWS:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+    tail = buffer.getvalue()
+    if tail:
+        yield tail
 
 
-def schedule_to_csv(schedule: LoanScheduleResponse) -> str:
-    headers = [
-        "period",
-        "due_date",
-        "payment",
-        "principal",
-        "interest",
-        "remaining_balance",
-    ]
-    rows: list[list[str]] = []
+def _schedule_rows(schedule: LoanScheduleResponse) -> Iterator[list[str]]:
     for entry in schedule.entries:
-        rows.append(
-            [
-                str(entry.period),
-                entry.due_date.isoformat() if entry.due_date else "",
-                _stringify(entry.payment),
-                _stringify(entry.principal),
-                _stringify(entry.interest),
-                _stringify(entry.remaining_balance),
-            ]
-        )
-    return _write_csv(headers, rows)
+        yield [
+            str(entry.period),
+            entry.due_date.isoformat() if entry.due_date else "",
+            _stringify(entry.payment),
+            _stringify(entry.principal),
+            _stringify(entry.interest),
+            _stringify(entry.remaining_balance),
+        ]
 
 
-def loan_export_to_csv(application: LoanApplication, schedule: LoanScheduleResponse) -> str:
-    headers = [
-        "loan_id",
-        "status",
-        "decision_reason",
-        "as_of_date",
-        "principal",
-        "annual_rate_percent",
-        "repayment_method",
-        "term_months",
-        "estimated_monthly_payment",
-        "period",
-        "due_date",
-        "payment",
-        "principal_payment",
-        "interest_payment",
-        "remaining_balance",
+def _loan_export_rows(
+    application: LoanApplication, schedule: LoanScheduleResponse
+) -> Iterator[list[str]]:
+    loan_columns = [
+        str(application.id),
+        application.status,
+        _stringify(application.decision_reason),
+        schedule.as_of_date.isoformat() if schedule.as_of_date else "",
+        _stringify(schedule.principal),
+        _stringify(schedule.annual_rate_percent),
+        schedule.repayment_method,
+        str(schedule.term_months),
+        _stringify(schedule.estimated_monthly_payment),
     ]
-    rows: list[list[str]] = []
-    for entry in schedule.entries:
-        rows.append(
-            [
-                str(application.id),
-                application.status,
-                _stringify(application.decision_reason),
-                schedule.as_of_date.isoformat() if schedule.as_of_date else "",
-                _stringify(schedule.principal),
-                _stringify(schedule.annual_rate_percent),
-                schedule.repayment_method,
-                str(schedule.term_months),
-                _stringify(schedule.estimated_monthly_payment),
-                str(entry.period),
-                entry.due_date.isoformat() if entry.due_date else "",
-                _stringify(entry.payment),
-                _stringify(entry.principal),
-                _stringify(entry.interest),
-                _stringify(entry.remaining_balance),
-            ]
-        )
-    return _write_csv(headers, rows)
+    for entry_columns in _schedule_rows(schedule):
+        yield loan_columns + entry_columns
+
+
+def schedule_to_csv_iter(schedule: LoanScheduleResponse) -> Iterator[str]:
+    return _iter_csv(_SCHEDULE_HEADERS, _schedule_rows(schedule))
+
+
+def schedule_to_csv(schedule: LoanScheduleResponse) -> str:
+    return "".join(schedule_to_csv_iter(schedule))
+
+
+def loan_export_to_csv_iter(
+    application: LoanApplication, schedule: LoanScheduleResponse
+) -> Iterator[str]:
+    return _iter_csv(_LOAN_EXPORT_HEADERS, _loan_export_rows(application, schedule))
+
+
+def loan_export_to_csv(application: LoanApplication, schedule: LoanScheduleResponse) -> str:
+    return "".join(loan_export_to_csv_iter(application, schedule))
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import bindparam, func, select
 from sqlalchemy.orm import aliased
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -15,6 +15,7 @@ from app.models.org_user_profile import OrgUserProfile
 from app.models.user import User
 from app.schemas.loan import LoanApplicationStatus
 from app.services.org_scoping import membership_join_condition, profile_join_condition
+from app.services.pagination import fetch_page_with_total
 
 
 QUEUE_STATUSES = {
@@ -23,6 +24,77 @@ QUEUE_STATUSES = {
 }
 
 
+_ASSIGNED_USER = aliased(User)
+_ASSIGNED_MEMBERSHIP = aliased(OrgMembership)
+_APPLICANT_PROFILE = aliased(OrgUserProfile)
+_ASSIGNED_PROFILE = aliased(OrgUserProfile)
+
+_QUEUE_CONDITIONS = (
+    LoanApplication.org_id == bindparam("org_id"),
+    LoanWorkflowStage.org_id == bindparam("org_id"),
+    LoanWorkflowStage.loan_application_id == LoanApplication.id,
+    LoanWorkflowStage.stage_type == bindparam("stage_type"),
+    LoanWorkflowStage.status != "COMPLETED",
+    LoanApplication.status.in_(sorted(QUEUE_STATUSES)),
+)
+_ASSIGNEE_CONDITION = LoanWorkflowStage.assigned_to_user_id == bindparam("assigned_to_user_id")
+
+# Queue statements are built once at import; callers only bind org, stage and assignee.
+_QUEUE_COUNT_STMT = (
+    select(func.count())
+    .select_from(LoanApplication)
+    .join(LoanWorkflowStage, LoanWorkflowStage.loan_application_id == LoanApplication.id)
+    .where(*_QUEUE_CONDITIONS)
+)
+
+_QUEUE_PAGE_STMT = (
+    select(
+        LoanApplication,
+        OrgMembership,
+        User,
+        Department,
+        LoanWorkflowStage.stage_type,
+        LoanWorkflowStage.status,
+        _ASSIGNED_USER,
+        LoanWorkflowStage.assigned_at,
+        _APPLICANT_PROFILE,
+        _ASSIGNED_PROFILE,
+    )
+    .join(LoanWorkflowStage, LoanWorkflowStage.loan_application_id == LoanApplication.id)
+    .join(
+        OrgMembership,
+        membership_join_condition(
+            OrgMembership, LoanApplication.org_id, LoanApplication.org_membership_id
+        ),
+    )
+    .join(User, User.id == OrgMembership.user_id)
+    .outerjoin(Department, Department.id == OrgMembership.department_id)
+    .outerjoin(
+        _APPLICANT_PROFILE,
+        profile_join_condition(OrgMembership, _APPLICANT_PROFILE),
+    )
+    .outerjoin(
+        _ASSIGNED_USER,
+        (_ASSIGNED_USER.id == LoanWorkflowStage.assigned_to_user_id)
+        & (_ASSIGNED_USER.org_id == bindparam("org_id")),
+    )
+    .outerjoin(
+        _ASSIGNED_MEMBERSHIP,
+        (_ASSIGNED_MEMBERSHIP.user_id == _ASSIGNED_USER.id)
+        & (_ASSIGNED_MEMBERSHIP.org_id == bindparam("org_id")),
+    )
+    .outerjoin(
+        _ASSIGNED_PROFILE,
+        profile_join_condition(_ASSIGNED_MEMBERSHIP, _ASSIGNED_PROFILE),
+    )
+    .where(*_QUEUE_CONDITIONS)
+    .order_by(LoanApplication.created_at.desc())
+)
+
+_ASSIGNED_QUEUE_COUNT_STMT = _QUEUE_COUNT_STMT.where(_ASSIGNEE_CONDITION)
+_ASSIGNED_QUEUE_PAGE_STMT = _QUEUE_PAGE_STMT.where(_ASSIGNEE_CONDITION)
+
+
 async def list_queue(
     db: AsyncSession,
     ctx: deps.TenantContext,
@@ -32,75 +104,12 @@ async def list_queue(
     offset: int,
     assigned_to_user_id: UUID | None = None,
 ) -> tuple[list[tuple], int]:
-    conditions = [
-        LoanApplication.org_id == ctx.org_id,
-        LoanWorkflowStage.org_id == ctx.org_id,
-        LoanWorkflowStage.loan_application_id == LoanApplication.id,
-        LoanWorkflowStage.stage_type == stage_type,
-        LoanWorkflowStage.status != "COMPLETED",
-        LoanApplication.status.in_(QUEUE_STATUSES),
-    ]
-    if assigned_to_user_id is not None:
-        conditions.append(LoanWorkflowStage.assigned_to_user_id == assigned_to_user_id)
-
-    count_stmt = (
-        select(func.count())
-        .select_from(LoanApplication)
-        .join(LoanWorkflowStage, LoanWorkflowStage.loan_application_id == LoanApplication.id)
-        .where(*conditions)
-    )
-    count_result = await db.execute(count_stmt)
-    total = int(count_result.scalar_one() or 0)
-
-    assigned_user = aliased(User)
-    assigned_membership = aliased(OrgMembership)
-    applicant_profile = aliased(OrgUserProfile)
-    assigned_profile = aliased(OrgUserProfile)
-    stmt = (
-        select(
-            LoanApplication,
-            OrgMembership,
-            User,
-            Department,
-            LoanWorkflowStage.stage_type,
-            LoanWorkflowStage.status,
-            assigned_user,
-            LoanWorkflowStage.assigned_at,
-            applicant_profile,
-            assigned_profile,
-        )
-        .join(LoanWorkflowStage, LoanWorkflowStage.loan_application_id == LoanApplication.id)
-        .join(
-            OrgMembership,
-            membership_join_condition(
-                OrgMembership, LoanApplication.org_id, LoanApplication.org_membership_id
-            ),
-        )
-        .join(User, User.id == OrgMembership.user_id)
-        .outerjoin(Department, Department.id == OrgMembership.department_id)
-        .outerjoin(
-            applicant_profile,
-            profile_join_condition(OrgMembership, applicant_profile),
-        )
-        .outerjoin(
-            assigned_user,
-            (assigned_user.id == LoanWorkflowStage.assigned_to_user_id)
-            & (assigned_user.org_id == ctx.org_id),
-        )
-        .outerjoin(
-            assigned_membership,
-            (assigned_membership.user_id == assigned_user.id)
-            & (assigned_membership.org_id == ctx.org_id),
-        )
-        .outerjoin(
-            assigned_profile,
-            profile_join_condition(assigned_membership, assigned_profile),
-        )
-        .where(*conditions)
-        .order_by(LoanApplication.created_at.desc())
-        .limit(limit)
-        .offset(offset)
+    params = {"org_id": ctx.org_id, "stage_type": stage_type}
+    if assigned_to_user_id is None:
+        stmt, count_stmt = _QUEUE_PAGE_STMT, _QUEUE_COUNT_STMT
+    else:
+        stmt, count_stmt = _ASSIGNED_QUEUE_PAGE_STMT, _ASSIGNED_QUEUE_COUNT_STMT
+        params["assigned_to_user_id"] = assigned_to_user_id
+    return await fetch_page_with_total(
+        db, stmt.limit(limit).offset(offset), count_stmt, offset=offset, params=params
     )
-    result = await db.execute(stmt)
-    rows = result.all()
-    return rows, total
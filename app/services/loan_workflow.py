@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone
+from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api import deps
@@ -14,7 +15,19 @@ from app.services import stock_reservations
 from app.services.audit import model_snapshot, record_audit_log
 
 
-CORE_STAGE_TYPES = {"HR_REVIEW", "FINANCE_PROCESSING", "LEGAL_EXECUTION"}
+CORE_STAGE_TYPES = frozenset({"HR_REVIEW", "FINANCE_PROCESSING", "LEGAL_EXECUTION"})
+
+# Statuses a loan can be activated from once its core stages are complete.
+_ACTIVATABLE_STATUSES = frozenset(
+    {
+        LoanApplicationStatus.SUBMITTED.value,
+        LoanApplicationStatus.IN_REVIEW.value,
+        "PENDING",
+    }
+)
+# Statuses activate_backlog revisits: activatable loans plus active ones that may
+# still need their post-issuance stages backfilled.
+_BACKLOG_STATUSES = tuple(sorted(_ACTIVATABLE_STATUSES | {LoanApplicationStatus.ACTIVE.value}))
 
 
 POST_ACTIVATION_STAGES: list[tuple[str, str]] = [
@@ -34,11 +47,7 @@ async def try_activate_loan(
     await db.flush()
     if application.status == LoanApplicationStatus.ACTIVE.value:
         return False
-    if application.status not in {
-        LoanApplicationStatus.SUBMITTED.value,
-        LoanApplicationStatus.IN_REVIEW.value,
-        "PENDING",
-    }:
+    if application.status not in _ACTIVATABLE_STATUSES:
         return False
 
     stage_stmt = select(LoanWorkflowStage).where(
@@ -114,6 +123,22 @@ async def _ensure_post_activation_stages(
         )
 
 
+async def try_lock_backlog_run(db: AsyncSession, ctx: deps.TenantContext) -> bool:
+    """Take the org's backlog-activation advisory lock for the current transaction.
+
+    Returns False when another transaction already holds it. The lock is released
+    automatically on commit or rollback.
+    """
+    result = await db.execute(
+        select(
+            func.pg_try_advisory_xact_lock(
+                func.hashtext("loan_activate_backlog"), func.hashtext(ctx.org_id)
+            )
+        )
+    )
+    return bool(result.scalar_one())
+
+
 async def activate_backlog(
     db: AsyncSession,
     ctx: deps.TenantContext,
@@ -122,21 +147,12 @@ async def activate_backlog(
     limit: int | None = None,
     offset: int = 0,
     actor_id=None,
-) -> tuple[int, int, list[str], list[str]]:
+) -> tuple[int, int, list[UUID], list[UUID]]:
     conditions = [LoanApplication.org_id == ctx.org_id]
     if loan_id:
         conditions.append(LoanApplication.id == loan_id)
     else:
-        conditions.append(
-            LoanApplication.status.in_(
-                [
-                    LoanApplicationStatus.SUBMITTED.value,
-                    LoanApplicationStatus.IN_REVIEW.value,
-                    "PENDING",
-                    LoanApplicationStatus.ACTIVE.value,
-                ]
-            )
-        )
+        conditions.append(LoanApplication.status.in_(_BACKLOG_STATUSES))
     stmt = select(LoanApplication).where(*conditions).order_by(LoanApplication.created_at.asc())
     if limit is not None:
         stmt = stmt.limit(limit)
@@ -144,13 +160,13 @@ async def activate_backlog(
         stmt = stmt.offset(offset)
 
     applications = (await db.execute(stmt)).scalars().all()
-    activated_ids: list[str] = []
-    post_issuance_completed_ids: list[str] = []
+    activated_ids: list[UUID] = []
+    post_issuance_completed_ids: list[UUID] = []
     for application in applications:
         if await try_activate_loan(db, ctx, application, actor_id=actor_id):
-            activated_ids.append(str(application.id))
+            activated_ids.append(application.id)
         if await _backfill_post_issuance_stage(db, ctx, application, actor_id=actor_id):
-            post_issuance_completed_ids.append(str(application.id))
+            post_issuance_completed_ids.append(application.id)
 
     if activated_ids or post_issuance_completed_ids:
         await db.flush()
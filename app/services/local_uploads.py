@@ -1,11 +1,19 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import os
+from collections.abc import Callable, Collection, Mapping
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from uuid import uuid4
 from uuid import UUID
 
-from fastapi import UploadFile
+from fastapi import Request, UploadFile
+from python_multipart.multipart import MultipartParser, parse_options_header
 
+from app.core.settings import settings
 from app.core.tenant import normalize_org_id
 
 
@@ -26,6 +34,13 @@ _MAGIC_SIGNATURES: dict[str, list[bytes]] = {
 # Extensions whose content can execute scripts when rendered in a browser.
 _DANGEROUS_EXTENSIONS = {".html", ".htm", ".svg", ".xhtml", ".js", ".mjs", ".xml"}
 
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Limits for hand-parsed multipart bodies, mirroring Starlette's form parser defaults
+# (max_fields=1000, one file part here) plus a cap on each part's header block.
+MULTIPART_MAX_FIELDS = 1000
+MULTIPART_MAX_PART_HEADER_BYTES = 16 * 1024
+
 
 def _validate_content_type(header_bytes: bytes, ext: str) -> None:
     """Validate that file content matches claimed extension via magic bytes.
@@ -45,6 +60,14 @@ def _validate_content_type(header_bytes: bytes, ext: str) -> None:
         )
 
 
+@dataclass(frozen=True, slots=True)
+class SavedUpload:
+    relative_path: str
+    original_name: str
+    size_bytes: int
+    checksum: str
+
+
 def _safe_filename(filename: str | None, fallback: str) -> str:
     if not filename:
         return fallback
@@ -55,70 +78,364 @@ async def save_upload(
     file: UploadFile,
     base_dir: Path,
     subdir: Path,
-    allowed_extensions: set[str] | None = None,
+    allowed_extensions: Collection[str] | None = None,
     max_size_bytes: int = 0,
 ) -> tuple[str, str]:
-    base_dir = base_dir.resolve()
-    dest_dir = (base_dir / subdir).resolve()
-    if base_dir not in dest_dir.parents and base_dir != dest_dir:
-        raise ValueError("Invalid upload path")
-    dest_dir.mkdir(parents=True, exist_ok=True)
+    saved = await save_upload_with_checksum(
+        file,
+        base_dir=base_dir,
+        subdir=subdir,
+        allowed_extensions=allowed_extensions,
+        max_size_bytes=max_size_bytes,
+    )
+    return saved.relative_path, saved.original_name
+
+
+async def save_upload_with_checksum(
+    file: UploadFile,
+    base_dir: Path,
+    subdir: Path,
+    allowed_extensions: Collection[str] | None = None,
+    max_size_bytes: int = 0,
+) -> SavedUpload:
+    """Stream an upload to disk in 1 MiB chunks, hashing it (SHA-256) in the same pass."""
+    base_dir = _resolve_base_dir(base_dir)
+    dest_dir = _resolve_dest_dir(base_dir, subdir)
 
     original_name = _safe_filename(file.filename, "upload.bin")
     ext = Path(original_name).suffix.lower()
+    _check_extension(ext, allowed_extensions)
 
-    if allowed_extensions:
-        # Normalize allowed extensions to lowercase and ensure dot prefix
-        normalized_allowed = {e if e.startswith(".") else f".{e}" for e in allowed_extensions}
-        # Special handling for jpeg/jpg
-        if ".jpeg" in normalized_allowed:
-            normalized_allowed.add(".jpg")
-        if ".jpg" in normalized_allowed:
-            normalized_allowed.add(".jpeg")
+    sink = _UploadSink(dest_dir / f"{uuid4().hex}{ext}", ext, max_size_bytes)
+    writing: asyncio.Future | None = None
+    try:
+        while True:
+            chunk = await file.read(UPLOAD_CHUNK_SIZE)
+            if not chunk:
+                break
+            writing = _start_in_worker(sink.write, chunk)
+            await asyncio.shield(writing)
+        writing = _start_in_worker(sink.finish)
+        checksum = await asyncio.shield(writing)
+    except BaseException:
+        # Clean up the partial file on validation, I/O or cancellation, once the
+        # worker thread is done with it.
+        if writing is not None and not writing.done():
+            await asyncio.wait({writing})
+        sink.discard()
+        raise
+    finally:
+        await file.close()
 
-        if ext not in normalized_allowed:
-            raise ValueError(
-                f"File type not allowed. Allowed extensions: {', '.join(sorted(normalized_allowed))}"
-            )
+    return SavedUpload(
+        relative_path=sink.dest_path.relative_to(base_dir).as_posix(),
+        original_name=original_name,
+        size_bytes=sink.size_bytes,
+        checksum=checksum,
+    )
 
-    dest_name = f"{uuid4().hex}{ext}"
-    dest_path = dest_dir / dest_name
-    bytes_written = 0
 
+async def stream_multipart_upload(
+    request: Request,
+    base_dir: Path,
+    subdir: Path,
+    *,
+    file_field: str = "file",
+    allowed_extensions: Collection[str] | None = None,
+    max_size_bytes: int = 0,
+    max_field_bytes: int = 64 * 1024,
+    max_fields: int = MULTIPART_MAX_FIELDS,
+    max_part_header_bytes: int = MULTIPART_MAX_PART_HEADER_BYTES,
+    field_validators: Mapping[str, Callable[[str], object]] | None = None,
+) -> tuple[dict[str, str], SavedUpload]:
+    """Parse a multipart/form-data body straight off ``request.stream()``.
+
+    The ``file_field`` part is written to disk chunk by chunk as it arrives instead
+    of being spooled to a temporary file first; every other part is returned as a
+    small text field. Fields named in ``field_validators`` are checked as soon as
+    they are read and must precede the file part, so a bad value is rejected before
+    anything is written. Raises ValueError for malformed bodies or rejected files.
+    """
+    content_type, params = parse_options_header(request.headers.get("content-type"))
+    boundary = params.get(b"boundary")
+    if content_type != b"multipart/form-data" or not boundary:
+        raise ValueError("Expected a multipart/form-data request body")
+
+    base_dir = _resolve_base_dir(base_dir)
+    dest_dir = _resolve_dest_dir(base_dir, subdir)
+    reader = _MultipartUploadReader(
+        dest_dir,
+        file_field=file_field,
+        allowed_extensions=allowed_extensions,
+        max_size_bytes=max_size_bytes,
+        max_field_bytes=max_field_bytes,
+        max_fields=max_fields,
+        max_part_header_bytes=max_part_header_bytes,
+        field_validators=field_validators or {},
+    )
+    parser = MultipartParser(boundary, reader.callbacks())
+    pending: list[bytes] = []
+    pending_size = 0
+    writing: asyncio.Future | None = None
     try:
-        with dest_path.open("wb") as handle:
-            first_chunk = await file.read(1024 * 1024)
-            if first_chunk:
-                _validate_content_type(first_chunk, ext)
-                bytes_written += len(first_chunk)
-                if max_size_bytes and bytes_written > max_size_bytes:
-                    raise ValueError(
-                        f"File exceeds maximum allowed size of {max_size_bytes // (1024 * 1024)} MB"
-                    )
-                handle.write(first_chunk)
-            while True:
-                chunk = await file.read(1024 * 1024)
-                if not chunk:
-                    break
-                bytes_written += len(chunk)
-                if max_size_bytes and bytes_written > max_size_bytes:
-                    raise ValueError(
-                        f"File exceeds maximum allowed size of {max_size_bytes // (1024 * 1024)} MB"
-                    )
-                handle.write(chunk)
-    except ValueError:
-        # Clean up partial file on validation/size failure
-        dest_path.unlink(missing_ok=True)
+        # Parsing, hashing and disk writes run in a worker thread, fed ~1 MiB at a
+        # time so the event loop never blocks on the filesystem. Joining the pending
+        # chunks is the only copy; a single large chunk is passed through as is.
+        # The next chunk is read from the socket while the previous one is written;
+        # the parser needs the body in order, so one write is in flight at a time.
+        # Writes are awaited through shield() so cancelling the request cannot
+        # abandon a thread that still holds the file.
+        async for chunk in request.stream():
+            pending.append(chunk)
+            pending_size += len(chunk)
+            if pending_size >= UPLOAD_CHUNK_SIZE:
+                if writing is not None:
+                    await asyncio.shield(writing)
+                writing = _start_in_worker(parser.write, b"".join(pending))
+                pending.clear()
+                pending_size = 0
+        if writing is not None:
+            await asyncio.shield(writing)
+        if pending:
+            writing = _start_in_worker(parser.write, b"".join(pending))
+            await asyncio.shield(writing)
+        parser.finalize()
+        writing = _start_in_worker(reader.finish, base_dir)
+        saved = await asyncio.shield(writing)
+    except BaseException:
+        if writing is not None and not writing.done():
+            # asyncio.wait does not cancel what it waits on, so the worker thread is
+            # done with the file before it is deleted.
+            await asyncio.wait({writing})
+        reader.discard()
         raise
-    finally:
-        await file.close()
+    return reader.fields, saved
+
+
+def _start_in_worker(func, *args) -> asyncio.Future:
+    return asyncio.ensure_future(asyncio.to_thread(func, *args))
+
+
+@lru_cache(maxsize=32)
+def _resolve_base_dir(base_dir: Path) -> Path:
+    # Upload roots are fixed configuration; resolving walks every path component with
+    # a syscall, so do it once per root rather than on every upload and download.
+    return base_dir.resolve()
+
+
+def local_upload_base_dir() -> Path:
+    """Resolved LOCAL_UPLOAD_DIR, computed once per configured value."""
+    return _resolve_base_dir(Path(settings.local_upload_dir))
+
+
+def _resolve_dest_dir(base_dir: Path, subdir: Path) -> Path:
+    dest_dir = (base_dir / subdir).resolve()
+    if base_dir not in dest_dir.parents and base_dir != dest_dir:
+        raise ValueError("Invalid upload path")
+    dest_dir.mkdir(parents=True, exist_ok=True)
+    return dest_dir
+
+
+def _check_extension(ext: str, allowed_extensions: Collection[str] | None) -> None:
+    if not allowed_extensions:
+        return
+    # Normalize allowed extensions to lowercase and ensure dot prefix
+    normalized_allowed = {e if e.startswith(".") else f".{e}" for e in allowed_extensions}
+    # Special handling for jpeg/jpg
+    if ".jpeg" in normalized_allowed:
+        normalized_allowed.add(".jpg")
+    if ".jpg" in normalized_allowed:
+        normalized_allowed.add(".jpeg")
+
+    if ext not in normalized_allowed:
+        raise ValueError(
+            f"File type not allowed. Allowed extensions: {', '.join(sorted(normalized_allowed))}"
+        )
+
+
+class _UploadSink:
+    """Size-checks, sniffs, hashes and writes upload bytes as they arrive."""
+
+    # Content is sniffed over the first chunk, as the pre-streaming check did.
+    _SNIFF_BYTES = UPLOAD_CHUNK_SIZE
+
+    def __init__(self, dest_path: Path, ext: str, max_size_bytes: int) -> None:
+        self.dest_path = dest_path
+        self.ext = ext
+        self.max_size_bytes = max_size_bytes
+        self.size_bytes = 0
+        self._head: bytes | None = b""
+        self._hasher = hashlib.sha256()
+        self._handle = dest_path.open("wb")
+
+    def write(self, chunk: bytes | memoryview) -> None:
+        if not chunk:
+            return
+        self.size_bytes += len(chunk)
+        if self.max_size_bytes and self.size_bytes > self.max_size_bytes:
+            raise ValueError(
+                f"File exceeds maximum allowed size of {self.max_size_bytes // (1024 * 1024)} MB"
+            )
+        if self._head is not None:
+            # Hold back the first few bytes until the magic-byte check can run.
+            self._head += bytes(chunk)
+            if len(self._head) < self._SNIFF_BYTES:
+                return
+            chunk, self._head = self._head, None
+            _validate_content_type(chunk, self.ext)
+        self._handle.write(chunk)
+        self._hasher.update(chunk)
+
+    def finish(self) -> str:
+        if self._head:
+            _validate_content_type(self._head, self.ext)
+            self._handle.write(self._head)
+            self._hasher.update(self._head)
+        self._head = None
+        # Make the file durable before the caller commits a row that points at it.
+        self._handle.flush()
+        os.fsync(self._handle.fileno())
+        self._handle.close()
+        return self._hasher.hexdigest()
+
+    def discard(self) -> None:
+        self._handle.close()
+        self.dest_path.unlink(missing_ok=True)
+
+
+class _MultipartUploadReader:
+    """python-multipart callbacks that route one file part into an _UploadSink."""
+
+    def __init__(
+        self,
+        dest_dir: Path,
+        *,
+        file_field: str,
+        allowed_extensions: Collection[str] | None,
+        max_size_bytes: int,
+        max_field_bytes: int,
+        max_fields: int = MULTIPART_MAX_FIELDS,
+        max_part_header_bytes: int = MULTIPART_MAX_PART_HEADER_BYTES,
+        field_validators: Mapping[str, Callable[[str], object]] | None = None,
+    ) -> None:
+        self.dest_dir = dest_dir
+        self.file_field = file_field
+        self.allowed_extensions = allowed_extensions
+        self.max_size_bytes = max_size_bytes
+        self.max_field_bytes = max_field_bytes
+        self.max_fields = max_fields
+        self.max_part_header_bytes = max_part_header_bytes
+        self.field_validators = field_validators or {}
+        self.fields: dict[str, str] = {}
+        self.sink: _UploadSink | None = None
+        self.original_name: str | None = None
+        self._headers: dict[bytes, bytes] = {}
+        self._header_field = b""
+        self._header_value = b""
+        self._header_bytes = 0
+        self._field_count = 0
+        self._field_name: str | None = None
+        self._field_value = bytearray()
+        self._in_file = False
+
+    def callbacks(self) -> dict:
+        return {
+            "on_part_begin": self._on_part_begin,
+            "on_header_field": self._on_header_field,
+            "on_header_value": self._on_header_value,
+            "on_header_end": self._on_header_end,
+            "on_headers_finished": self._on_headers_finished,
+            "on_part_data": self._on_part_data,
+            "on_part_end": self._on_part_end,
+        }
+
+    def _on_part_begin(self) -> None:
+        self._headers = {}
+        self._header_bytes = 0
+        self._field_name = None
+        self._field_value = bytearray()
+        self._in_file = False
+
+    def _on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self._count_header_bytes(end - start)
+        self._header_field += data[start:end]
+
+    def _on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self._count_header_bytes(end - start)
+        self._header_value += data[start:end]
+
+    def _count_header_bytes(self, size: int) -> None:
+        self._header_bytes += size
+        if self._header_bytes > self.max_part_header_bytes:
+            raise ValueError("Multipart part headers are too large")
+
+    def _on_header_end(self) -> None:
+        self._headers[self._header_field.lower()] = self._header_value
+        self._header_field = b""
+        self._header_value = b""
+
+    def _on_headers_finished(self) -> None:
+        _, options = parse_options_header(self._headers.get(b"content-disposition"))
+        name = options.get(b"name")
+        if name is None:
+            raise ValueError("Multipart part is missing a field name")
+        name = name.decode("utf-8", "replace")
+        filename = options.get(b"filename")
+        if filename is None:
+            self._field_count += 1
+            if self._field_count > self.max_fields:
+                raise ValueError(
+                    f"Too many form fields. Maximum number of fields is {self.max_fields}"
+                )
+            self._field_name = name
+            return
+        if name != self.file_field or self.sink is not None:
+            raise ValueError(f"Unexpected file upload in field '{name}'")
+        for field_name in self.field_validators:
+            if field_name not in self.fields:
+                raise ValueError(f"Form field '{field_name}' must be sent before the file")
+        self.original_name = _safe_filename(filename.decode("utf-8", "replace"), "upload.bin")
+        ext = Path(self.original_name).suffix.lower()
+        _check_extension(ext, self.allowed_extensions)
+        self.sink = _UploadSink(self.dest_dir / f"{uuid4().hex}{ext}", ext, self.max_size_bytes)
+        self._in_file = True
+
+    def _on_part_data(self, data: bytes, start: int, end: int) -> None:
+        if self._in_file:
+            # A memoryview slice hands the parser's buffer to the hash and the file
+            # write without copying it again.
+            self.sink.write(memoryview(data)[start:end])
+            return
+        self._field_value += data[start:end]
+        if len(self._field_value) > self.max_field_bytes:
+            raise ValueError(f"Form field '{self._field_name}' is too large")
+
+    def _on_part_end(self) -> None:
+        if self._field_name is not None:
+            value = self._field_value.decode("utf-8", "replace")
+            validator = self.field_validators.get(self._field_name)
+            if validator is not None:
+                validator(value)
+            self.fields[self._field_name] = value
+
+    def finish(self, base_dir: Path) -> SavedUpload:
+        if self.sink is None:
+            raise ValueError(f"Missing file upload in field '{self.file_field}'")
+        checksum = self.sink.finish()
+        return SavedUpload(
+            relative_path=self.sink.dest_path.relative_to(base_dir).as_posix(),
+            original_name=self.original_name,
+            size_bytes=self.sink.size_bytes,
+            checksum=checksum,
+        )
 
-    relative_path = dest_path.relative_to(base_dir).as_posix()
-    return relative_path, original_name
+    def discard(self) -> None:
+        if self.sink is not None:
+            self.sink.discard()
 
 
 def resolve_local_path(base_dir: Path, relative_path: str) -> Path:
-    base_dir = base_dir.resolve()
+    base_dir = _resolve_base_dir(base_dir)
     candidate = (base_dir / relative_path).resolve()
     if base_dir not in candidate.parents and candidate != base_dir:
         raise ValueError("Invalid document path")
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
+
+
+async def fetch_page_with_total(
+    db: AsyncSession,
+    stmt: Select,
+    count_stmt: Select,
+    *,
+    offset: int,
+    params: dict[str, Any] | None = None,
+) -> tuple[list[tuple], int]:
+    """Run a LIMIT/OFFSET page query and return its rows with the unpaged total.
+
+    The total rides along as ``COUNT(*) OVER ()``, so the predicate is evaluated once.
+    A page past the end returns no rows to read it from; only then is ``count_stmt`` run.
+    """
+    result = await db.execute(stmt.add_columns(func.count().over().label("total")), params)
+    rows = result.all()
+    if rows:
+        return [row[:-1] for row in rows], int(rows[0][-1])
+    if offset <= 0:
+        return [], 0
+    count_result = await db.execute(count_stmt, params)
+    return [], int(count_result.scalar_one() or 0)
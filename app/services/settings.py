@@ -1,7 +1,10 @@
+import json
+import logging
 from datetime import datetime
 from decimal import Decimal
 from typing import TYPE_CHECKING
 
+from redis.exceptions import RedisError
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -17,9 +20,12 @@ from app.schemas.settings import (
     OrgSettingsBase,
     OrgSettingsUpdate,
 )
+from app.utils.redis_client import get_redis_client, redis_key
 
 
 DEFAULT_SETTINGS = OrgSettingsBase()
+MFA_POLICY_CACHE_TTL_SECONDS = 300
+logger = logging.getLogger(__name__)
 ALLOWED_REPAYMENT_METHODS = {method.value for method in LoanRepaymentMethod}
 ALLOWED_INTEREST_TYPES = {interest.value for interest in LoanInterestType}
 ALLOWED_MFA_ACTIONS = {action.value for action in MfaEnforcementAction}
@@ -51,6 +57,67 @@ def is_mfa_action_required(settings: OrgSettings, action: str | None) -> bool:
     return action in (settings.mfa_required_actions or [])
 
 
+def _mfa_policy_generation_key(org_id: str) -> str:
+    return redis_key("mfa_policy", org_id, "generation")
+
+
+async def _get_cached_mfa_policy(org_id: str) -> tuple[dict | None, str | None]:
+    """Return the cached policy (if any) and the key a fresh lookup should be stored under.
+
+    Keys embed the org's policy generation, which is bumped after a settings change
+    commits, so a lookup that read the old row can only repopulate an orphaned key.
+    """
+    try:
+        redis = get_redis_client()
+        generation = await redis.get(_mfa_policy_generation_key(org_id)) or "0"
+        key = redis_key("mfa_policy", org_id, generation)
+        cached = await redis.get(key)
+        if cached:
+            return json.loads(cached), key
+        return None, key
+    except (RedisError, ValueError) as exc:
+        logger.warning("MFA policy cache read failed: %s", exc)
+    return None, None
+
+
+async def _set_cached_mfa_policy(key: str | None, policy: dict) -> None:
+    if key is None:
+        return
+    try:
+        redis = get_redis_client()
+        await redis.setex(key, MFA_POLICY_CACHE_TTL_SECONDS, json.dumps(policy))
+    except RedisError as exc:
+        logger.warning("MFA policy cache write failed: %s", exc)
+
+
+async def invalidate_mfa_policy_cache(org_id: str) -> None:
+    """Orphan the cached MFA policy; call after the settings change has committed."""
+    try:
+        redis = get_redis_client()
+        await redis.incr(_mfa_policy_generation_key(org_id))
+    except RedisError as exc:
+        logger.warning("MFA policy cache invalidation failed: %s", exc)
+
+
+async def is_mfa_action_required_for_org(
+    db: AsyncSession, ctx: "TenantContext", action: str | None
+) -> bool:
+    """Like is_mfa_action_required, but reads the org's MFA policy through a Redis cache."""
+    policy, cache_key = await _get_cached_mfa_policy(ctx.org_id)
+    if policy is None:
+        org_settings = await get_org_settings(db, ctx)
+        policy = {
+            "require_two_factor": bool(org_settings.require_two_factor),
+            "mfa_required_actions": list(org_settings.mfa_required_actions or []),
+        }
+        await _set_cached_mfa_policy(cache_key, policy)
+    if not policy.get("require_two_factor"):
+        return False
+    if action is None:
+        return True
+    return action in (policy.get("mfa_required_actions") or [])
+
+
 def _settings_snapshot(settings: OrgSettings) -> dict:
     data: dict[str, object] = {}
     for column in settings.__table__.columns:
@@ -0,0 +1,78 @@
+"""add loan workflow stage and document lookup indexes
+
+Revision ID: d5e6f7a8b9c0
+Revises: c4d5e6f7a8b9
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "d5e6f7a8b9c0"
+down_revision: Union[str, None] = "c4d5e6f7a8b9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # A loan has at most one stage of each type. Refuse to run if any loan has
+    # duplicates, rather than choosing which stage rows to throw away here; they carry
+    # workflow state (notes, assignee, completion) that someone needs to review.
+    duplicates = (
+        op.get_bind()
+        .execute(
+            sa.text(
+                """
+                SELECT org_id, loan_application_id, stage_type, count(*) AS copies
+                FROM loan_workflow_stages
+                GROUP BY org_id, loan_application_id, stage_type
+                HAVING count(*) > 1
+                ORDER BY org_id, loan_application_id, stage_type
+                """
+            )
+        )
+        .all()
+    )
+    if duplicates:
+        sample = ", ".join(
+            f"{row.org_id}/{row.loan_application_id}/{row.stage_type} x{row.copies}"
+            for row in duplicates[:10]
+        )
+        raise RuntimeError(
+            f"{len(duplicates)} (org, loan, stage_type) groups in loan_workflow_stages have "
+            "duplicate rows; resolve them before adding "
+            f"ux_loan_workflow_stages_org_loan_stage. First groups: {sample}"
+        )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ux_loan_workflow_stages_org_loan_stage",
+            "loan_workflow_stages",
+            ["org_id", "loan_application_id", "stage_type"],
+            unique=True,
+            postgresql_include=["status", "assigned_to_user_id"],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_loan_documents_org_loan_stage_type",
+            "loan_documents",
+            ["org_id", "loan_application_id", "stage_type", "document_type"],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_loan_documents_org_loan_stage_type",
+            table_name="loan_documents",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ux_loan_workflow_stages_org_loan_stage",
+            table_name="loan_workflow_stages",
+            postgresql_concurrently=True,
+        )
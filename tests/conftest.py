@@ -81,7 +81,7 @@ class FakeResult:
         Value returned by ``.scalar_one_or_none()`` / ``.scalar_one()``.
         Use ``_UNSET`` (omit the kwarg) to signal "no scalar configured".
     rows:
-        List of row-like tuples for ``.first()`` / ``.all()`` / ``.fetchall()``.
+        List of row-like tuples for ``.one()`` / ``.first()`` / ``.all()`` / ``.fetchall()``.
     items:
         List of model instances for ``.scalars().all()`` / ``.scalars().first()``.
     """
@@ -117,6 +117,13 @@ class FakeResult:
             return self._rows[0]
         return None
 
+    def one(self):
+        if len(self._rows) != 1:
+            from sqlalchemy.exc import NoResultFound
+
+            raise NoResultFound()
+        return self._rows[0]
+
     def all(self) -> list:
         return list(self._rows)
 
@@ -140,6 +147,7 @@ class FakeAsyncSession:
         self.deleted: list[Any] = []
         self.committed: bool = False
         self.flushed: bool = False
+        self.closed: bool = False
         self._execute_handlers: list[Callable] = []
         self._get_store: dict[tuple, Any] = {}
         self._default_result = FakeResult()
@@ -191,6 +199,9 @@ class FakeAsyncSession:
     async def rollback(self) -> None:
         pass
 
+    async def close(self) -> None:
+        self.closed = True
+
     async def refresh(self, obj: Any, attribute_names: list[str] | None = None) -> None:
         pass
 
@@ -0,0 +1,199 @@
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.audit_log import AuditLog
+from app.services import audit
+from app.services.audit_queue import AuditLogQueue
+
+
+class RecordingQueue(AuditLogQueue):
+    def __init__(self, max_size: int = 0) -> None:
+        super().__init__(batch_size=2, flush_interval_seconds=0, max_size=max_size)
+        self.written: list[list[dict]] = []
+
+    async def _write_batch(self, rows):
+        self.written.append(list(rows))
+
+
+def test_record_audit_log_falls_back_to_session_when_queue_stopped(fake_db, tenant_ctx):
+    audit.record_audit_log(
+        fake_db,
+        tenant_ctx,
+        actor_id=None,
+        action="loan.updated",
+        resource_type="loan_application",
+        resource_id="abc",
+    )
+
+    assert any(isinstance(item, AuditLog) for item in fake_db.added)
+
+
+def test_record_audit_logs_adds_every_entry(fake_db, tenant_ctx):
+    audit.record_audit_logs(
+        fake_db,
+        tenant_ctx,
+        [
+            {
+                "actor_id": None,
+                "action": "loan_workflow_stage.updated",
+                "resource_type": "loan_workflow_stage",
+                "resource_id": "stage-1",
+                "old_value": {"status": "PENDING"},
+                "new_value": {"status": "COMPLETED"},
+            },
+            {
+                "actor_id": None,
+                "action": "loan_document.created",
+                "resource_type": "loan_document",
+                "resource_id": "doc-1",
+            },
+        ],
+    )
+
+    rows = [item for item in fake_db.added if isinstance(item, AuditLog)]
+    assert [row.resource_id for row in rows] == ["stage-1", "doc-1"]
+    assert rows[0].changes == {"status": {"from": "PENDING", "to": "COMPLETED"}}
+
+
+@pytest.mark.asyncio
+async def test_deferred_rows_are_written_only_after_commit(monkeypatch, tenant_ctx):
+    queue = RecordingQueue()
+    monkeypatch.setattr("app.services.audit_queue.audit_log_queue", queue)
+    monkeypatch.setattr(audit, "audit_log_queue", queue)
+    await queue.start()
+    ctx = tenant_ctx
+    session = AsyncSession()
+    try:
+        for resource_id in ("a", "b", "c"):
+            audit.record_audit_log(
+                session,
+                ctx,
+                actor_id=None,
+                action="loan.updated",
+                resource_type="loan_application",
+                resource_id=resource_id,
+            )
+        audit.record_audit_log(
+            session,
+            ctx,
+            actor_id=None,
+            action="loan.activated",
+            resource_type="loan_application",
+            resource_id="d",
+        )
+        assert not session.new
+        await session.commit()
+        audit.record_audit_log(
+            session,
+            ctx,
+            actor_id=None,
+            action="loan.discarded",
+            resource_type="loan_application",
+            resource_id="e",
+        )
+        await session.rollback()
+    finally:
+        await session.close()
+        await queue.stop()
+
+    written = [row["resource_id"] for batch in queue.written for row in batch]
+    assert written == ["a", "b", "c", "d"]
+    assert all(len(batch) <= 2 for batch in queue.written)
+    assert all(row["created_at"] is not None for batch in queue.written for row in batch)
+
+
+@pytest.mark.asyncio
+async def test_full_queue_falls_back_to_inline_writes(monkeypatch, tenant_ctx):
+    queue = RecordingQueue(max_size=1)
+    monkeypatch.setattr("app.services.audit_queue.audit_log_queue", queue)
+    monkeypatch.setattr(audit, "audit_log_queue", queue)
+    await queue.start()
+    session = AsyncSession()
+    try:
+        for resource_id in ("a", "b", "c"):
+            audit.record_audit_log(
+                session,
+                tenant_ctx,
+                actor_id=None,
+                action="loan.updated",
+                resource_type="loan_application",
+                resource_id=resource_id,
+            )
+        await session.commit()
+        assert queue._queue.full()
+
+        audit.record_audit_log(
+            session,
+            tenant_ctx,
+            actor_id=None,
+            action="loan.updated",
+            resource_type="loan_application",
+            resource_id="d",
+        )
+        assert [row.resource_id for row in session.new] == ["d"]
+        session.expunge_all()
+    finally:
+        await session.close()
+        await queue.stop()
+
+    written = sorted(row["resource_id"] for batch in queue.written for row in batch)
+    assert written == ["a", "b", "c"]
+
+
+def test_serialize_for_audit_matches_jsonable_encoder():
+    from datetime import date, datetime, timezone
+    from decimal import Decimal
+    from uuid import uuid4
+
+    from fastapi.encoders import jsonable_encoder
+
+    from app.schemas.loan import LoanWorkflowStageStatus
+
+    value = {
+        "id": uuid4(),
+        "status": LoanWorkflowStageStatus.COMPLETED,
+        "amount": Decimal("12.50"),
+        "completed_at": datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+        "as_of": date(2026, 1, 2),
+        "flags": [True, None, 1.5, ("a", 2)],
+        "nested": {"tags": {"x"}},
+    }
+
+    assert audit.serialize_for_audit(value) == jsonable_encoder(
+        value, custom_encoder=audit._AUDIT_ENCODERS
+    )
+
+
+def test_copy_values_fill_defaults_and_wrap_json():
+    from psycopg.types.json import Json
+
+    from app.services import audit_queue
+
+    row = {"org_id": "default", "action": "x", "new_value": {"a": 1}, "old_value": None}
+    values = dict(
+        zip(
+            audit_queue._COPY_COLUMNS,
+            (audit_queue._copy_value(row, name) for name in audit_queue._COPY_COLUMNS),
+        )
+    )
+
+    assert values["id"] is not None
+    assert values["created_at"] is not None
+    assert isinstance(values["new_value"], Json)
+    assert isinstance(values["old_value"], Json)
+    assert values["changes"] is None
+
+
+def test_copy_and_insert_bind_a_none_json_value_alike():
+    from psycopg.types.json import Json
+    from sqlalchemy.dialects.postgresql.psycopg import PGDialect_psycopg
+
+    from app.services import audit_queue
+
+    dialect = PGDialect_psycopg()
+    column_type = AuditLog.__table__.c.old_value.type
+    insert_value = column_type.dialect_impl(dialect).bind_processor(dialect)(None)
+    copy_value = audit_queue._copy_value({"old_value": None}, "old_value")
+
+    assert isinstance(insert_value, Json) and insert_value.obj is None
+    assert isinstance(copy_value, Json) and copy_value.obj is None
@@ -0,0 +1,43 @@
+import pytest
+
+from conftest import make_user
+
+from app.api import deps
+from app.core.permissions import PermissionCode
+from app.services import authz
+
+
+@pytest.mark.asyncio
+async def test_check_permission_resolves_permissions_once_per_request(monkeypatch, fake_db):
+    calls = {"db": 0}
+
+    async def _no_cache(_redis, _user_id, _org_id):
+        return None
+
+    async def _load(_db, _user_id, _org_id):
+        calls["db"] += 1
+        return {PermissionCode.LOAN_WORKFLOW_HR_MANAGE.value}
+
+    async def _store(_redis, _user_id, _org_id, _permissions):
+        return None
+
+    monkeypatch.setattr(authz, "get_redis_client", lambda: object())
+    monkeypatch.setattr(authz, "_get_cached_permissions", _no_cache)
+    monkeypatch.setattr(authz, "_load_permissions_from_db", _load)
+    monkeypatch.setattr(authz, "_cache_permissions", _store)
+
+    user = make_user()
+    ctx = deps.TenantContext(org_id="default")
+
+    assert await authz.check_permission(
+        user, ctx, PermissionCode.LOAN_WORKFLOW_HR_MANAGE, fake_db
+    )
+    assert not await authz.check_permission(
+        user, ctx, PermissionCode.LOAN_WORKFLOW_ASSIGN_ANY, fake_db
+    )
+    assert calls["db"] == 1
+
+    await authz.check_permission(
+        user, deps.TenantContext(org_id="default"), PermissionCode.LOAN_WORKFLOW_HR_MANAGE, fake_db
+    )
+    assert calls["db"] == 2
@@ -0,0 +1,40 @@
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from app.db.session import _json_serializer
+
+
+def test_json_serializer_matches_stdlib_output():
+    value = {"a": 1, "b": [1.5, None, "x"], "c": {"d": True}, 1: "int key"}
+
+    assert json.loads(_json_serializer(value)) == json.loads(json.dumps(value))
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        {"at": datetime(2025, 1, 2, tzinfo=timezone.utc)},
+        [datetime(2025, 1, 2).date()],
+        {"id": object()},
+        {"big": 2**70, "at": datetime(2025, 1, 2)},
+    ],
+)
+def test_json_serializer_rejects_what_stdlib_rejects(value):
+    with pytest.raises(TypeError):
+        json.dumps(value)
+    with pytest.raises(TypeError):
+        _json_serializer(value)
+
+
+@pytest.mark.parametrize("number", [float("nan"), float("inf"), float("-inf")])
+def test_json_serializer_rejects_non_finite_floats(number):
+    with pytest.raises(ValueError):
+        _json_serializer({"rate": number, "note": None})
+    with pytest.raises(ValueError):
+        _json_serializer({"big": 2**70, "rate": [number]})
+
+
+def test_json_serializer_keeps_null_and_large_ints():
+    assert json.loads(_json_serializer({"a": None, "big": 2**70})) == {"a": None, "big": 2**70}
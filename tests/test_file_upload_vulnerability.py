@@ -1,7 +1,16 @@
+import asyncio
+import hashlib
+import threading
+import time
 from pathlib import Path
 import pytest
-from fastapi import UploadFile
-from app.services.local_uploads import save_upload
+from fastapi import Request, UploadFile
+from app.services import local_uploads
+from app.services.local_uploads import (
+    save_upload,
+    save_upload_with_checksum,
+    stream_multipart_upload,
+)
 
 
 @pytest.mark.asyncio
@@ -54,3 +63,262 @@ async def test_save_upload_allows_valid_extensions(tmp_path):
     saved_file = base_dir / relative_path
     assert saved_file.exists()
     assert saved_file.read_bytes() == content
+
+
+@pytest.mark.asyncio
+async def test_save_upload_with_checksum_hashes_streamed_content(tmp_path):
+    from io import BytesIO
+
+    content = b"%PDF-1.4" + b"x" * (3 * 1024 * 1024)
+    file = UploadFile(file=BytesIO(content), filename="large.pdf")
+
+    saved = await save_upload_with_checksum(
+        file, tmp_path, Path("uploads"), allowed_extensions={".pdf"}
+    )
+
+    assert saved.size_bytes == len(content)
+    assert saved.checksum == hashlib.sha256(content).hexdigest()
+    assert (tmp_path / saved.relative_path).read_bytes() == content
+
+
+def _multipart_request(
+    parts: list[bytes], boundary: str = "testboundary", chunk_size: int = 7
+) -> Request:
+    body = b"".join(parts) + f"--{boundary}--\r\n".encode()
+    chunks = [body[i : i + chunk_size] for i in range(0, len(body), chunk_size)]
+
+    async def receive():
+        chunk = chunks.pop(0)
+        return {"type": "http.request", "body": chunk, "more_body": bool(chunks)}
+
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": "/",
+        "headers": [
+            (b"content-type", f"multipart/form-data; boundary={boundary}".encode()),
+        ],
+    }
+    return Request(scope, receive)
+
+
+def _part(name: str, value: bytes, filename: str | None = None) -> bytes:
+    disposition = f'form-data; name="{name}"'
+    if filename:
+        disposition += f'; filename="{filename}"'
+    return f"--testboundary\r\nContent-Disposition: {disposition}\r\n\r\n".encode() + value + b"\r\n"
+
+
+@pytest.mark.asyncio
+async def test_stream_multipart_upload_writes_file_and_collects_fields(tmp_path):
+    content = b"%PDF-1.4" + b"y" * 4096
+    request = _multipart_request(
+        [_part("file", content, "cert.pdf"), _part("document_type", b"SHARE_CERTIFICATE")]
+    )
+
+    fields, saved = await stream_multipart_upload(
+        request, tmp_path, Path("uploads"), allowed_extensions={".pdf"}
+    )
+
+    assert fields == {"document_type": "SHARE_CERTIFICATE"}
+    assert saved.original_name == "cert.pdf"
+    assert saved.size_bytes == len(content)
+    assert saved.checksum == hashlib.sha256(content).hexdigest()
+    assert (tmp_path / saved.relative_path).read_bytes() == content
+
+
+@pytest.mark.asyncio
+async def test_stream_multipart_upload_removes_rejected_file(tmp_path):
+    request = _multipart_request([_part("file", b"not really a pdf", "cert.pdf")])
+
+    with pytest.raises(ValueError, match="does not match"):
+        await stream_multipart_upload(
+            request, tmp_path, Path("uploads"), allowed_extensions={".pdf"}
+        )
+
+    assert list((tmp_path / "uploads").iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_stream_multipart_upload_pipelines_large_bodies(tmp_path):
+    content = b"%PDF-1.4" + bytes(range(256)) * (5 * 4096)
+    request = _multipart_request(
+        [_part("document_type", b"SHARE_CERTIFICATE"), _part("file", content, "cert.pdf")],
+        chunk_size=300 * 1024,
+    )
+
+    fields, saved = await stream_multipart_upload(
+        request, tmp_path, Path("uploads"), allowed_extensions={".pdf"}
+    )
+
+    assert fields["document_type"] == "SHARE_CERTIFICATE"
+    assert saved.checksum == hashlib.sha256(content).hexdigest()
+    assert (tmp_path / saved.relative_path).read_bytes() == content
+
+
+def _reject_unless_share_certificate(value: str) -> None:
+    if value != "SHARE_CERTIFICATE":
+        raise ValueError("document_type must be SHARE_CERTIFICATE")
+
+
+@pytest.mark.asyncio
+async def test_stream_multipart_upload_validates_fields_before_writing(tmp_path):
+    request = _multipart_request(
+        [_part("document_type", b"PAYMENT_INSTRUCTIONS"), _part("file", b"%PDF-1.4", "a.pdf")]
+    )
+
+    with pytest.raises(ValueError, match="SHARE_CERTIFICATE"):
+        await stream_multipart_upload(
+            request,
+            tmp_path,
+            Path("uploads"),
+            allowed_extensions={".pdf"},
+            field_validators={"document_type": _reject_unless_share_certificate},
+        )
+
+    assert list((tmp_path / "uploads").iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_stream_multipart_upload_requires_validated_fields_before_file(tmp_path):
+    request = _multipart_request(
+        [_part("file", b"%PDF-1.4", "a.pdf"), _part("document_type", b"SHARE_CERTIFICATE")]
+    )
+
+    with pytest.raises(ValueError, match="must be sent before the file"):
+        await stream_multipart_upload(
+            request,
+            tmp_path,
+            Path("uploads"),
+            allowed_extensions={".pdf"},
+            field_validators={"document_type": _reject_unless_share_certificate},
+        )
+
+    assert list((tmp_path / "uploads").iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_stream_multipart_upload_limits_field_count(tmp_path):
+    request = _multipart_request([_part(f"f{i}", b"x") for i in range(4)])
+
+    with pytest.raises(ValueError, match="Too many form fields"):
+        await stream_multipart_upload(request, tmp_path, Path("uploads"), max_fields=3)
+
+
+@pytest.mark.asyncio
+async def test_stream_multipart_upload_limits_part_header_size(tmp_path):
+    oversized = (
+        b'--testboundary\r\nContent-Disposition: form-data; name="f"\r\nX-Pad: '
+        + b"a" * 2048
+        + b"\r\n\r\nx\r\n"
+    )
+    request = _multipart_request([oversized])
+
+    with pytest.raises(ValueError, match="headers are too large"):
+        await stream_multipart_upload(
+            request, tmp_path, Path("uploads"), max_part_header_bytes=1024
+        )
+
+
+@pytest.mark.asyncio
+async def test_stream_multipart_upload_cancel_waits_for_worker_before_discard(
+    tmp_path, monkeypatch
+):
+    in_flight = threading.Event()
+    writes_running = []
+    discards_saw_running = []
+    original_write = local_uploads._UploadSink.write
+    original_discard = local_uploads._UploadSink.discard
+
+    def slow_write(self, chunk):
+        writes_running.append(1)
+        in_flight.set()
+        time.sleep(0.2)
+        try:
+            original_write(self, chunk)
+        finally:
+            writes_running.pop()
+
+    def recording_discard(self):
+        discards_saw_running.append(len(writes_running))
+        original_discard(self)
+
+    monkeypatch.setattr(local_uploads._UploadSink, "write", slow_write)
+    monkeypatch.setattr(local_uploads._UploadSink, "discard", recording_discard)
+    content = b"%PDF-1.4" + b"z" * (3 * 1024 * 1024)
+    request = _multipart_request(
+        [_part("file", content, "cert.pdf")], chunk_size=1024 * 1024 + 512
+    )
+
+    task = asyncio.ensure_future(
+        stream_multipart_upload(request, tmp_path, Path("uploads"), allowed_extensions={".pdf"})
+    )
+    while not in_flight.is_set():
+        await asyncio.sleep(0.01)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert discards_saw_running == [0]
+    assert list((tmp_path / "uploads").iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_save_upload_with_checksum_cancel_waits_for_worker_before_discard(
+    tmp_path, monkeypatch
+):
+    from io import BytesIO
+
+    in_flight = threading.Event()
+    writes_running = []
+    discards_saw_running = []
+    original_write = local_uploads._UploadSink.write
+    original_discard = local_uploads._UploadSink.discard
+
+    def slow_write(self, chunk):
+        writes_running.append(1)
+        in_flight.set()
+        time.sleep(0.2)
+        try:
+            original_write(self, chunk)
+        finally:
+            writes_running.pop()
+
+    def recording_discard(self):
+        discards_saw_running.append(len(writes_running))
+        original_discard(self)
+
+    monkeypatch.setattr(local_uploads._UploadSink, "write", slow_write)
+    monkeypatch.setattr(local_uploads._UploadSink, "discard", recording_discard)
+    content = b"%PDF-1.4" + b"z" * (3 * 1024 * 1024)
+    file = UploadFile(file=BytesIO(content), filename="cert.pdf")
+
+    task = asyncio.ensure_future(
+        save_upload_with_checksum(file, tmp_path, Path("uploads"), allowed_extensions={".pdf"})
+    )
+    while not in_flight.is_set():
+        await asyncio.sleep(0.01)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert discards_saw_running == [0]
+    assert list((tmp_path / "uploads").iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_save_upload_with_checksum_removes_file_on_write_error(tmp_path, monkeypatch):
+    from io import BytesIO
+
+    def failing_finish(self):
+        raise OSError(28, "No space left on device")
+
+    monkeypatch.setattr(local_uploads._UploadSink, "finish", failing_finish)
+    file = UploadFile(file=BytesIO(b"%PDF-1.4 test"), filename="cert.pdf")
+
+    with pytest.raises(OSError):
+        await save_upload_with_checksum(
+            file, tmp_path, Path("uploads"), allowed_extensions={".pdf"}
+        )
+
+    assert list((tmp_path / "uploads").iterdir()) == []
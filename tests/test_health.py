@@ -41,6 +41,21 @@ def test_health_ready_ok(monkeypatch) -> None:
     assert payload["checks"]["redis"]["status"] == "ok"
 
 
+def test_health_ready_reports_pool_stats(monkeypatch) -> None:
+    async def ok_check():
+        return {"status": "ok"}
+
+    monkeypatch.setattr(health_module, "_check_db", ok_check)
+    monkeypatch.setattr(health_module, "_check_redis", ok_check)
+    monkeypatch.setattr(health_module.settings, "health_include_details", True)
+
+    response = client.get("/api/v1/health/ready")
+    assert response.status_code == 200
+    pool = response.json()["data"]["db_pool"]
+    assert pool["size"] == health_module.settings.db_pool_size
+    assert pool["checked_out"] >= 0
+
+
 def test_health_ready_degraded(monkeypatch) -> None:
     async def bad_db():
         return {"status": "error", "error": "unreachable"}
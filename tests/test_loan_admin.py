@@ -1,24 +1,34 @@
-from datetime import date
+from datetime import date, datetime, timezone
 from decimal import Decimal
 from uuid import uuid4
 
 import pytest
+from fastapi import HTTPException
 from fastapi.testclient import TestClient
+from pydantic import ValidationError
+from sqlalchemy import select
 
 from conftest import FakeAsyncSession, FakeResult, entity_handler, make_user
 
+from app.api import deps
 from app.api.v1.routers import loan_admin
 from app.main import app
 from app.models.loan_application import LoanApplication
 from app.models.loan_document import LoanDocument
 from app.models.loan_workflow_stage import LoanWorkflowStage
+from app.models.org_membership import OrgMembership
 from app.schemas.loan import (
+    LoanApplicationDTO,
     LoanApplicationStatus,
+    LoanApplicationSummaryDTO,
+    LoanScheduleEntry,
+    LoanScheduleResponse,
     LoanWorkflowStageStatus,
     LoanWorkflowStageType,
 )
 from app.schemas.stock import EligibilityResult, StockSummaryResponse
 from app.services import loan_queue, loan_applications, loan_workflow, stock_summary
+from app.services.audit import model_snapshot
 
 
 @pytest.fixture(autouse=True)
@@ -119,8 +129,7 @@ def test_hr_stage_completion_requires_document(client_with_permissions, fake_db)
         stage_type=LoanWorkflowStageType.HR_REVIEW.value,
         status=LoanWorkflowStageStatus.PENDING.value,
     )
-    fake_db.on_execute(entity_handler(LoanWorkflowStage, FakeResult(scalar=stage)))
-    fake_db.on_execute(entity_handler(LoanDocument, FakeResult(scalar=None)))
+    fake_db.on_execute(entity_handler(LoanWorkflowStage, FakeResult(rows=[(stage, None)])))
 
     resp = client_with_permissions.patch(
         f"/api/v1/org/loans/{stage.loan_application_id}/hr",
@@ -146,16 +155,17 @@ def test_activation_runs_after_stage_completion(monkeypatch, client_with_permiss
         file_name="doc.pdf",
         storage_path_or_url="s3://bucket/doc.pdf",
     )
-    fake_db.on_execute(entity_handler(LoanWorkflowStage, FakeResult(scalar=stage)))
-    fake_db.on_execute(entity_handler(LoanDocument, FakeResult(scalar=document)))
-
-    async def _get_application(*args, **kwargs):
-        return _application(id=stage.loan_application_id)
+    stage.loan_application = _application(id=stage.loan_application_id)
+    uploaded_types = [document.document_type, "SPOUSE_PARTNER_CONSENT"]
+    fake_db.on_execute(
+        entity_handler(LoanWorkflowStage, FakeResult(rows=[(stage, uploaded_types)]))
+    )
+    activated_for = []
 
-    async def _activate(*args, **kwargs):
+    async def _activate(db, ctx, application, **kwargs):
+        activated_for.append(application.id)
         return True
 
-    monkeypatch.setattr(loan_admin, "_get_application_or_404", _get_application)
     monkeypatch.setattr(loan_workflow, "try_activate_loan", _activate)
 
     resp = client_with_permissions.patch(
@@ -163,6 +173,7 @@ def test_activation_runs_after_stage_completion(monkeypatch, client_with_permiss
         json={"status": "COMPLETED"},
     )
     assert resp.status_code == 200
+    assert activated_for == [stage.loan_application_id]
 
 
 def test_hr_document_upload_rejects_wrong_type(monkeypatch, client_with_permissions, fake_db):
@@ -182,6 +193,41 @@ def test_hr_document_upload_rejects_wrong_type(monkeypatch, client_with_permissi
     assert resp.status_code == 400
 
 
+def test_hr_document_upload_inserts_only_for_existing_loan(client_with_permissions, fake_db):
+    uploaded_at = datetime(2026, 1, 2, tzinfo=timezone.utc)
+    fake_db.on_execute(lambda _stmt: FakeResult(rows=[(uploaded_at, uploaded_at)]))
+    loan_id = uuid4()
+
+    resp = client_with_permissions.post(
+        f"/api/v1/org/loans/{loan_id}/documents/hr",
+        json={
+            "document_type": "NOTICE_OF_STOCK_OPTION_GRANT",
+            "file_name": "grant.pdf",
+            "storage_key": f"orgs/default/loans/{loan_id}/grant.pdf",
+        },
+    )
+    assert resp.status_code == 201
+    payload = resp.json()["data"]
+    assert payload["loan_application_id"] == str(loan_id)
+    assert payload["uploaded_at"].startswith("2026-01-02")
+    assert fake_db.committed
+    assert not any(isinstance(obj, LoanDocument) for obj in fake_db.added)
+
+
+def test_hr_document_upload_requires_loan(client_with_permissions, fake_db):
+    loan_id = uuid4()
+    resp = client_with_permissions.post(
+        f"/api/v1/org/loans/{loan_id}/documents/hr",
+        json={
+            "document_type": "NOTICE_OF_STOCK_OPTION_GRANT",
+            "file_name": "grant.pdf",
+            "storage_key": f"orgs/default/loans/{loan_id}/grant.pdf",
+        },
+    )
+    assert resp.status_code == 404
+    assert not fake_db.committed
+
+
 def test_finance_stage_completion_requires_document(client_with_permissions, fake_db):
     stage = LoanWorkflowStage(
         id=uuid4(),
@@ -190,8 +236,7 @@ def test_finance_stage_completion_requires_document(client_with_permissions, fak
         stage_type=LoanWorkflowStageType.FINANCE_PROCESSING.value,
         status=LoanWorkflowStageStatus.PENDING.value,
     )
-    fake_db.on_execute(entity_handler(LoanWorkflowStage, FakeResult(scalar=stage)))
-    fake_db.on_execute(entity_handler(LoanDocument, FakeResult(scalar=None)))
+    fake_db.on_execute(entity_handler(LoanWorkflowStage, FakeResult(rows=[(stage, None)])))
 
     resp = client_with_permissions.patch(
         f"/api/v1/org/loans/{stage.loan_application_id}/finance",
@@ -232,6 +277,34 @@ def test_legal_queue_endpoint(monkeypatch, client_with_permissions, fake_db):
     assert payload["items"][0]["id"] == str(application.id)
 
 
+@pytest.mark.asyncio
+async def test_list_queue_binds_stage_and_assignee_to_prebuilt_statement():
+    calls = []
+
+    class RecordingSession(FakeAsyncSession):
+        async def execute(self, stmt, params=None, **kwargs):
+            calls.append((stmt, params))
+            return FakeResult(rows=[("row", 1)])
+
+    assignee_id = uuid4()
+    rows, total = await loan_queue.list_queue(
+        RecordingSession(),
+        loan_admin.deps.TenantContext(org_id="default"),
+        stage_type="LEGAL_EXECUTION",
+        limit=5,
+        offset=0,
+        assigned_to_user_id=assignee_id,
+    )
+    assert (rows, total) == ([("row",)], 1)
+    stmt, params = calls[0]
+    assert params == {
+        "org_id": "default",
+        "stage_type": "LEGAL_EXECUTION",
+        "assigned_to_user_id": assignee_id,
+    }
+    assert "assigned_to_user_id" in str(stmt)
+
+
 def test_legal_stage_completion_requires_documents(client_with_permissions, fake_db):
     stage = LoanWorkflowStage(
         id=uuid4(),
@@ -240,7 +313,7 @@ def test_legal_stage_completion_requires_documents(client_with_permissions, fake
         stage_type=LoanWorkflowStageType.LEGAL_EXECUTION.value,
         status=LoanWorkflowStageStatus.PENDING.value,
     )
-    fake_db.on_execute(entity_handler(LoanWorkflowStage, FakeResult(scalar=stage)))
+    fake_db.on_execute(entity_handler(LoanWorkflowStage, FakeResult(rows=[(stage, None)])))
 
     resp = client_with_permissions.patch(
         f"/api/v1/org/loans/{stage.loan_application_id}/legal",
@@ -264,3 +337,340 @@ def test_legal_document_upload_rejects_wrong_type(monkeypatch, client_with_permi
         },
     )
     assert resp.status_code == 400
+
+
+def test_loan_application_dto_applies_overrides():
+    application = _application(
+        version=1,
+        repayment_method="BALLOON",
+        quote_inputs_snapshot={},
+        quote_option_snapshot={},
+        allocation_strategy="OLDEST_VESTED_FIRST",
+        allocation_snapshot=[],
+        workflow_stages=[],
+    )
+
+    dto = loan_admin._loan_application_dto(
+        application,
+        {"has_share_certificate": True, "days_until_83b_due": 5, "last_edit_note": "ignored"},
+    )
+
+    assert dto.id == application.id
+    assert dto.status == LoanApplicationStatus.SUBMITTED.value
+    assert dto.has_share_certificate is True
+    assert dto.days_until_83b_due == 5
+    assert dto.workflow_stages == []
+    assert "last_edit_note" not in dto.model_dump()
+
+    assert dto == LoanApplicationDTO.model_validate(application).model_copy(
+        update={"has_share_certificate": True, "days_until_83b_due": 5}
+    )
+
+    dto.quote_inputs_snapshot["mutated"] = True
+    again = loan_admin._loan_application_dto(application, {"has_share_certificate": False})
+    assert again.has_share_certificate is False
+    assert again.days_until_83b_due is None
+    assert again.quote_inputs_snapshot == {}
+
+    with pytest.raises(ValidationError):
+        loan_admin._loan_application_dto(application, {"days_until_83b_due": "soon"})
+
+    application.version = 2
+    application.status = LoanApplicationStatus.ACTIVE.value
+    bumped = loan_admin._loan_application_dto(application, {})
+    assert bumped.status == LoanApplicationStatus.ACTIVE.value
+
+
+def test_admin_summary_matches_validated_dto():
+    application = _application(version=1, repayment_method="BALLOON")
+    membership = OrgMembership(
+        id=application.org_membership_id, org_id="default", employee_id="E-1"
+    )
+    user = make_user()
+    row = (application, membership, user, None, "HR_REVIEW", "IN_PROGRESS", user, None, None, None)
+
+    summary = loan_admin._build_admin_summary(row)
+
+    validated = LoanApplicationSummaryDTO.model_validate(summary.model_dump())
+    assert summary.model_dump_json() == validated.model_dump_json()
+    assert summary.applicant.email == user.email
+    assert summary.current_stage_assignee.user_id == user.id
+
+
+def test_loan_document_download_serves_local_file(
+    tmp_path, monkeypatch, client_with_permissions, fake_db
+):
+    monkeypatch.setattr(loan_admin.settings, "local_upload_dir", str(tmp_path))
+    (tmp_path / "cert.pdf").write_bytes(b"%PDF-1.4 test")
+    document = LoanDocument(
+        id=uuid4(),
+        org_id="default",
+        loan_application_id=uuid4(),
+        stage_type=LoanWorkflowStageType.LEGAL_EXECUTION.value,
+        document_type="SHARE_CERTIFICATE",
+        file_name="cert.pdf",
+        storage_path_or_url="cert.pdf",
+        storage_provider="local",
+    )
+    missing = LoanDocument(
+        id=uuid4(),
+        org_id="default",
+        loan_application_id=document.loan_application_id,
+        stage_type=document.stage_type,
+        document_type="SHARE_CERTIFICATE",
+        file_name="gone.pdf",
+        storage_path_or_url="gone.pdf",
+        storage_provider="local",
+    )
+    fake_db.on_get(LoanDocument, document.id, document)
+    fake_db.on_get(LoanDocument, missing.id, missing)
+
+    resp = client_with_permissions.get(f"/api/v1/org/loans/documents/{document.id}/download")
+    assert resp.status_code == 200
+    assert resp.content == b"%PDF-1.4 test"
+
+    resp = client_with_permissions.get(f"/api/v1/org/loans/documents/{missing.id}/download")
+    assert resp.status_code == 404
+
+    (tmp_path / "blocker").write_bytes(b"not a directory")
+    missing.storage_path_or_url = "blocker/cert.pdf"
+    resp = client_with_permissions.get(f"/api/v1/org/loans/documents/{missing.id}/download")
+    assert resp.status_code == 404
+    assert resp.json()["code"] == "document_missing"
+
+
+def test_loan_document_download_is_not_gzipped(
+    tmp_path, monkeypatch, client_with_permissions, fake_db
+):
+    monkeypatch.setattr(loan_admin.settings, "local_upload_dir", str(tmp_path))
+    content = b"%PDF-1.4 " + b"0" * 8192
+    (tmp_path / "cert.pdf").write_bytes(content)
+    document = LoanDocument(
+        id=uuid4(),
+        org_id="default",
+        loan_application_id=uuid4(),
+        stage_type=LoanWorkflowStageType.LEGAL_EXECUTION.value,
+        document_type="SHARE_CERTIFICATE",
+        file_name="cert.pdf",
+        storage_path_or_url="cert.pdf",
+        storage_provider="local",
+    )
+    fake_db.on_get(LoanDocument, document.id, document)
+
+    resp = client_with_permissions.get(
+        f"/api/v1/org/loans/documents/{document.id}/download",
+        headers={"Accept-Encoding": "gzip"},
+    )
+
+    assert resp.status_code == 200
+    assert "content-encoding" not in resp.headers
+    assert resp.content == content
+
+
+def test_self_assignment_skips_assignee_lookup(client_with_permissions, fake_db):
+    executed = []
+
+    def _record(stmt):
+        executed.append(stmt)
+        return None
+
+    fake_db.on_execute(_record)
+
+    resp = client_with_permissions.post(
+        f"/api/v1/org/loans/{uuid4()}/workflow/HR_REVIEW/assign", json={}
+    )
+
+    assert resp.status_code == 404
+    assert resp.json()["message"] == "Workflow stage not found"
+    assert len(executed) == 1
+
+
+def test_superuser_token_self_assignment_checks_membership(
+    monkeypatch, client_with_permissions, fake_db
+):
+    executed = []
+
+    def _record(stmt):
+        executed.append(stmt)
+        return None
+
+    fake_db.on_execute(_record)
+    monkeypatch.setattr(deps, "decode_token", lambda token: {"type": "access", "su": True})
+
+    resp = client_with_permissions.post(
+        f"/api/v1/org/loans/{uuid4()}/workflow/HR_REVIEW/assign",
+        json={},
+        headers={"Authorization": "Bearer superuser-token"},
+    )
+
+    assert resp.status_code == 404
+    assert resp.json()["message"] == "Assignee user not found"
+    assert len(executed) == 1
+
+
+def test_previous_row_snapshot_matches_model_snapshot():
+    stage = LoanWorkflowStage(
+        id=uuid4(),
+        org_id="default",
+        loan_application_id=uuid4(),
+        stage_type=LoanWorkflowStageType.HR_REVIEW.value,
+        status=LoanWorkflowStageStatus.PENDING.value,
+        created_at=datetime(2025, 1, 2, 3, 4, 5, 120000, tzinfo=timezone.utc),
+    )
+    previous = select(LoanWorkflowStage.__table__).cte("previous_stage")
+    values = [getattr(stage, column.key) for column in LoanWorkflowStage.__table__.columns]
+
+    assert len(loan_admin._previous_row_columns(previous)) == len(values)
+    assert loan_admin._previous_row_snapshot(previous, values) == model_snapshot(stage)
+    assert loan_admin._previous_row_snapshot(previous, [None] * len(values)) is None
+
+
+@pytest.mark.asyncio
+async def test_post_issuance_completion_pre_image_matches_model_snapshot():
+    loan_id = uuid4()
+    previous = LoanWorkflowStage(
+        id=uuid4(),
+        org_id="default",
+        loan_application_id=loan_id,
+        stage_type="LEGAL_POST_ISSUANCE",
+        status=LoanWorkflowStageStatus.PENDING.value,
+        created_at=datetime(2025, 1, 2, 3, 4, 5, 120000, tzinfo=timezone.utc),
+    )
+    completed = LoanWorkflowStage(id=previous.id, org_id="default", loan_application_id=loan_id)
+    values = [getattr(previous, column.key) for column in LoanWorkflowStage.__table__.columns]
+    db = FakeAsyncSession()
+    db.on_execute_return(FakeResult(rows=[(completed, *values)]))
+
+    stage, old_stage = await loan_admin._complete_post_issuance_stage(
+        db, deps.TenantContext(org_id="default"), loan_id, uuid4()
+    )
+
+    assert stage is completed
+    assert old_stage == model_snapshot(previous)
+
+
+def test_backlog_activation_rejects_concurrent_run(client_with_permissions, fake_db):
+    fake_db.on_execute_return(FakeResult(scalar=False))
+
+    resp = client_with_permissions.post("/api/v1/org/loans/maintenance/activate-backlog")
+
+    assert resp.status_code == 409
+    assert resp.json()["code"] == "backlog_activation_running"
+
+
+def test_list_loan_documents_groups_by_stage(client_with_permissions, fake_db):
+    loan_id = uuid4()
+
+    def _document(stage_type: str, document_type: str) -> LoanDocument:
+        return LoanDocument(
+            id=uuid4(),
+            org_id="default",
+            loan_application_id=loan_id,
+            stage_type=stage_type,
+            document_type=document_type,
+            file_name="doc.pdf",
+            storage_path_or_url="loans/doc.pdf",
+        )
+
+    documents = [
+        _document("FINANCE_PROCESSING", "PAYMENT_INSTRUCTIONS"),
+        _document("HR_REVIEW", "NOTICE_OF_STOCK_OPTION_GRANT"),
+        _document("HR_REVIEW", "SPOUSE_PARTNER_CONSENT"),
+    ]
+    fake_db.on_execute(entity_handler(LoanApplication, FakeResult(scalar=loan_id)))
+    fake_db.on_execute(entity_handler(LoanDocument, FakeResult(items=documents)))
+
+    resp = client_with_permissions.get(f"/api/v1/org/loans/{loan_id}/documents")
+    assert resp.status_code == 200
+    data = resp.json()["data"]
+    assert data["total"] == 3
+    assert [(group["stage_type"], len(group["documents"])) for group in data["groups"]] == [
+        ("FINANCE_PROCESSING", 1),
+        ("HR_REVIEW", 2),
+    ]
+
+
+def test_list_loan_documents_requires_loan(client_with_permissions, fake_db):
+    resp = client_with_permissions.get(f"/api/v1/org/loans/{uuid4()}/documents")
+    assert resp.status_code == 404
+
+
+def test_export_schedule_releases_session_before_streaming(
+    monkeypatch, client_with_permissions, fake_db
+):
+    loan_id = uuid4()
+    schedule = LoanScheduleResponse(
+        loan_id=loan_id,
+        as_of_date=date(2025, 12, 31),
+        repayment_method="BALLOON",
+        term_months=1,
+        principal=Decimal("12.50"),
+        annual_rate_percent=Decimal("8.5"),
+        estimated_monthly_payment=Decimal("12.59"),
+        entries=[
+            LoanScheduleEntry(
+                period=1,
+                due_date=date(2026, 1, 31),
+                payment=Decimal("12.59"),
+                principal=Decimal("12.50"),
+                interest=Decimal("0.09"),
+                remaining_balance=Decimal("0"),
+            )
+        ],
+    )
+
+    async def _cached(*_args, **_kwargs):
+        return schedule, None
+
+    monkeypatch.setattr(loan_admin.loan_admin_cache, "get_cached_response", _cached)
+
+    resp = client_with_permissions.get(f"/api/v1/org/loans/{loan_id}/schedule/export")
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/csv")
+    assert resp.text.splitlines()[1] == "1,2026-01-31,12.59,12.50,0.09,0"
+    assert fake_db.closed
+
+
+def _issuance_upload(monkeypatch, tmp_path, client, content: bytes):
+    async def _get_application(*args, **kwargs):
+        return _application(status="ACTIVE")
+
+    monkeypatch.setattr(loan_admin, "_get_application_or_404", _get_application)
+    monkeypatch.setattr(loan_admin, "local_upload_base_dir", lambda: tmp_path)
+    return client.post(
+        f"/api/v1/org/loans/{uuid4()}/documents/legal-issuance/upload",
+        data={"document_type": "SHARE_CERTIFICATE"},
+        files={"file": ("cert.pdf", content, "application/pdf")},
+    )
+
+
+def _stored_files(tmp_path) -> list:
+    return [path for path in tmp_path.rglob("*") if path.is_file()]
+
+
+def test_issuance_upload_discards_file_when_mfa_fails(
+    monkeypatch, tmp_path, client_with_permissions, fake_db
+):
+    async def _deny_mfa(*args, **kwargs):
+        raise HTTPException(status_code=403, detail="MFA required")
+
+    monkeypatch.setattr(loan_admin.deps, "require_mfa_for_action", _deny_mfa)
+
+    resp = _issuance_upload(monkeypatch, tmp_path, client_with_permissions, b"%PDF-1.4 cert")
+    assert resp.status_code == 403
+    assert _stored_files(tmp_path) == []
+    assert not fake_db.added
+
+
+def test_issuance_upload_rejects_invalid_file_after_mfa(
+    monkeypatch, tmp_path, client_with_permissions, fake_db
+):
+    async def _allow_mfa(*args, **kwargs):
+        return None
+
+    monkeypatch.setattr(loan_admin.deps, "require_mfa_for_action", _allow_mfa)
+
+    resp = _issuance_upload(monkeypatch, tmp_path, client_with_permissions, b"not a pdf")
+    assert resp.status_code == 400
+    assert _stored_files(tmp_path) == []
+    assert not fake_db.added
@@ -0,0 +1,52 @@
+from uuid import uuid4
+
+import pytest
+
+from app.schemas.loan import LoanRepaymentListResponse
+from app.services import loan_admin_cache
+
+
+class FakeRedis:
+    def __init__(self) -> None:
+        self.store: dict[str, str] = {}
+
+    async def get(self, key: str):
+        return self.store.get(key)
+
+    async def setex(self, key: str, ttl: int, value: str) -> None:
+        self.store[key] = value
+
+    async def incr(self, key: str) -> int:
+        value = int(self.store.get(key, "0")) + 1
+        self.store[key] = str(value)
+        return value
+
+
+@pytest.mark.asyncio
+async def test_loan_admin_cache_is_tenant_scoped_and_invalidated(monkeypatch):
+    fake = FakeRedis()
+    monkeypatch.setattr(loan_admin_cache, "get_redis_client", lambda: fake)
+    loan_id = uuid4()
+    params = {"loan_id": loan_id}
+    response = LoanRepaymentListResponse(loan_id=loan_id, total=0, items=[])
+
+    cached, key = await loan_admin_cache.get_cached_response(
+        "default", "repayments", params, LoanRepaymentListResponse
+    )
+    assert cached is None
+    await loan_admin_cache.set_cached_response(key, response)
+
+    cached, _ = await loan_admin_cache.get_cached_response(
+        "default", "repayments", params, LoanRepaymentListResponse
+    )
+    assert cached == response
+    other_org, _ = await loan_admin_cache.get_cached_response(
+        "other", "repayments", params, LoanRepaymentListResponse
+    )
+    assert other_org is None
+
+    await loan_admin_cache.invalidate_loan_admin_cache("default")
+    cached, _ = await loan_admin_cache.get_cached_response(
+        "default", "repayments", params, LoanRepaymentListResponse
+    )
+    assert cached is None
@@ -449,3 +449,44 @@ async def test_submit_idempotent_does_not_duplicate_stages():
     assert result.status == LoanApplicationStatus.SUBMITTED.value
     stages_added = [obj for obj in db.added if isinstance(obj, LoanWorkflowStage)]
     assert stages_added == []
+
+
+@pytest.mark.asyncio
+async def test_list_admin_applications_reads_total_from_page_query():
+    statements = []
+
+    def _handler(stmt):
+        statements.append(stmt)
+        if len(statements) == 1:
+            return FakeResult(rows=[("row-1", 7), ("row-2", 7)])
+        return FakeResult(scalar=99)
+
+    db = FakeAsyncSession()
+    db.on_execute(_handler)
+    rows, total = await loan_applications.list_admin_applications(
+        db, deps.TenantContext(org_id="default"), limit=2, offset=0
+    )
+    assert rows == [("row-1",), ("row-2",)]
+    assert total == 7
+    assert len(statements) == 1
+    assert "count(*) OVER ()" in str(statements[0])
+
+
+@pytest.mark.asyncio
+async def test_list_admin_applications_counts_when_page_is_past_the_end():
+    statements = []
+
+    def _handler(stmt):
+        statements.append(stmt)
+        if len(statements) == 1:
+            return FakeResult(rows=[])
+        return FakeResult(scalar=3)
+
+    db = FakeAsyncSession()
+    db.on_execute(_handler)
+    rows, total = await loan_applications.list_admin_applications(
+        db, deps.TenantContext(org_id="default"), limit=2, offset=10
+    )
+    assert rows == []
+    assert total == 3
+    assert len(statements) == 2
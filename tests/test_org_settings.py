@@ -141,3 +141,69 @@ async def test_org_settings_update_writes_audit_log():
         actor_id="actor-1",
     )
     assert any(isinstance(obj, AuditLog) for obj in db.added)
+
+
+@pytest.mark.asyncio
+async def test_mfa_policy_is_served_from_cache_after_first_lookup(monkeypatch):
+    store: dict[str, str] = {}
+    lookups = {"count": 0}
+
+    class FakeRedis:
+        async def get(self, key):
+            return store.get(key)
+
+        async def setex(self, key, ttl, value):
+            store[key] = value
+
+    async def _settings(db, ctx, create_if_missing=True):
+        lookups["count"] += 1
+        return make_org_settings(
+            require_two_factor=True, mfa_required_actions=["WORKFLOW_COMPLETE"]
+        )
+
+    monkeypatch.setattr(settings_service, "get_redis_client", lambda: FakeRedis())
+    monkeypatch.setattr(settings_service, "get_org_settings", _settings)
+    ctx = deps.TenantContext(org_id="default")
+
+    assert await settings_service.is_mfa_action_required_for_org(None, ctx, "WORKFLOW_COMPLETE")
+    assert not await settings_service.is_mfa_action_required_for_org(None, ctx, "LOAN_SUBMISSION")
+    assert lookups["count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_mfa_policy_read_before_a_change_cannot_repopulate_the_cache(monkeypatch):
+    store: dict[str, str] = {}
+
+    class FakeRedis:
+        async def get(self, key):
+            return store.get(key)
+
+        async def setex(self, key, ttl, value):
+            store[key] = value
+
+        async def incr(self, key):
+            store[key] = str(int(store.get(key, "0")) + 1)
+            return int(store[key])
+
+    current = {"require_two_factor": False}
+
+    async def _settings(db, ctx, create_if_missing=True):
+        return make_org_settings(
+            require_two_factor=current["require_two_factor"],
+            mfa_required_actions=["WORKFLOW_COMPLETE"],
+        )
+
+    monkeypatch.setattr(settings_service, "get_redis_client", lambda: FakeRedis())
+    monkeypatch.setattr(settings_service, "get_org_settings", _settings)
+    ctx = deps.TenantContext(org_id="default")
+
+    # A lookup reads the old policy, then the change commits and invalidates
+    # before that lookup writes its result back.
+    _, stale_key = await settings_service._get_cached_mfa_policy(ctx.org_id)
+    current["require_two_factor"] = True
+    await settings_service.invalidate_mfa_policy_cache(ctx.org_id)
+    await settings_service._set_cached_mfa_policy(
+        stale_key, {"require_two_factor": False, "mfa_required_actions": []}
+    )
+
+    assert await settings_service.is_mfa_action_required_for_org(None, ctx, "WORKFLOW_COMPLETE")
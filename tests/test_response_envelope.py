@@ -0,0 +1,91 @@
+import json
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from starlette.responses import JSONResponse
+
+from app.core.response_envelope import (
+    _build_success_envelope,
+    _build_success_envelope_body,
+    register_response_envelope,
+)
+
+
+def test_spliced_envelope_matches_rendered_envelope():
+    payload = {"items": [{"id": 1, "name": "Zoë"}], "total": 1}
+    body = json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+    spliced = _build_success_envelope_body(body, 201)
+    rendered = JSONResponse(content=_build_success_envelope(payload, 201)).body
+
+    assert spliced == rendered
+
+
+def test_envelope_wraps_list_and_preserves_existing_envelope():
+    app = FastAPI()
+    register_response_envelope(app)
+
+    @app.get("/items")
+    async def _items():
+        return [1, 2, 3]
+
+    @app.get("/wrapped")
+    async def _wrapped():
+        return {"code": "ok", "message": "OK", "data": {"a": 1}, "details": {}}
+
+    client = TestClient(app)
+    assert client.get("/items").json() == {
+        "code": "ok",
+        "message": "OK",
+        "data": [1, 2, 3],
+        "details": {},
+    }
+    assert client.get("/wrapped").json()["data"] == {"a": 1}
+
+
+def test_gzip_compresses_the_enveloped_body():
+    from starlette.middleware.gzip import GZipMiddleware
+
+    app = FastAPI()
+    register_response_envelope(app)
+    app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+    @app.get("/items")
+    async def _items():
+        return [{"id": index, "name": "x" * 20} for index in range(100)]
+
+    resp = TestClient(app).get("/items", headers={"Accept-Encoding": "gzip"})
+    assert resp.headers["content-encoding"] == "gzip"
+    assert resp.json()["data"][99] == {"id": 99, "name": "x" * 20}
+
+
+def test_scoped_gzip_leaves_other_routes_uncompressed():
+    from app.middlewares.compression import ScopedGZipMiddleware
+
+    app = FastAPI()
+    register_response_envelope(app)
+    app.add_middleware(
+        ScopedGZipMiddleware,
+        path_prefixes=("/org/loans",),
+        minimum_size=1024,
+        compresslevel=5,
+    )
+    payload = [{"id": index, "name": "x" * 20} for index in range(100)]
+
+    @app.get("/org/loans/queue")
+    async def _queue():
+        return payload
+
+    @app.get("/auth/me")
+    async def _me():
+        return payload
+
+    @app.post("/org/loans/queue")
+    async def _post_queue():
+        return payload
+
+    client = TestClient(app)
+    headers = {"Accept-Encoding": "gzip"}
+    assert client.get("/org/loans/queue", headers=headers).headers["content-encoding"] == "gzip"
+    assert "content-encoding" not in client.get("/auth/me", headers=headers).headers
+    assert "content-encoding" not in client.post("/org/loans/queue", headers=headers).headers